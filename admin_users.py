@@ -0,0 +1,38 @@
+# AI-Powered Career and Skills Advisor - Admin Users
+# Grants and revokes access to the Debug page (metrics, profiles, job queue).
+# The flag lives in users.is_admin and is only ever set here, by someone with
+# access to the database, never through the signup form.
+#
+# Usage: python admin_users.py {grant,revoke} USERNAME [--db career_advisor.db]
+#        python admin_users.py list [--db career_advisor.db]
+
+import argparse
+import sys
+
+import repository
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grant or revoke Debug page access.")
+    parser.add_argument("action", choices=("grant", "revoke", "list"))
+    parser.add_argument("username", nargs="?", help="an existing user (grant, revoke)")
+    parser.add_argument("--db", help="database file (default: CAREER_ADVISOR_DB or career_advisor.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        repository.set_database(args.db)
+    if args.action == "list":
+        for username in repository.admin_usernames():
+            print(username)
+        return 0
+    if not args.username:
+        parser.error(f"{args.action} needs a USERNAME")
+    if not repository.set_admin(args.username, args.action == "grant"):
+        print(f"no user named {args.username!r}", file=sys.stderr)
+        return 1
+    print(f"{args.action}ed Debug page access for {args.username}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Benchmark: per-rerun cost of building the advisor vs. the shared resource cache.
+
+Usage: python benchmarks/bench_advisor_cache.py [--reruns 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog_store
+import scoring
+from career_engine import CareerAdvisor, get_advisor
+
+
+def per_rerun(label, fn, reruns):
+    start = time.perf_counter()
+    for _ in range(reruns):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / reruns * 1e6:>10.2f} us/rerun")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reruns", type=int, default=20_000)
+    args = parser.parse_args()
+
+    # Uncached: every rerun would read the catalog files and build the advisor
+    def before():
+        CareerAdvisor(catalog=catalog_store.load_catalog())
+
+    def before_compiled():
+        CareerAdvisor(catalog=catalog_store.load_catalog()).compile_catalog()
+
+    def after():
+        advisor = get_advisor()
+        advisor.compile_catalog()
+        return scoring.personality_bank(), scoring.interest_bank()
+
+    get_advisor()
+    per_rerun("before: load catalog + CareerAdvisor()", before, args.reruns // 10)
+    per_rerun("before + compiled catalog", before_compiled, args.reruns // 10)
+    per_rerun("after: get_advisor() cache hit", after, args.reruns)
+
+
+if __name__ == "__main__":
+    main()
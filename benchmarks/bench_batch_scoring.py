@@ -0,0 +1,79 @@
+"""Benchmark: per-user calculate_career_match vs. compiled batch scoring.
+
+Usage: python benchmarks/bench_batch_scoring.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_engine import CareerAdvisor
+
+
+def random_cohort(advisor, n_users, rng):
+    tech = rng.integers(1, 8, size=(n_users, len(advisor.technical_skills))).astype(float)
+    personality = rng.integers(1, 6, size=(n_users, len(advisor.personality_traits), 4)).mean(axis=2)
+    interests = rng.integers(1, 6, size=(n_users, len(advisor.career_interests), 3)).mean(axis=2)
+    return tech, personality, interests
+
+
+def as_dicts(advisor, tech, personality, interests, rows):
+    return (
+        [dict(zip(advisor.technical_skills, tech[i])) for i in rows],
+        [dict(zip(advisor.personality_traits, personality[i])) for i in rows],
+        [dict(zip(advisor.career_interests, interests[i])) for i in rows],
+    )
+
+
+def check_rankings(advisor, catalog, tech, personality, interests, top_k, n_check=2000):
+    rows = range(min(n_check, tech.shape[0]))
+    tech_d, pers_d, int_d = as_dicts(advisor, tech, personality, interests, rows)
+    traits = np.hstack([personality, interests])
+    ranked = catalog.top_k(tech[:len(rows)], traits[:len(rows)], top_k)
+    for i in rows:
+        expected = [r["career"] for r in advisor.calculate_career_match(tech_d[i], pers_d[i], int_d[i])[:top_k]]
+        got = [catalog.careers[j] for j in ranked["indices"][i]]
+        if expected != got:
+            raise AssertionError(f"ranking mismatch for user {i}: {expected} != {got}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--scalar-limit", type=int, default=100_000,
+                        help="skip the per-user loop above this many users")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    advisor = CareerAdvisor()
+    catalog = advisor.compile_catalog()
+
+    print(f"{'users':>10} {'per-user (s)':>14} {'batch (s)':>10} {'speedup':>9}")
+    for n_users in args.sizes:
+        tech, personality, interests = random_cohort(advisor, n_users, rng)
+        check_rankings(advisor, catalog, tech, personality, interests, args.top_k)
+
+        start = time.perf_counter()
+        traits = np.hstack([personality, interests])
+        catalog.top_k(tech, traits, args.top_k)
+        batch = time.perf_counter() - start
+
+        if n_users <= args.scalar_limit:
+            tech_d, pers_d, int_d = as_dicts(advisor, tech, personality, interests, range(n_users))
+            start = time.perf_counter()
+            for i in range(n_users):
+                advisor.calculate_career_match(tech_d[i], pers_d[i], int_d[i])[:args.top_k]
+            scalar = time.perf_counter() - start
+            print(f"{n_users:>10} {scalar:>14.3f} {batch:>10.3f} {scalar / batch:>8.1f}x")
+        else:
+            print(f"{n_users:>10} {'skipped':>14} {batch:>10.3f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
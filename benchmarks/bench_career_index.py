@@ -0,0 +1,78 @@
+"""Benchmark: top-k latency and recall@k of the career index modes on a large catalog.
+
+Builds a synthetic O*NET-scale catalog over the advisor's skills and traits,
+then compares the "tree" and "lsh" indexes with the exact scan.
+
+Usage: python benchmarks/bench_career_index.py [--careers 50000] [--queries 500] [--k 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_engine import INDEX_MODES, LSH_BITS, LSH_TABLES, CareerAdvisor, CareerIndex
+
+
+def synthetic_catalog(advisor, n_careers, rng):
+    traits = advisor.personality_traits + advisor.career_interests
+    catalog = {}
+    for i in range(n_careers):
+        catalog[f"Occupation {i:06d}"] = {
+            "description": f"Synthetic occupation {i}",
+            "key_skills": list(rng.choice(advisor.technical_skills, size=rng.integers(2, 7), replace=False)),
+            "salary_range": "-",
+            "growth_rate": "-",
+            "personality_fit": list(rng.choice(traits, size=rng.integers(1, 4), replace=False)),
+        }
+    return catalog
+
+
+def recall_at_k(exact, approx, k):
+    # Tie-aware: an approximate hit counts if it scores at least the exact k-th best
+    kth = exact["score"][:, k - 1:k]
+    return float(np.mean(approx["score"][:, :k] >= kth - 1e-12))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--tables", type=int, default=LSH_TABLES, help="LSH hash tables")
+    parser.add_argument("--bits", type=int, default=LSH_BITS, help="LSH bits per table")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    advisor = CareerAdvisor(career_paths=synthetic_catalog(CareerAdvisor(), args.careers, rng))
+    catalog = advisor.compile_catalog()
+
+    tech = rng.integers(1, 8, size=(args.queries, len(catalog.skills))).astype(float)
+    traits = rng.integers(4, 21, size=(args.queries, len(catalog.traits))) / 4
+
+    print(f"{args.careers} careers, {args.queries} single-user queries, k={args.k}")
+    print(f"{'mode':<6} {'build s':>8} {'per query ms':>13} {'recall@k':>9}")
+    exact = None
+    for mode in INDEX_MODES:
+        start = time.perf_counter()
+        index = CareerIndex(catalog, mode, n_tables=args.tables, n_bits=args.bits)
+        build = time.perf_counter() - start
+
+        results = []
+        start = time.perf_counter()
+        for u in range(args.queries):
+            results.append(index.top_k(tech[u:u + 1], traits[u:u + 1], args.k))
+        per_query = (time.perf_counter() - start) / args.queries
+        ranked = {key: np.vstack([r[key] for r in results]) for key in results[0]}
+
+        if exact is None:
+            exact = ranked
+        print(f"{mode:<6} {build:>8.2f} {per_query * 1e3:>13.3f} {recall_at_k(exact, ranked, args.k):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: batched inference latency of the trained career model.
+
+Trains on a synthetic cohort labelled by the heuristic, writes the artifact,
+loads it memory-mapped like the app does and times top-k inference at
+several batch sizes. Exits non-zero if p99 per-user latency exceeds the budget.
+
+Usage: python benchmarks/bench_career_model.py [--model logistic_regression] [--budget-ms 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import career_model
+from career_engine import get_advisor
+
+
+def synthetic_training_set(advisor, n_users, rng):
+    catalog = advisor.compile_catalog()
+    tech = rng.integers(1, 8, size=(n_users, len(catalog.skills))).astype(float)
+    personality = rng.integers(4, 21, size=(n_users, len(advisor.personality_traits))) / 4
+    interests = rng.integers(3, 16, size=(n_users, len(advisor.career_interests))) / 3
+    traits = np.hstack([personality, interests])
+    labels = np.array(catalog.careers)[catalog.top_k(tech, traits, 1)["indices"][:, 0]]
+    return np.hstack([tech, personality, interests]), labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="logistic_regression",
+                        choices=["logistic_regression", "random_forest", "knn"])
+    parser.add_argument("--train-rows", type=int, default=20_000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 64, 1024])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--budget-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    from sklearn.preprocessing import StandardScaler
+    import joblib
+
+    rng = np.random.default_rng(11)
+    advisor = get_advisor()
+    X, y = synthetic_training_set(advisor, args.train_rows, rng)
+    scaler = StandardScaler().fit(X)
+    model = career_model.build_estimator(args.model).fit(scaler.transform(X), y)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.joblib")
+        joblib.dump({"model_name": args.model, "catalog_version": advisor.catalog_version,
+                     "features": career_model.feature_names(advisor), "scaler": scaler, "model": model,
+                     "accuracy": float("nan"), "trained_rows": len(y), "trained_at": "benchmark"}, path)
+        start = time.perf_counter()
+        loaded = career_model.CareerModel.load(path)
+        print(f"{args.model}: loaded (mmap) in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+        worst = 0.0
+        print(f"{'batch':>6} {'p50 ms/user':>12} {'p99 ms/user':>12}")
+        for batch in args.batches:
+            samples = []
+            for _ in range(args.iterations):
+                rows = X[rng.integers(0, len(X), size=batch)]
+                start = time.perf_counter()
+                loaded.top_k(rows, 5)
+                samples.append((time.perf_counter() - start) / batch * 1e3)
+            p50, p99 = np.percentile(samples, [50, 99])
+            worst = max(worst, p99)
+            print(f"{batch:>6} {p50:>12.4f} {p99:>12.4f}")
+
+    if worst > args.budget_ms:
+        raise SystemExit(f"p99 {worst:.3f} ms/user exceeds the {args.budget_ms} ms budget")
+    print(f"within the {args.budget_ms} ms/user p99 budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark: catalog load, validation and compile time, and a hot reload under load.
+
+Writes a synthetic catalog with --careers careers (plus the shipped learning
+resources and question banks) to a temporary directory, times a cold
+load_catalog() and compile, then rewrites careers.json as version 2 while
+reader threads call get_advisor() in a loop. Reports how long the new
+version took to appear and the readers' latency while it was compiled.
+
+Usage: python benchmarks/bench_catalog_reload.py [--careers 50000] [--readers 8]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+
+def write_careers(directory, n_careers, version, rng):
+    with open(os.path.join(REPO, "data", "careers.json")) as f:
+        careers = json.load(f)
+    skills = careers["technical_skills"]
+    traits = careers["personality_traits"] + careers["career_interests"]
+    careers["version"] = version
+    careers["career_paths"] = {
+        f"Occupation {i:06d}": {
+            "description": f"Synthetic occupation {i}",
+            "key_skills": rng.choice(skills, size=rng.integers(2, 7), replace=False).tolist(),
+            "salary_range": "$50K - $90K",
+            "growth_rate": "10%",
+            "personality_fit": rng.choice(traits, size=rng.integers(1, 4), replace=False).tolist(),
+        }
+        for i in range(n_careers)
+    }
+    # Written aside and renamed, the way a deploy should publish the file
+    path = os.path.join(directory, "careers.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(careers, f)
+    os.replace(path + ".tmp", path)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=50_000)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("learning_resources.json", "questions.json"):
+            shutil.copy(os.path.join(REPO, "data", name), tmp)
+        size = write_careers(tmp, args.careers, 1, rng)
+
+        # catalog_store reads its settings at import time
+        os.environ["CAREER_CATALOG_DIR"] = tmp
+        os.environ["CAREER_CATALOG_CHECK_SECONDS"] = "0.05"
+        import catalog_store
+        import scoring  # noqa: F401 - registers the question bank compilers
+        from career_engine import get_advisor
+
+        start = time.perf_counter()
+        catalog = catalog_store.load_catalog()
+        loaded = time.perf_counter() - start
+        catalog.compile_all()
+        compiled = time.perf_counter() - start - loaded
+        print(f"{args.careers} careers ({size / 1e6:.1f} MB of JSON), {sorted(catalog_store.COMPILERS)} compiled")
+        print(f"cold: read + validate {loaded * 1000:.0f} ms, compile {compiled * 1000:.0f} ms, "
+              f"total {(loaded + compiled) * 1000:.0f} ms")
+
+        get_advisor()
+        stop = threading.Event()
+        latencies = []
+
+        def reader():
+            samples = []
+            while not stop.is_set():
+                t = time.perf_counter()
+                get_advisor().compile_catalog()
+                samples.append(time.perf_counter() - t)
+                # the rest of a page rerun
+                time.sleep(0.001)
+            latencies.extend(samples)
+
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)
+        write_careers(tmp, args.careers, 2, rng)
+        changed = time.perf_counter()
+        while get_advisor().catalog_version != 2:
+            time.sleep(0.005)
+        swapped = time.perf_counter() - changed
+        time.sleep(0.2)
+        stop.set()
+        for t in threads:
+            t.join()
+
+    samples = np.asarray(latencies) * 1e6
+    print(f"hot reload: version 2 served {swapped * 1000:.0f} ms after the file was replaced "
+          f"(includes up to {catalog_store.CATALOG_CHECK_SECONDS * 1000:.0f} ms until the next mtime check)")
+    print(f"{args.readers} readers, {len(samples)} get_advisor() calls: p50 {np.percentile(samples, 50):.1f} us, "
+          f"p99 {np.percentile(samples, 99):.1f} us, max {samples.max() / 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
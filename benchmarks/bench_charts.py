@@ -0,0 +1,103 @@
+"""Benchmark: chart build time per page, legacy vs graph objects vs cached.
+
+"legacy" is the DataFrame + plotly.express code the pages used before,
+"go" builds the same chart with graph objects and an empty cache, and
+"cached" is a repeat render with the same scores. The JSON serialization
+st.plotly_chart performs on every render is timed separately.
+
+Usage: python benchmarks/bench_charts.py [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import charts
+from career_engine import get_advisor
+
+
+def legacy_skills(technical_scores):
+    skills_df = pd.DataFrame(list(technical_scores.items()), columns=['Skill', 'Proficiency'])
+    fig = px.bar(skills_df.head(10), x='Skill', y='Proficiency', title="Top 10 Technical Skills",
+                 color='Proficiency', color_continuous_scale='viridis')
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+def legacy_personality(personality_scores):
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(r=list(personality_scores.values()), theta=list(personality_scores.keys()),
+                                  fill='toself', name='Your Profile'))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[1, 5])), showlegend=True,
+                      title="Personality Traits Profile")
+    return fig
+
+
+def legacy_interests(interest_scores):
+    interest_df = pd.DataFrame(list(interest_scores.items()), columns=['Interest Type', 'Score'])
+    return px.bar(interest_df, x='Interest Type', y='Score', title="Career Interest Profile (RIASEC)",
+                  color='Score', color_continuous_scale='plasma')
+
+
+def legacy_dashboard(technical_scores):
+    top_skills = dict(sorted(technical_scores.items(), key=lambda x: x[1], reverse=True)[:8])
+    fig = px.bar(x=list(top_skills.keys()), y=list(top_skills.values()), title="Top Skills Proficiency",
+                 labels={'x': 'Skills', 'y': 'Proficiency Level'}, color=list(top_skills.values()),
+                 color_continuous_scale='viridis')
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+def timed_ms(fn, repeat, before=None):
+    samples = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(5)
+    advisor = get_advisor()
+    technical = {skill: int(v) for skill, v in zip(advisor.technical_skills, rng.integers(1, 8, 17))}
+    personality = {trait: float(v) for trait, v in zip(advisor.personality_traits, rng.uniform(1, 5, 5))}
+    interests = {kind: float(v) for kind, v in zip(advisor.career_interests, rng.uniform(1, 5, 6))}
+
+    pages = [
+        ("Skills Assessment", legacy_skills, charts.skills_bar, technical),
+        ("Personality Test", legacy_personality, charts.personality_radar, personality),
+        ("Career Interests", legacy_interests, charts.interest_bar, interests),
+        ("Dashboard", legacy_dashboard, charts.top_skills_bar, technical),
+    ]
+    for _, legacy, build, scores in pages:
+        legacy(scores)
+        build(scores)
+
+    print(f"{'page':<20} {'legacy ms':>10} {'go ms':>8} {'cached ms':>10} {'to_json ms':>11}")
+    for name, legacy, build, scores in pages:
+        legacy_ms = timed_ms(lambda: legacy(scores), args.repeat)
+        go_ms = timed_ms(lambda: build(scores), args.repeat, before=charts.clear_cache)
+        cached_ms = timed_ms(lambda: build(scores), args.repeat)
+        fig = build(scores)
+        json_ms = timed_ms(fig.to_json, args.repeat)
+        print(f"{name:<20} {legacy_ms:>10.2f} {go_ms:>8.2f} {cached_ms:>10.4f} {json_ms:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Benchmark: cohort analytics from the aggregate tables vs computed on the fly.
+
+Seeds goals and assessments, then times the three dashboard reads against
+the equivalent GROUP BY / JSON / vector scans over the base tables and
+checks both give the same numbers. Also reports the write cost the
+aggregates add to save_assessments and add_goal.
+
+Usage: python benchmarks/bench_cohort_stats.py [--assessments 200000] [--goals 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+import score_store
+from career_engine import get_advisor
+from seed_db import seed
+
+
+def ranking(rng, careers):
+    return {"catalog_version": 1,
+            "ranking": [{"career": c, "score": float(s), "tech_match": float(t), "personality_match": float(p)}
+                        for c, s, t, p in zip(careers, *rng.uniform(0, 7, size=(3, len(careers))))]}
+
+
+def on_the_fly(conn):
+    """The three views computed from the base tables."""
+    goals = conn.execute("""SELECT goal_type, COUNT(*), SUM(completion_status = 'Completed'),
+                                1.0 * SUM(completion_status = 'Completed') / COUNT(*)
+                         FROM progress GROUP BY goal_type ORDER BY goal_type""").fetchall()
+    matches = conn.execute("""SELECT ranked.value ->> 'career' AS career, COUNT(*),
+                                  AVG(ranked.value ->> 'score') AS avg_score,
+                                  AVG(ranked.value ->> 'tech_match'), AVG(ranked.value ->> 'personality_match')
+                           FROM assessments, json_each(assessments.recommendations, '$.ranking') AS ranked
+                           GROUP BY 1 ORDER BY avg_score DESC""").fetchall()
+    _, _, scores = score_store.load_score_matrix()
+    skills = score_store.current_layout()["technical_skills"]
+    levels = np.rint(scores[:, :len(skills)]).astype(int)
+    distribution = [(skill, int(level), int(n)) for j, skill in sorted(enumerate(skills), key=lambda s: s[1])
+                    for level, n in zip(*np.unique(levels[:, j], return_counts=True))]
+    return goals, matches, distribution
+
+
+def aggregates():
+    return (repository.cohort_goal_completion(), repository.cohort_career_matches(),
+            repository.cohort_skill_distribution())
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def same(a, b):
+    return len(a) == len(b) and all(
+        len(x) == len(y) and all(abs(p - q) < 1e-6 if isinstance(p, float) else p == q for p, q in zip(x, y))
+        for x, y in zip(a, b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assessments", type=int, default=200_000)
+    parser.add_argument("--goals", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    args = parser.parse_args()
+
+    advisor = get_advisor()
+    rng = np.random.default_rng(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed(path, users=args.users, goals=args.goals, assessments=0)
+        repository.set_database(path)
+
+        careers = list(advisor.career_paths)
+        records = [(int(rng.integers(1, args.users + 1)),
+                    {s: int(v) for s, v in zip(advisor.technical_skills, rng.integers(1, 8, len(advisor.technical_skills)))},
+                    {t: 3.0 for t in advisor.personality_traits}, {i: 3.0 for i in advisor.career_interests},
+                    ranking(rng, careers), None, None) for _ in range(args.assessments)]
+        start = time.perf_counter()
+        for i in range(0, len(records), 5000):
+            repository.save_assessments(records[i:i + 5000])
+        write_seconds = time.perf_counter() - start
+        print(f"save_assessments with aggregates: {len(records) / write_seconds:,.0f} rows/sec")
+
+        start = time.perf_counter()
+        for i in range(1000):
+            repository.add_goal(1, "Certification", f"bench goal {i}", "2026-12-31")
+        print(f"add_goal with triggers: {time.perf_counter() - start:.3f} ms per goal")
+
+        with repository.connection() as conn:
+            fly_seconds, fly = timed(lambda: on_the_fly(conn), 1)
+        agg_seconds, agg = timed(aggregates, 20)
+        agg = [[tuple(row) for row in rows] for rows in agg]
+        ok = all(same(a, [tuple(row) for row in f]) for a, f in zip(agg, fly))
+        print(f"on the fly:      {fly_seconds * 1000:,.1f} ms")
+        print(f"aggregate reads: {agg_seconds * 1000:,.3f} ms ({fly_seconds / agg_seconds:,.0f}x)")
+        print(f"results identical: {ok}")
+        repository.get_pool().close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Load benchmark: per-call sqlite3.connect (+ DDL on every rerun) vs. the pooled repository.
+
+Usage: python benchmarks/bench_db_load.py [--sessions 32] [--requests 200]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+
+
+def legacy_request(path, user_id, i):
+    # What one rerun of progress_tracking_page cost before: init_database()
+    # DDL on its own connection, then a fresh connection for the INSERT
+    conn = sqlite3.connect(path)
+    for statement in repository.MIGRATIONS[0]:
+        conn.execute(statement)
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(path)
+    conn.execute("""INSERT INTO progress
+                 (user_id, goal_type, goal_description, target_date, completion_status, created_at)
+                 VALUES (?, ?, ?, ?, ?, ?)""",
+                 (user_id, "Skill Development", f"goal {i}", "2026-01-01", "In Progress", repository.now()))
+    conn.commit()
+    conn.close()
+
+
+def pooled_request(path, user_id, i):
+    repository.init_database()
+    repository.add_goal(user_id, "Skill Development", f"goal {i}", "2026-01-01")
+
+
+def run(label, request, path, sessions, requests_per_session):
+    latencies = [[] for _ in range(sessions)]
+    errors = [0] * sessions
+
+    def session(n):
+        for i in range(requests_per_session):
+            start = time.perf_counter()
+            try:
+                request(path, n, i)
+            except sqlite3.OperationalError:
+                errors[n] += 1
+            latencies[n].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=session, args=(n,)) for n in range(sessions)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    samples = np.concatenate([np.asarray(l) for l in latencies]) * 1000
+    writes = samples.size - sum(errors)
+    print(f"{label:<8} {writes / elapsed:>12.0f} {np.percentile(samples, 50):>9.2f} "
+          f"{np.percentile(samples, 99):>9.2f} {sum(errors):>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="writes per session")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'':<8} {'writes/sec':>12} {'p50 ms':>9} {'p99 ms':>9} {'locked':>7}")
+
+        legacy_db = os.path.join(tmp, "legacy.db")
+        run("before", legacy_request, legacy_db, args.sessions, args.requests)
+
+        pooled_db = os.path.join(tmp, "pooled.db")
+        repository.set_database(pooled_db)
+        run("after", pooled_request, pooled_db, args.sessions, args.requests)
+        repository.get_pool().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: per-user goal queries before and after the progress indexes.
+
+Seeds a database at schema version 1, times the goal queries, applies the
+pending migrations and times them again. Exits non-zero if the indexed
+query plans still scan the progress table.
+
+Usage: python benchmarks/bench_goal_indexes.py [--goals 1000000] [--users 10000]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+from seed_db import seed
+
+# name -> (builds (sql, params) for a user, index the plan must use)
+QUERIES = {
+    "goal page": (lambda u: repository.goal_page_query(u, 20),
+                  "USING INDEX idx_progress_user_created"),
+    "status page": (lambda u: repository.goal_page_query(u, 20, status="On Hold"),
+                    "USING INDEX idx_progress_user_status_created"),
+}
+
+
+def time_queries(conn, user_ids):
+    results = {}
+    for name, (build, _) in QUERIES.items():
+        start = time.perf_counter()
+        for user_id in user_ids:
+            conn.execute(*build(user_id)).fetchall()
+        results[name] = (time.perf_counter() - start) / len(user_ids) * 1000
+    return results
+
+
+def check_plans(conn):
+    for name, (build, index) in QUERIES.items():
+        plan = repository.explain(conn, *build(1))
+        print(f"  {name}: {' | '.join(plan)}")
+        if not any(index in line for line in plan) or any("TEMP B-TREE" in line for line in plan):
+            raise SystemExit(f"unexpected query plan for {name}: {plan}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--goals", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        start = time.perf_counter()
+        seed(path, users=args.users, goals=args.goals, schema_version=1)
+        print(f"seeded {args.goals} goals for {args.users} users in {time.perf_counter() - start:.1f}s")
+
+        conn = sqlite3.connect(path)
+        user_ids = list(range(1, args.users + 1, max(1, args.users // args.lookups)))[:args.lookups]
+        before = time_queries(conn, user_ids)
+
+        start = time.perf_counter()
+        repository.migrate(conn)
+        print(f"migration to v{repository.SCHEMA_VERSION} took {time.perf_counter() - start:.1f}s")
+        after = time_queries(conn, user_ids)
+
+        print(f"{'query':<14} {'before ms':>10} {'after ms':>10} {'speedup':>9}")
+        for name in QUERIES:
+            print(f"{name:<14} {before[name]:>10.3f} {after[name]:>10.3f} {before[name] / after[name]:>8.0f}x")
+
+        print("query plans:")
+        check_plans(conn)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: triaging goal statuses one by one vs in one bulk update.
+
+"one by one" is the old Update button flow per goal: an UPDATE in its own
+transaction, then a rerun that reloads the goal page. "bulk" is
+update_goal_statuses: one executemany transaction, the page patched in
+memory. Both write one goal_status_history row per change (trigger).
+
+Usage: python benchmarks/bench_goal_updates.py [--goals 2000] [--changes 50] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+
+# The Update button's write before update_goal_statuses
+SINGLE_UPDATE_SQL = "UPDATE progress SET completion_status = ? WHERE id = ?"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--goals", type=int, default=2000)
+    parser.add_argument("--changes", type=int, default=50, help="goals changed per triage")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository.set_database(os.path.join(tmp, "bench.db"))
+        repository.init_database()
+        repository.create_user("counsellor", "pw", "c@example.com")
+        with repository.connection() as conn:
+            conn.executemany("""INSERT INTO progress
+                             (user_id, goal_type, goal_description, target_date, completion_status, created_at)
+                             VALUES (1, ?, ?, '2027-01-01', 'In Progress', ?)""",
+                             [(repository.GOAL_TYPES[i % 4], f"goal {i}", f"2026-01-01 00:00:{i:06d}")
+                              for i in range(args.goals)])
+        goal_ids = [goal["id"] for goal in repository.list_goals_page(1, limit=args.changes)[0]]
+
+        one_by_one, bulk = [], []
+        # Cycle through three statuses so that every write is a real change
+        statuses = repository.GOAL_STATUSES[1:]
+        for i in range(args.repeat):
+            status = statuses[2 * i % 3]
+            start = time.perf_counter()
+            for goal_id in goal_ids:
+                with repository.connection() as conn:
+                    conn.execute(SINGLE_UPDATE_SQL, (status, goal_id))
+                repository.list_goals_page(1, limit=args.changes)
+            one_by_one.append(time.perf_counter() - start)
+
+            status = statuses[(2 * i + 1) % 3]
+            start = time.perf_counter()
+            repository.update_goal_statuses(1, dict.fromkeys(goal_ids, status))
+            bulk.append(time.perf_counter() - start)
+
+        with repository.connection() as conn:
+            history = conn.execute("SELECT COUNT(*) FROM goal_status_history").fetchone()[0]
+        print(f"{args.changes} status changes over {args.goals} goals, median of {args.repeat}")
+        print(f"  one by one  {np.median(one_by_one) * 1000:8.2f} ms")
+        print(f"  bulk        {np.median(bulk) * 1000:8.2f} ms")
+        print(f"  history rows written: {history} (expected {2 * args.repeat * args.changes})")
+        repository.get_pool().close()
+
+
+if __name__ == "__main__":
+    main()
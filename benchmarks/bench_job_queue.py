@@ -0,0 +1,105 @@
+"""Benchmark: job queue throughput, queue depth and latency under a burst.
+
+Several submitter threads enqueue "recommend" jobs with distinct scores as
+fast as they can while the worker pool drains them. Queue depth is sampled
+throughout; jobs refused by backpressure are counted, and queue_stats()
+gives the wait/run percentiles at the end.
+
+Usage: python benchmarks/bench_job_queue.py [--jobs 2000] [--workers 2] [--submitters 4] [--max-queued 500]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--submitters", type=int, default=4)
+    parser.add_argument("--max-queued", type=int, default=500)
+    args = parser.parse_args()
+
+    # job_queue reads its settings at import time
+    os.environ["CAREER_JOB_WORKERS"] = str(args.workers)
+    os.environ["CAREER_MAX_QUEUED_JOBS"] = str(args.max_queued)
+    import job_queue
+    import repository
+    from career_engine import get_advisor
+
+    advisor = get_advisor()
+    rng = np.random.default_rng(9)
+    payloads = [{
+        "user_id": int(u),
+        "technical_skills": dict(zip(advisor.technical_skills, rng.integers(1, 8, len(advisor.technical_skills)).tolist())),
+        "personality_traits": dict(zip(advisor.personality_traits, rng.uniform(1, 5, 5).round(2).tolist())),
+        "career_interests": dict(zip(advisor.career_interests, rng.uniform(1, 5, 6).round(2).tolist())),
+    } for u in rng.integers(1, 1000, args.jobs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository.set_database(os.path.join(tmp, "bench.db"))
+        repository.init_database()
+        job_queue.get_workers()
+
+        rejected = [0]
+        depths = []
+        submitting = threading.Event()
+        submitting.set()
+
+        def submitter(chunk):
+            for payload in chunk:
+                while True:
+                    try:
+                        job_queue.submit("recommend", payload)
+                        break
+                    except job_queue.QueueFull:
+                        rejected[0] += 1
+                        time.sleep(0.01)
+
+        def sampler():
+            while submitting.is_set() or depths[-1] > 0:
+                with repository.connection() as conn:
+                    depths.append(conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0])
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=submitter, args=(payloads[i::args.submitters],))
+                   for i in range(args.submitters)]
+        start = time.perf_counter()
+        depths.append(0)
+        watcher = threading.Thread(target=sampler)
+        watcher.start()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        submitted = time.perf_counter() - start
+        submitting.clear()
+        while job_queue.queue_stats()["depth"]["done"] < args.jobs:
+            time.sleep(0.05)
+        drained = time.perf_counter() - start
+        watcher.join()
+
+        stats = job_queue.queue_stats()
+        job_queue.get_workers().stop()
+        repository.get_pool().close()
+
+    recommend = stats["kinds"]["recommend"]
+    print(f"{args.jobs} jobs, {args.workers} workers, {args.submitters} submitters, max queued {args.max_queued}")
+    print(f"submitted in {submitted:.2f}s, drained in {drained:.2f}s - {args.jobs / drained:,.0f} jobs/sec")
+    print(f"queue depth: max {max(depths)}, mean {np.mean(depths):.0f}; {rejected[0]} submits refused by backpressure")
+    print(f"wait p50 {recommend['wait_p50_ms']:.1f} ms, p95 {recommend['wait_p95_ms']:.1f} ms (last {job_queue.STATS_WINDOW})")
+    print(f"run  p50 {recommend['run_p50_ms']:.2f} ms, p95 {recommend['run_p95_ms']:.2f} ms")
+    print(f"final depth {stats['depth']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark: skill-gap resource lookup, inverted index vs scanning the resource list.
+
+Builds a synthetic library of --resources courses, certifications and
+projects tagged with skills, levels and ratings, then times the top
+resources for a user's five weakest skills through ResourceIndex and
+through a filter-and-sort scan of the list. Also times a full
+learning_path() (gap ordering by expected match-score gain included) on
+the shipped catalog.
+
+Usage: python benchmarks/bench_learning_paths.py [--resources 50000] [--repeat 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog_store
+from career_engine import get_advisor
+from learning_paths import RESOURCES_PER_KIND, ResourceIndex, learning_path, proficiency_band
+
+
+def synthetic_resources(skills, n_resources, rng):
+    resources = []
+    for i in range(n_resources):
+        levels = catalog_store.RESOURCE_LEVELS
+        first = int(rng.integers(0, len(levels)))
+        resources.append({
+            "title": f"Resource {i:06d}",
+            "kind": catalog_store.RESOURCE_KINDS[i % len(catalog_store.RESOURCE_KINDS)],
+            "skills": rng.choice(skills, size=rng.integers(1, 4), replace=False).tolist(),
+            "levels": list(levels[first:first + int(rng.integers(1, 3))]),
+            "rating": round(float(rng.uniform(3, 5)), 1),
+        })
+    return resources
+
+
+def scan(resources, skill, score):
+    # What the page would do without the index
+    band = proficiency_band(score)
+    matches = sorted((r for r in resources if skill in r["skills"] and band in r["levels"]),
+                     key=lambda r: -r["rating"])
+    by_kind = {}
+    for resource in matches:
+        by_kind.setdefault(resource["kind"], [])
+        if len(by_kind[resource["kind"]]) < RESOURCES_PER_KIND:
+            by_kind[resource["kind"]].append(resource)
+    return by_kind
+
+
+def timed_us(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resources", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    advisor = get_advisor()
+    rng = np.random.default_rng(13)
+    resources = synthetic_resources(advisor.technical_skills, args.resources, rng)
+    technical = {skill: int(v) for skill, v in zip(advisor.technical_skills, rng.integers(1, 8, 17))}
+    weakest = sorted(technical.items(), key=lambda item: item[1])[:5]
+
+    start = time.perf_counter()
+    index = ResourceIndex(resources)
+    build = time.perf_counter() - start
+
+    for skill, score in weakest:
+        fast = {kind: [r["title"] for r in items] for kind, items in index.top(skill, score).items()}
+        slow = {kind: [r["title"] for r in items] for kind, items in scan(resources, skill, score).items()}
+        assert fast == slow, (skill, fast, slow)
+
+    indexed = timed_us(lambda: [index.top(skill, score) for skill, score in weakest], args.repeat)
+    scanned = timed_us(lambda: [scan(resources, skill, score) for skill, score in weakest], max(args.repeat // 200, 3))
+    print(f"{args.resources} resources, {len(index)} (skill, band) postings, index built in {build * 1000:.0f} ms")
+    print(f"top {RESOURCES_PER_KIND} per kind for the 5 weakest skills: index {indexed:.1f} us, "
+          f"scan {scanned / 1000:.1f} ms ({scanned / indexed:,.0f}x)")
+
+    personality = {trait: 3.5 for trait in advisor.personality_traits}
+    interests = {interest: 3.0 for interest in advisor.career_interests}
+    path = timed_us(lambda: learning_path(technical, personality, interests), args.repeat)
+    print(f"learning_path() on the shipped catalog ({len(advisor.career_paths)} careers): {path:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Benchmark: login throughput and tail latency at a chosen hashing cost.
+
+Creates users hashed with the configured hasher, then runs a burst of
+concurrent logins through repository.verify_user for a fixed time while
+another thread keeps issuing a cheap page query, to show how much the
+bounded hashing pool leaves for other sessions.
+
+Usage: python benchmarks/bench_login.py [--hasher scrypt] [--scrypt-n 16384]
+       [--pbkdf2-iterations 600000] [--workers 2] [--clients 16] [--seconds 10]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hasher", default="scrypt", choices=["scrypt", "pbkdf2_sha256"])
+    parser.add_argument("--scrypt-n", type=int, default=2 ** 14)
+    parser.add_argument("--pbkdf2-iterations", type=int, default=600_000)
+    parser.add_argument("--workers", type=int, default=None, help="hashing pool size (default: module default)")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent login threads")
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    # The passwords module reads its settings at import time
+    os.environ["CAREER_PASSWORD_HASHER"] = args.hasher
+    os.environ["CAREER_SCRYPT_N"] = str(args.scrypt_n)
+    os.environ["CAREER_PBKDF2_ITERATIONS"] = str(args.pbkdf2_iterations)
+    if args.workers:
+        os.environ["CAREER_HASH_WORKERS"] = str(args.workers)
+    import passwords
+    import repository
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository.set_database(os.path.join(tmp, "bench.db"))
+        repository.init_database()
+        for u in range(args.users):
+            repository.create_user(f"user{u}", f"password{u}", f"user{u}@example.com")
+        print(f"{args.hasher} cost {args.scrypt_n if args.hasher == 'scrypt' else args.pbkdf2_iterations}, "
+              f"{passwords.HASH_WORKERS} hashing workers, {args.clients} clients, {os.cpu_count()} CPUs")
+
+        stop = time.perf_counter() + args.seconds
+        logins, busy, page_queries = [], [0], []
+
+        def client(i):
+            latencies = []
+            while time.perf_counter() < stop:
+                u = (i * 7 + len(latencies)) % args.users
+                start = time.perf_counter()
+                try:
+                    assert repository.verify_user(f"user{u}", f"password{u}") is not None
+                except passwords.HasherBusy:
+                    busy[0] += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+            logins.append(latencies)
+
+        def other_session():
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                repository.user_stats(1)
+                page_queries.append(time.perf_counter() - start)
+                time.sleep(0.005)
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+        threads.append(threading.Thread(target=other_session))
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        repository.get_pool().close()
+
+    samples = np.concatenate([np.asarray(l) for l in logins]) * 1000
+    pages = np.asarray(page_queries) * 1000
+    print(f"logins:        {len(samples) / elapsed:,.1f}/sec, p50 {np.percentile(samples, 50):.1f} ms, "
+          f"p99 {np.percentile(samples, 99):.1f} ms, {busy[0]} rejected as busy")
+    print(f"other session: p50 {np.percentile(pages, 50):.2f} ms, p99 {np.percentile(pages, 99):.2f} ms "
+          f"over {len(pages)} queries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
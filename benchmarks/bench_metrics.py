@@ -0,0 +1,106 @@
+"""Benchmark: instrumentation overhead, enabled vs disabled.
+
+Times an empty span, a timed() function call, a point query through a
+TimedConnection vs a plain sqlite3 connection, and calculate_career_match
+with and without its engine.* span, then checks the percentiles the
+histograms report against the exact ones on a known distribution.
+
+Usage: python benchmarks/bench_metrics.py [--calls 200000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics
+import repository
+from career_engine import get_advisor
+
+
+def per_call_ns(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def span_overhead(calls):
+    def empty():
+        with metrics.span("bench.empty"):
+            pass
+
+    def noop():
+        pass
+
+    results = {}
+    for enabled in (False, True):
+        metrics.ENABLED = enabled
+        wrapped = metrics.timed("bench.timed")(noop)
+        results[enabled] = (per_call_ns(empty, calls), per_call_ns(wrapped, calls))
+    bare = per_call_ns(noop, calls)
+    print(f"empty span:    disabled {results[False][0]:6.0f} ns   enabled {results[True][0]:6.0f} ns")
+    print(f"timed() call:  disabled {results[False][1]:6.0f} ns   enabled {results[True][1]:6.0f} ns"
+          f"   (bare call {bare:.0f} ns)")
+
+
+def query_overhead(calls):
+    timings = {}
+    for factory in (sqlite3.Connection, repository.TimedConnection):
+        conn = sqlite3.connect(":memory:", factory=factory, cached_statements=256)
+        conn.execute("CREATE TABLE progress (id INTEGER PRIMARY KEY, user_id INTEGER, goal_type TEXT)")
+        conn.executemany("INSERT INTO progress (user_id, goal_type) VALUES (?, ?)",
+                         [(i % 100, "skill") for i in range(10_000)])
+        timings[factory.__name__] = per_call_ns(
+            lambda: conn.execute("SELECT goal_type FROM progress WHERE id = ?", (4242,)).fetchone(), calls)
+        conn.close()
+    plain, timed = timings["Connection"], timings["TimedConnection"]
+    print(f"point query:   plain {plain / 1000:6.2f} us   timed {timed / 1000:6.2f} us   (+{(timed - plain) / 1000:.2f} us)")
+
+
+def engine_overhead(calls):
+    advisor = get_advisor()
+    rng = random.Random(3)
+    technical = {skill: rng.randint(1, 7) for skill in advisor.technical_skills}
+    personality = {trait: rng.uniform(1, 5) for trait in advisor.personality_traits}
+    interests = {interest: rng.uniform(1, 5) for interest in advisor.career_interests}
+    bare = type(advisor).calculate_career_match.__wrapped__
+    plain = per_call_ns(lambda: bare(advisor, technical, personality, interests), calls)
+    timed = per_call_ns(lambda: advisor.calculate_career_match(technical, personality, interests), calls)
+    print(f"calculate_career_match: bare {plain / 1000:6.2f} us   timed {timed / 1000:6.2f} us")
+
+
+def percentile_accuracy(samples=100_000):
+    metrics.reset()
+    rng = random.Random(11)
+    values = sorted(rng.lognormvariate(-7, 1) for _ in range(samples))
+    for value in values:
+        metrics.record("bench.accuracy", value)
+    stats = metrics.snapshot()["bench.accuracy"]
+    for q in (50, 95, 99):
+        exact = values[int(q / 100 * samples) - 1] * 1000
+        print(f"p{q}: histogram {stats[f'p{q}_ms']:.4f} ms   exact {exact:.4f} ms"
+              f"   ({stats[f'p{q}_ms'] / exact - 1:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+    if not metrics.ENABLED:
+        print("run without CAREER_METRICS=0: the enabled cases need the instrumented classes")
+        return 1
+
+    span_overhead(args.calls)
+    query_overhead(args.calls // 4)
+    engine_overhead(args.calls // 100)
+    percentile_accuracy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark: cohort load from JSON score columns vs packed float32 vectors.
+
+Seeds a database with legacy JSON assessments, times migration 5 packing
+them into score vectors, then loads the whole cohort into an N x features
+matrix both ways and checks the two matrices agree.
+
+Usage: python benchmarks/bench_score_storage.py [--assessments 1000000] [--users 10000]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+import score_store
+from seed_db import seed
+
+
+def load_json_matrix(path, layout):
+    """The pre-migration path: parse three JSON blobs per row."""
+    conn = sqlite3.connect(path)
+    rows = []
+    for technical, personality, interests in conn.execute(
+            "SELECT technical_skills, personality_traits, career_interests FROM assessments"):
+        technical, personality, interests = json.loads(technical), json.loads(personality), json.loads(interests)
+        rows.append([technical.get(s, np.nan) for s in layout["technical_skills"]]
+                    + [personality.get(t, np.nan) for t in layout["personality_traits"]]
+                    + [interests.get(i, np.nan) for i in layout["career_interests"]])
+    conn.close()
+    return np.array(rows, dtype=score_store.SCORE_DTYPE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assessments", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        start = time.perf_counter()
+        seed(path, users=args.users, goals=0, assessments=args.assessments, schema_version=4)
+        print(f"seeded {args.assessments:,} JSON assessments in {time.perf_counter() - start:.1f}s")
+
+        conn = sqlite3.connect(path)
+        start = time.perf_counter()
+        repository.migrate(conn)
+        print(f"migrations 5-6 (vector backfill, aggregates): {time.perf_counter() - start:.1f}s")
+        json_bytes, vector_bytes = conn.execute(
+            """SELECT sum(length(technical_skills) + length(personality_traits) + length(career_interests)),
+                      sum(length(score_vector)) FROM assessments""").fetchone()
+        conn.close()
+        print(f"score payload: JSON {json_bytes / 1e6:,.1f} MB, vectors {vector_bytes / 1e6:,.1f} MB")
+
+        repository.set_database(path)
+        layout = score_store.current_layout()
+
+        start = time.perf_counter()
+        from_json = load_json_matrix(path, layout)
+        json_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, _, from_vectors = score_store.load_score_matrix()
+        vector_seconds = time.perf_counter() - start
+
+        ok = np.array_equal(from_json, from_vectors, equal_nan=True)
+        print(f"JSON cohort load:   {json_seconds:.2f}s")
+        print(f"vector cohort load: {vector_seconds:.2f}s ({json_seconds / vector_seconds:.1f}x)")
+        print(f"matrices identical: {ok}")
+        repository.get_pool().close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
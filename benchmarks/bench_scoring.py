@@ -0,0 +1,70 @@
+"""Benchmark: per-question substring scoring (old page code) vs. the scoring module.
+
+Usage: python benchmarks/bench_scoring.py [--users 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scoring
+
+
+def legacy_personality(answers):
+    # The loop personality_assessment_page ran before the scoring module
+    personality_scores = {}
+    it = iter(answers)
+    for trait, questions in scoring.personality_bank().grouped.items():
+        trait_scores = []
+        for question in questions:
+            score = next(it)
+            if "prefer routine" in question or "prefer working alone" in question or "get stressed easily" in question or "worry about" in question:
+                score = 6 - score
+            trait_scores.append(score)
+        personality_scores[trait] = np.mean(trait_scores)
+    return personality_scores
+
+
+def timed(label, fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"{label:<44} {per_call * 1e6:>12.2f} us")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    one = rng.integers(1, 6, size=len(scoring.personality_bank())).tolist()
+    cohort = rng.integers(1, 6, size=(args.users, len(scoring.personality_bank())))
+
+    print("single respondent")
+    timed("  legacy substring loop + np.mean", lambda: legacy_personality(one), args.repeat)
+    bank = scoring.personality_bank()
+    timed("  QuestionBank.profile", lambda: bank.profile(one), args.repeat)
+
+    print(f"cohort of {args.users}")
+    start = time.perf_counter()
+    for row in cohort[:10_000].tolist():
+        legacy_personality(row)
+    legacy = (time.perf_counter() - start) / min(args.users, 10_000) * args.users
+    print(f"{'  legacy loop (extrapolated)':<44} {legacy * 1e3:>12.2f} ms")
+    start = time.perf_counter()
+    scoring.score_personality(cohort)
+    scoring.score_interests(rng.integers(1, 6, size=(args.users, len(scoring.interest_bank()))))
+    print(f"{'  score_personality + score_interests':<44} {(time.perf_counter() - start) * 1e3:>12.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
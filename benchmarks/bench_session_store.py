@@ -0,0 +1,98 @@
+"""Benchmark: write-behind session store vs a synchronous write per rerun.
+
+Simulates users moving sliders: every rerun hands the whole user_data to
+the store. Reports put() latency, how many rows actually reached the
+database, and the same load written synchronously for comparison. Also
+checks that every user's final state is what the database holds after
+close().
+
+Usage: python benchmarks/bench_session_store.py [--users 200] [--reruns 50]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+import session_store
+from career_engine import get_advisor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--reruns", type=int, default=50, help="slider moves per user")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--pause-ms", type=float, default=20.0, help="think time between reruns")
+    args = parser.parse_args()
+
+    skills = get_advisor().technical_skills
+    with tempfile.TemporaryDirectory() as tmp:
+        repository.set_database(os.path.join(tmp, "bench.db"))
+        repository.init_database()
+
+        writes = [0]
+        save = repository.save_user_sessions
+
+        def counting_save(rows):
+            rows = list(rows)
+            writes[0] += len(rows)
+            save(rows)
+
+        repository.save_user_sessions = counting_save
+        store = session_store.SessionStore(debounce=0.2, max_delay=1.0, interval=0.1)
+        final = {}
+        latencies = []
+
+        def user_thread(user_ids):
+            rng = random.Random(user_ids[0])
+            for _ in range(args.reruns):
+                for user_id in user_ids:
+                    data = final.setdefault(user_id, {"name": f"user{user_id}", "technical_skills": {}})
+                    data["technical_skills"][rng.choice(skills)] = rng.randint(1, 7)
+                    start = time.perf_counter()
+                    store.put(user_id, data)
+                    latencies.append(time.perf_counter() - start)
+                time.sleep(args.pause_ms / 1000)
+
+        groups = [list(range(i, args.users, args.threads)) for i in range(args.threads)]
+        threads = [threading.Thread(target=user_thread, args=(group,)) for group in groups]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        store.close()
+        elapsed = time.perf_counter() - start
+
+        puts = args.users * args.reruns
+        samples = np.asarray(latencies) * 1e6
+        print(f"write-behind: {puts} puts in {elapsed:.2f}s, put p50 {np.percentile(samples, 50):.0f} us, "
+              f"p99 {np.percentile(samples, 99):.0f} us, {writes[0]} rows written "
+              f"({puts / max(writes[0], 1):.1f} puts per write)")
+
+        ok = all(json.loads(repository.load_user_session(u)) == json.loads(session_store.encode(d))
+                 for u, d in final.items())
+        print(f"database matches final state: {ok}")
+
+        start = time.perf_counter()
+        for user_id, data in final.items():
+            for _ in range(args.reruns):
+                save([(user_id, session_store.encode(data))])
+        sync = (time.perf_counter() - start) / puts * 1e6
+        print(f"synchronous:  {sync:.0f} us per rerun, {puts} rows written")
+        repository.get_pool().close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
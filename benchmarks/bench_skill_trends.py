@@ -0,0 +1,114 @@
+"""Benchmark: one skill's trend by decoding past assessments vs the rollups.
+
+"scan" reads every assessment of the user, unpacks the score vectors and
+averages the skill per month in Python, which is what a trend chart would
+cost without the time series. "history" and "trend" are skill_history and
+skill_trend, a primary key range each; "cohort" is cohort_skill_trend.
+Also reports what the skill_scores rows and rollup upserts add to
+save_assessments.
+
+Usage: python benchmarks/bench_skill_trends.py [--users 200] [--assessments 100] [--repeat 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+import score_store
+from career_engine import get_advisor
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1e6
+
+
+def scan_trend(user_id, skill):
+    layout = score_store.current_layout()
+    months = defaultdict(list)
+    with repository.connection() as conn:
+        for created_at, blob in conn.execute("SELECT created_at, score_vector FROM assessments WHERE user_id = ?",
+                                             (user_id,)):
+            score = score_store.unpack_scores(layout, blob)[0].get(skill)
+            if score is not None:
+                months[created_at[:7] + "-01"].append(score)
+    return [(month, len(scores), sum(scores) / len(scores)) for month, scores in sorted(months.items())]
+
+
+def records(advisor, users, per_user, rng):
+    base = datetime(2024, 1, 1)
+    for user_id in range(1, users + 1):
+        for _ in range(per_user):
+            assessed_at = base + timedelta(minutes=rng.randrange(2 * 365 * 24 * 60))
+            yield (user_id, {skill: rng.randint(1, 7) for skill in advisor.technical_skills},
+                   {trait: 3.0 for trait in advisor.personality_traits},
+                   {interest: 3.0 for interest in advisor.career_interests},
+                   {"ranking": []}, None, assessed_at.strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--assessments", type=int, default=100, help="assessments per user")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    advisor = get_advisor()
+    rng = random.Random(9)
+    data = list(records(advisor, args.users, args.assessments, rng))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The same assessments into a database without the time series
+        # rows and rollups, then into the one the reads run against
+        saves = {}
+        for name in ("without", "with"):
+            repository.set_database(os.path.join(tmp, f"{name}.db"))
+            repository.init_database()
+            add_skill_scores = score_store.add_skill_scores
+            if name == "without":
+                score_store.add_skill_scores = lambda *args: None
+            start = time.perf_counter()
+            for i in range(0, len(data), 100):
+                repository.save_assessments(data[i:i + 100])
+            saves[name] = time.perf_counter() - start
+            score_store.add_skill_scores = add_skill_scores
+
+        skill = advisor.technical_skills[0]
+        user_ids = iter([rng.randint(1, args.users) for _ in range(args.repeat)] * 4)
+        scan_us = median_us(lambda: scan_trend(next(user_ids), skill), args.repeat)
+        history_us = median_us(lambda: repository.skill_history(next(user_ids), skill), args.repeat)
+        trend_us = median_us(lambda: repository.skill_trend(next(user_ids), skill), args.repeat)
+        cohort_us = median_us(lambda: repository.cohort_skill_trend(skill), args.repeat)
+
+        check = rng.randint(1, args.users)
+        expected = scan_trend(check, skill)
+        actual = repository.skill_trend(check, skill)
+        assert [row[:2] for row in expected] == [tuple(row[:2]) for row in actual]
+        assert np.allclose([row[2] for row in expected], [row[2] for row in actual])
+
+        print(f"{args.users} users x {args.assessments} assessments, monthly trend of one skill")
+        print(f"  scan + decode assessments  {scan_us:8.1f} us")
+        print(f"  skill_history              {history_us:8.1f} us")
+        print(f"  skill_trend                {trend_us:8.1f} us")
+        print(f"  cohort_skill_trend         {cohort_us:8.1f} us")
+        print(f"  saving {len(data)} assessments: {saves['with'] * 1000:.0f} ms with the time series, "
+              f"{saves['without'] * 1000:.0f} ms without")
+        repository.get_pool().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: dashboard counters from live COUNT(*) queries vs user_stats.
+
+"live" counts a user's active, completed and on-hold goals and their
+assessments with COUNT(*) over the indexed base tables; "user_stats" is
+the single primary key lookup the dashboard now does. Also reports what
+the counter triggers add to goal inserts.
+
+Usage: python benchmarks/bench_user_stats.py [--users 200] [--goals 500] [--repeat 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+
+LIVE_SQL = (
+    "SELECT COUNT(*) FROM progress WHERE user_id = ? AND completion_status = 'In Progress'",
+    "SELECT COUNT(*) FROM progress WHERE user_id = ? AND completion_status = 'Completed'",
+    "SELECT COUNT(*) FROM progress WHERE user_id = ? AND completion_status = 'On Hold'",
+    "SELECT COUNT(*) FROM assessments WHERE user_id = ?",
+)
+
+GOAL_SQL = """INSERT INTO progress (user_id, goal_type, goal_description, target_date, completion_status, created_at)
+              VALUES (?, 'Certification', 'goal', '2027-01-01', ?, ?)"""
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--goals", type=int, default=500, help="goals per user")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    rows = [(user_id, rng.choice(repository.GOAL_STATUSES), f"2026-01-01 00:00:{i:09d}")
+            for i, user_id in enumerate(rng.randint(1, args.users) for _ in range(args.users * args.goals))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The same goals into a database without the counter trigger, then
+        # into the one the reads run against
+        inserts = {}
+        for name in ("without", "with"):
+            repository.set_database(os.path.join(tmp, f"{name}.db"))
+            repository.init_database()
+            with repository.connection() as conn:
+                if name == "without":
+                    conn.execute("DROP TRIGGER user_stats_goal_insert")
+                start = time.perf_counter()
+                conn.executemany(GOAL_SQL, rows)
+            inserts[name] = time.perf_counter() - start
+
+        user_ids = [rng.randint(1, args.users) for _ in range(args.repeat)]
+        users = iter(user_ids * 2)
+
+        def live():
+            user_id = next(users)
+            with repository.connection() as conn:
+                return [conn.execute(sql, (user_id,)).fetchone()[0] for sql in LIVE_SQL]
+
+        live_us = median_us(live, args.repeat)
+        stats_us = median_us(lambda: repository.user_stats(next(users)), args.repeat)
+
+        check = user_ids[0]
+        with repository.connection() as conn:
+            counts = [conn.execute(sql, (check,)).fetchone()[0] for sql in LIVE_SQL]
+        stats = repository.user_stats(check)
+        assert counts == [stats["active_goals"], stats["completed_goals"], stats["on_hold_goals"], stats["assessments"]]
+
+        print(f"{args.users} users x {args.goals} goals")
+        print(f"  dashboard counters, live COUNT(*)  {live_us:8.1f} us")
+        print(f"  dashboard counters, user_stats     {stats_us:8.1f} us")
+        print(f"  inserting {len(rows)} goals: {inserts['with'] * 1000:.0f} ms with the counter trigger, "
+              f"{inserts['without'] * 1000:.0f} ms without")
+        repository.get_pool().close()
+
+
+if __name__ == "__main__":
+    main()
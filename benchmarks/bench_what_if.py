@@ -0,0 +1,90 @@
+"""Benchmark: what-if scenario ranking, incremental deltas vs rescoring.
+
+Ranks the single-skill grid plus every two-skill combination of levels for
+one user. "incremental" is WhatIf.rank(); "batch rescore" encodes each
+scenario's full score vector and runs CompiledCatalog.top_k; "loop" is one
+calculate_career_match call per scenario (extrapolated from a sample).
+Repeated on a synthetic catalog with --careers careers.
+
+Usage: python benchmarks/bench_what_if.py [--careers 50000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_career_index import synthetic_catalog
+from career_engine import CareerAdvisor, get_advisor
+from what_if import WhatIf, multi_skill_grid, single_skill_grid
+
+
+def timed_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1000
+
+
+def run(advisor, technical, personality, interests, scenarios, repeat, label):
+    catalog = advisor.compile_catalog()
+    simulator = WhatIf(technical, personality, interests, advisor)
+
+    def rescore():
+        rows = [dict(technical, **scenario) for scenario in scenarios]
+        tech, traits = catalog.encode_users(rows, [personality] * len(rows), [interests] * len(rows))
+        return catalog.top_k(tech, traits, 5)
+
+    # Same careers in the same order; scores only to rounding, since the
+    # batched rescore sums the personality match in a different order
+    fast, full = simulator.rank(scenarios), rescore()
+    assert np.array_equal(fast["indices"], full["indices"])
+    assert np.allclose(fast["score"], full["score"], rtol=0, atol=1e-12)
+
+    sample = scenarios[:max(1, min(len(scenarios), 20_000 // len(catalog.careers)))]
+    start = time.perf_counter()
+    for scenario in sample:
+        advisor.calculate_career_match(dict(technical, **scenario), personality, interests)
+    loop = (time.perf_counter() - start) / len(sample) * len(scenarios) * 1000
+
+    incremental = timed_ms(lambda: simulator.rank(scenarios), repeat)
+    batch = timed_ms(rescore, repeat)
+    single = timed_ms(lambda: simulator.rank(scenarios[:1]), repeat * 10)
+    print(f"{label}: {len(scenarios)} scenarios")
+    print(f"  incremental {incremental:9.2f} ms  ({incremental / len(scenarios) * 1000:.2f} us/scenario)")
+    print(f"  batch rescore {batch:7.2f} ms")
+    print(f"  loop        {loop:9.0f} ms (extrapolated)")
+    print(f"  one scenario (a slider move) {single:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--careers", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(17)
+    advisor = get_advisor()
+    skills = advisor.technical_skills
+    technical = {skill: int(v) for skill, v in zip(skills, rng.integers(1, 8, len(skills)))}
+    personality = {trait: float(v) for trait, v in zip(advisor.personality_traits, rng.integers(4, 21, 5) / 4)}
+    interests = {interest: float(v) for interest, v in zip(advisor.career_interests, rng.integers(3, 16, 6) / 3)}
+
+    scenarios = single_skill_grid(technical) + multi_skill_grid(technical, skills)
+    run(advisor, technical, personality, interests, scenarios, args.repeat,
+        f"shipped catalog ({len(advisor.career_paths)} careers)")
+
+    large = CareerAdvisor(career_paths=synthetic_catalog(advisor, args.careers, rng))
+    run(large, technical, personality, interests, scenarios[:1000], max(args.repeat // 4, 3),
+        f"synthetic catalog ({args.careers} careers)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Import-time profile of the login screen, with a budget check.
+
+Runs main_app.py under `python -X importtime` (Streamlit bare mode renders
+the login form) and subtracts the imports of a streamlit-only script that
+draws the same widgets, leaving what the app itself adds to a cold start.
+Exits non-zero if that exceeds the budget or if a heavy dependency is
+imported before anyone has logged in.
+
+Usage: python benchmarks/import_time.py [--budget-ms 60] [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must never be loaded by the app just to show the login form (streamlit
+# itself may already have pulled some of them in)
+HEAVY_MODULES = ("pandas", "plotly", "numpy", "sklearn", "scipy", "pyarrow", "joblib")
+
+# The login form drawn with streamlit alone
+BASELINE_SCRIPT = """
+import streamlit as st
+st.set_page_config(page_title="baseline", layout="wide", initial_sidebar_state="expanded")
+st.title("baseline")
+st.markdown("---")
+tab1, tab2 = st.tabs(["Login", "Register"])
+with tab1:
+    st.subheader("Login")
+    st.text_input("Username", key="u")
+    st.text_input("Password", type="password", key="p")
+    st.button("Login")
+"""
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def importtime(args, env):
+    """Run python -X importtime args; return [(module, self_us, cumulative_us, depth)]."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def best_of(runs, args, env):
+    """Per-module minimum self time over several runs, to damp scheduler noise."""
+    best = {}
+    for _ in range(runs):
+        for module, self_us, cumulative_us, depth in importtime(args, env):
+            previous = best.get(module)
+            if previous is None or self_us < previous[0]:
+                best[module] = (self_us, cumulative_us, depth)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=60.0,
+                        help="import time the app may add on top of streamlit")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, CAREER_ADVISOR_DB=os.path.join(tmp, "import_time.db"))
+        # One untimed run creates and migrates the database, so the timed
+        # runs see the steady state of an already deployed app
+        importtime(["main_app.py"], env)
+
+        baseline_path = os.path.join(tmp, "baseline.py")
+        with open(baseline_path, "w") as f:
+            f.write(BASELINE_SCRIPT)
+        baseline = best_of(args.runs, [baseline_path], env)
+        login = best_of(args.runs, ["main_app.py"], env)
+
+    added = {module: timing for module, timing in login.items() if module not in baseline}
+    added_ms = sum(self_us for self_us, _, _ in added.values()) / 1000
+    heavy = sorted(module for module in added if module.split(".")[0] in HEAVY_MODULES)
+
+    print(f"streamlit baseline: {len(baseline)} modules, "
+          f"{sum(t[0] for t in baseline.values()) / 1000:.1f} ms")
+    print(f"login screen adds:  {len(added)} modules, {added_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print()
+    print(f"{'module':<40} {'self ms':>8} {'cumul ms':>9}")
+    for module, (self_us, cumulative_us, _) in sorted(added.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{module:<40} {self_us / 1000:>8.2f} {cumulative_us / 1000:>9.2f}")
+
+    failed = False
+    if heavy:
+        print(f"\nFAIL: heavy modules imported by the login screen: {', '.join(heavy[:10])}")
+        failed = True
+    if added_ms > args.budget_ms:
+        print(f"\nFAIL: login screen imports take {added_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
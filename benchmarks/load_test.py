@@ -0,0 +1,551 @@
+"""Load test: concurrent simulated users running the whole app flow.
+
+Each simulated session walks one user journey after another against a
+temporary database: register -> login -> skills, personality and interest
+assessments -> recommendations -> save -> add goals -> update goals ->
+dashboard.
+
+--driver functions (default) makes the calls the pages make, in the same
+order and with the same session store writes, without Streamlit;
+--driver apptest clicks through main_app.py with Streamlit's AppTest, so
+it also pays for script reruns and widget handling (much slower).
+
+Reports journeys/sec, per-step latency percentiles, "database is locked"
+errors (raised to a step, or behind a retried or failed job) and, for the
+functions driver, the db.*/engine.*/job.* spans from the metrics module
+(apptest sessions run in their own processes), and writes everything as JSON
+(default load_test-<commit>.json) for comparing commits:
+
+  python benchmarks/load_test.py --sessions 16 --journeys 5
+  python benchmarks/load_test.py --compare load_test-<older commit>.json
+
+Usage: python benchmarks/load_test.py [--sessions 8] [--journeys 5] [--goals 3]
+           [--driver functions|apptest] [--think-ms 0] [--scrypt-n N] [--seed 0]
+           [--output PATH] [--compare BASELINE.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STEPS = ("register", "login", "skills", "personality", "interests", "recommendations", "save",
+         "add_goals", "update_goals", "dashboard")
+PERCENTILES = (50, 95, 99)
+JOB_DRAIN_SECONDS = 120
+PASSWORD = "load-test-password"
+
+
+def is_locked(error):
+    return isinstance(error, sqlite3.OperationalError) and "locked" in str(error)
+
+
+class Recorder:
+    """Per-step latencies and error counts, shared by the session threads."""
+
+    def __init__(self):
+        self.latencies = {step: [] for step in STEPS}
+        self.errors = {step: {} for step in STEPS}
+        self.journeys = 0
+        self._lock = threading.Lock()
+
+    def step(self, name, fn, *args):
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception as e:
+            kind = "database is locked" if is_locked(e) else type(e).__name__
+            with self._lock:
+                self.errors[name][kind] = self.errors[name].get(kind, 0) + 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.latencies[name].append(elapsed)
+        return result
+
+    def finished_journey(self):
+        with self._lock:
+            self.journeys += 1
+
+    def merge(self, latencies, errors, journeys):
+        with self._lock:
+            for step in STEPS:
+                self.latencies[step].extend(latencies[step])
+                for kind, n in errors[step].items():
+                    self.errors[step][kind] = self.errors[step].get(kind, 0) + n
+            self.journeys += journeys
+
+
+# Function driver
+class FunctionJourney:
+    """One user journey made of the calls the pages make."""
+
+    def __init__(self, username, rng, goals, think):
+        import session_store
+        self.username = username
+        self.rng = rng
+        self.goals = goals
+        self.think = think
+        self.store = session_store.get_store()
+        self.user_id = None
+        self.user_data = None
+
+    def _rerun_done(self):
+        # main() puts user_data into the session store after every rerun
+        self.store.put(self.user_id, self.user_data)
+        if self.think:
+            time.sleep(self.think)
+
+    def register(self):
+        import repository
+        if not repository.create_user(self.username, PASSWORD, f"{self.username}@example.com"):
+            raise RuntimeError(f"user {self.username} already exists")
+
+    def login(self):
+        import repository
+        user = repository.verify_user(self.username, PASSWORD)
+        if user is None:
+            raise RuntimeError(f"login failed for {self.username}")
+        self.user_id = user[0]
+        self.user_data = self.store.get(self.user_id)
+        self._rerun_done()
+
+    def skills(self):
+        import charts
+        from career_engine import get_advisor
+        scores = {skill: self.rng.randint(1, 7) for skill in get_advisor().technical_skills}
+        charts.skills_bar(scores)
+        self.user_data["technical_skills"] = scores
+        # As main_app.skill_summary, which the dashboard reads back
+        self.user_data["skill_summary"] = {"count": len(scores), "average": sum(scores.values()) / len(scores)}
+        self._rerun_done()
+
+    def personality(self):
+        import charts
+        from scoring import personality_bank
+        bank = personality_bank()
+        scores = bank.profile([self.rng.randint(1, 5) for _ in bank.questions])
+        charts.personality_radar(scores)
+        self.user_data["personality_traits"] = scores
+        self._rerun_done()
+
+    def interests(self):
+        import charts
+        from scoring import interest_bank
+        bank = interest_bank()
+        scores = bank.profile([self.rng.randint(1, 5) for _ in bank.questions])
+        charts.interest_bar(scores)
+        self.user_data["career_interests"] = scores
+        self._rerun_done()
+
+    def recommendations(self):
+        import job_queue
+        from recommendation_cache import cached_recommendations, load_ranking, serialize_ranking
+        from what_if import WhatIf
+        user_data = self.user_data
+        fingerprint, recommendations = cached_recommendations(
+            user_data["technical_skills"], user_data["personality_traits"], user_data["career_interests"])
+        if recommendations is None:
+            job_id = job_queue.submit("recommend", {
+                "user_id": self.user_id,
+                "technical_skills": user_data["technical_skills"],
+                "personality_traits": user_data["personality_traits"],
+                "career_interests": user_data["career_interests"],
+            }, dedupe_key=fingerprint)
+            # The page polls across reruns until the job is done
+            job = job_queue.wait_for(job_id, timeout=JOB_DRAIN_SECONDS)
+            if job["status"] != "done":
+                raise RuntimeError(f"recommend job {job_id} {job['status']}: {job['error']}")
+            fingerprint = job["result"]["fingerprint"]
+            recommendations = load_ranking(job["result"]["recommendations"])
+            user_data["recommendations"] = job["result"]["recommendations"]
+        else:
+            user_data["recommendations"] = serialize_ranking(recommendations)
+        user_data["assessment_fingerprint"] = fingerprint
+        # show_what_if at the skill's current level
+        simulator = WhatIf(user_data["technical_skills"], user_data["personality_traits"],
+                           user_data["career_interests"])
+        skill = next(iter(user_data["technical_skills"]))
+        for rec in simulator.rankings([{skill: user_data["technical_skills"][skill]}])[0]:
+            simulator.rank_moves([{}], rec["career"])
+        self._rerun_done()
+
+    def save(self):
+        import job_queue
+        user_data = self.user_data
+        job_queue.submit("save_assessment", {
+            "user_id": self.user_id,
+            "technical_skills": user_data["technical_skills"],
+            "personality_traits": user_data["personality_traits"],
+            "career_interests": user_data["career_interests"],
+            "recommendations": user_data["recommendations"],
+            "fingerprint": user_data["assessment_fingerprint"],
+        })
+        self._rerun_done()
+
+    def add_goals(self):
+        import repository
+        for i in range(self.goals):
+            goal_type = self.rng.choice(repository.GOAL_TYPES)
+            target = date.today() + timedelta(days=self.rng.randint(7, 365))
+            repository.add_goal(self.user_id, goal_type, f"{goal_type} goal {i} for {self.username}", target)
+            repository.list_goals_page(self.user_id)
+            self._rerun_done()
+
+    def update_goals(self):
+        import repository
+        # The page keeps its goal list in session state and patches it, so
+        # only the history expander is read again on each rerun
+        goals, _ = repository.list_goals_page(self.user_id)
+        for goal in goals:
+            repository.update_goal_statuses(self.user_id, {goal["id"]: self.rng.choice(repository.GOAL_STATUSES)})
+            repository.goal_status_history(self.user_id)
+            self._rerun_done()
+        # One bulk triage of half the page through the form
+        status = self.rng.choice(repository.GOAL_STATUSES)
+        repository.update_goal_statuses(self.user_id, {goal["id"]: status for goal in goals[::2]})
+        repository.goal_status_history(self.user_id)
+        self._rerun_done()
+
+    def dashboard(self):
+        import charts
+        import repository
+        user_data = self.user_data
+        stats = repository.user_stats(self.user_id)
+        charts.top_skills_bar(user_data["technical_skills"])
+        if stats["assessments"] > 0:
+            # The trend chart's defaults: first skill, per month
+            skill = next(iter(user_data["technical_skills"]))
+            rows = repository.skill_trend(self.user_id, skill, "month")
+            if rows:
+                charts.skill_trend(skill, "month", rows, repository.cohort_skill_trend(skill, "month"))
+        self._rerun_done()
+
+
+def run_function_journey(recorder, username, rng, goals, think):
+    journey = FunctionJourney(username, rng, goals, think)
+    for name in STEPS:
+        recorder.step(name, getattr(journey, name))
+
+
+# AppTest driver
+APP_TIMEOUT_SECONDS = 60
+
+
+class AppTestJourney:
+    """One user journey clicking through main_app.py."""
+
+    def __init__(self, username, rng, goals, think):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(os.path.join(ROOT, "main_app.py"), default_timeout=APP_TIMEOUT_SECONDS)
+        self.username = username
+        self.rng = rng
+        self.goals = goals
+        self.think = think
+
+    def _run(self, widget=None):
+        (widget or self.at).run()
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].value)
+        if self.think:
+            time.sleep(self.think)
+
+    def _button(self, label):
+        return next(button for button in self.at.button if button.label == label)
+
+    def _page(self, label):
+        self._run(self.at.sidebar.selectbox[0].select(label))
+
+    def register(self):
+        self._run()
+        self.at.text_input(key="reg_username").input(self.username)
+        self.at.text_input(key="reg_email").input(f"{self.username}@example.com")
+        self.at.text_input(key="reg_password").input(PASSWORD)
+        self.at.text_input(key="reg_confirm").input(PASSWORD)
+        self._run(self._button("Register").click())
+        if not self.at.success:
+            raise RuntimeError(f"registration failed for {self.username}")
+
+    def login(self):
+        self.at.text_input(key="login_username").input(self.username)
+        self.at.text_input(key="login_password").input(PASSWORD)
+        self._run(self._button("Login").click())
+        if not self.at.session_state.logged_in:
+            raise RuntimeError(f"login failed for {self.username}")
+
+    def _assessment(self, page, button, low, high):
+        self._page(page)
+        for slider in self.at.slider:
+            slider.set_value(self.rng.randint(low, high))
+        self._run(self._button(button).click())
+
+    def skills(self):
+        self._assessment("🛠️ Skills Assessment", "Analyze Skills", 1, 7)
+
+    def personality(self):
+        self._assessment("🧠 Personality Test", "Complete Personality Assessment", 1, 5)
+
+    def interests(self):
+        self._assessment("🎯 Career Interests", "Complete Interest Assessment", 1, 5)
+
+    def recommendations(self):
+        self._page("🏆 Recommendations")
+
+    def save(self):
+        self._run(self._button("Save Recommendations").click())
+
+    def add_goals(self):
+        self._page("📊 Progress Tracking")
+        for i in range(self.goals):
+            self.at.text_area[0].input(f"goal {i} for {self.username}")
+            self._run(self._button("Add Goal").click())
+
+    def update_goals(self):
+        import repository
+        goal_keys = [box.key for box in self.at.selectbox if box.key and box.key.startswith("status_")]
+        for goal_key in goal_keys:
+            # Widgets are looked up again after every rerun
+            self.at.selectbox(key=goal_key).select(self.rng.choice(repository.GOAL_STATUSES))
+            self._run(self.at.button(key=goal_key.replace("status_", "update_")).click())
+        if goal_keys:
+            self.at.multiselect(key="bulk_goal_ids").set_value(
+                [int(goal_key[len("status_"):]) for goal_key in goal_keys[::2]])
+            self.at.selectbox(key="bulk_goal_status").select(self.rng.choice(repository.GOAL_STATUSES))
+            self._run(self._button("Apply to Selected").click())
+
+    def dashboard(self):
+        self._page("🏠 Dashboard")
+
+
+def run_apptest_journey(recorder, username, rng, goals, think):
+    journey = AppTestJourney(username, rng, goals, think)
+    for name in STEPS:
+        recorder.step(name, getattr(journey, name))
+
+
+DRIVERS = {"functions": run_function_journey, "apptest": run_apptest_journey}
+
+
+def run_session(recorder, driver, n, run_id, seed, journeys, goals, think):
+    """Run one simulated user's journeys back to back; returns how many failed."""
+    run_journey = DRIVERS[driver]
+    rng = random.Random(seed * 100003 + n)
+    failed = 0
+    for j in range(journeys):
+        try:
+            run_journey(recorder, f"load{run_id}_{n}_{j}", rng, goals, think)
+        except Exception:
+            # The recorder counted it; the next journey starts over with a new user
+            failed += 1
+            continue
+        recorder.finished_journey()
+    return failed
+
+
+def apptest_session(params):
+    """One apptest session in its own process.
+
+    AppTest keeps a process-wide Streamlit runtime, so concurrent sessions
+    cannot share a process; each behaves like a separate app server on the
+    same database. Queued jobs are left for the parent's workers.
+    """
+    import job_queue
+    import session_store
+    recorder = Recorder()
+    failed = run_session(recorder, "apptest", *params)
+    job_queue.get_workers().stop()
+    session_store.get_store().close()
+    return recorder.latencies, recorder.errors, recorder.journeys, failed
+
+
+# Reporting
+def summarize(values):
+    if not values:
+        return {"count": 0}
+    ms = np.asarray(values) * 1000
+    summary = {"count": int(ms.size), "mean_ms": float(ms.mean())}
+    for q in PERCENTILES:
+        summary[f"p{q}_ms"] = float(np.percentile(ms, q))
+    summary["max_ms"] = float(ms.max())
+    return summary
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def job_lock_errors():
+    """Jobs whose last error was a lock timeout, and jobs retried for any reason."""
+    import repository
+    with repository.connection() as conn:
+        locked, retried = conn.execute("""SELECT SUM(error LIKE '%database is locked%'), SUM(attempts > 1)
+                                       FROM jobs""").fetchone()
+    return {"locked": locked or 0, "retried": retried or 0}
+
+
+def print_report(result):
+    print(f"{result['driver']} driver, {result['sessions']} sessions x {result['journeys_per_session']} "
+          f"journeys, commit {result['commit']}")
+    print(f"{result['journeys']} journeys in {result['elapsed_seconds']:.2f} s: "
+          f"{result['journeys_per_second']:.2f} journeys/s, {result['steps_per_second']:.1f} steps/s")
+    print(f"{'step':<16} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  errors")
+    for step, stats in result["steps"].items():
+        errors = ", ".join(f"{kind} {n}" for kind, n in result["errors"][step].items()) or "-"
+        if stats["count"]:
+            print(f"{step:<16} {stats['count']:>6} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+                  f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}  {errors}")
+        else:
+            print(f"{step:<16} {0:>6} {'-':>9} {'-':>9} {'-':>9} {'-':>9}  {errors}")
+    print(f"database is locked: {result['database_locked']['steps']} in steps, "
+          f"{result['database_locked']['jobs']} in jobs ({result['database_locked']['jobs_retried']} jobs retried)")
+
+
+def compare(result, baseline):
+    print(f"\nvs {baseline['commit']} ({baseline['driver']} driver, {baseline['sessions']} sessions):")
+    ratio = result["journeys_per_second"] / baseline["journeys_per_second"] if baseline["journeys_per_second"] else 0
+    print(f"  throughput {baseline['journeys_per_second']:.2f} -> {result['journeys_per_second']:.2f} "
+          f"journeys/s ({ratio - 1:+.0%})")
+    for step, stats in result["steps"].items():
+        old = baseline["steps"].get(step, {})
+        if not stats["count"] or not old.get("count"):
+            continue
+        changes = "  ".join(f"p{q} {old[f'p{q}_ms']:.2f} -> {stats[f'p{q}_ms']:.2f} ms "
+                            f"({stats[f'p{q}_ms'] / old[f'p{q}_ms'] - 1:+.0%})" for q in PERCENTILES)
+        print(f"  {step:<16} {changes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent simulated users")
+    parser.add_argument("--journeys", type=int, default=5, help="journeys per session, each a new user")
+    parser.add_argument("--goals", type=int, default=3, help="goals added and updated per journey")
+    parser.add_argument("--driver", choices=sorted(DRIVERS), default="functions")
+    parser.add_argument("--think-ms", type=float, default=0, help="pause after every rerun")
+    parser.add_argument("--scrypt-n", type=int, help="override CAREER_SCRYPT_N (cheaper logins)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON results path (default load_test-<commit>.json)")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    # The app modules read their settings at import time
+    if args.scrypt_n:
+        os.environ["CAREER_SCRYPT_N"] = str(args.scrypt_n)
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["CAREER_ADVISOR_DB"] = os.path.join(tmp.name, "career_advisor.db")
+    import job_queue
+    import metrics
+    import repository
+    import session_store
+    from career_engine import get_advisor
+    from scoring import interest_bank, personality_bank
+
+    # Migrations and the catalog compile happen once, outside the measurement
+    repository.init_database()
+    get_advisor().compile_catalog()
+    personality_bank(), interest_bank()
+    metrics.reset()
+
+    recorder = Recorder()
+    run_id = f"{int(time.time()) % 100000}"
+    params = [(n, run_id, args.seed, args.journeys, args.goals, args.think_ms / 1000) for n in range(args.sessions)]
+    start = time.perf_counter()
+    if args.driver == "apptest":
+        with multiprocessing.get_context("spawn").Pool(args.sessions) as pool:
+            sessions = pool.map(apptest_session, params)
+        for latencies, errors, journeys, _ in sessions:
+            recorder.merge(latencies, errors, journeys)
+        failed = sum(session[3] for session in sessions)
+    else:
+        failures = [0] * args.sessions
+
+        def session(n):
+            failures[n] = run_session(recorder, args.driver, *params[n])
+
+        threads = [threading.Thread(target=session, args=(n,), name=f"load-session-{n}")
+                   for n in range(args.sessions)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        failed = sum(failures)
+    # Saves are background jobs; the run ends when they are written
+    job_queue.get_workers()
+    deadline = time.monotonic() + JOB_DRAIN_SECONDS
+    while sum(job_queue.queue_stats()["depth"][status] for status in job_queue.PENDING):
+        if time.monotonic() > deadline:
+            print("warning: jobs still pending after the drain timeout", file=sys.stderr)
+            break
+        time.sleep(0.05)
+    session_store.get_store().flush()
+    elapsed = time.perf_counter() - start
+
+    steps = {step: summarize(values) for step, values in recorder.latencies.items()}
+    jobs = job_lock_errors()
+    spans = {name: stats for name, stats in metrics.snapshot().items()
+             if name.startswith(("db.", "engine.", "job."))}
+    result = {
+        "commit": git_commit(),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "driver": args.driver,
+        "sessions": args.sessions,
+        "journeys_per_session": args.journeys,
+        "goals_per_journey": args.goals,
+        "think_ms": args.think_ms,
+        "scrypt_n": int(os.environ.get("CAREER_SCRYPT_N", str(2 ** 14))),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "elapsed_seconds": elapsed,
+        "journeys": recorder.journeys,
+        "failed_journeys": failed,
+        "journeys_per_second": recorder.journeys / elapsed,
+        "steps_per_second": sum(stats["count"] for stats in steps.values()) / elapsed,
+        "steps": steps,
+        "errors": recorder.errors,
+        "database_locked": {
+            "steps": sum(errors.get("database is locked", 0) for errors in recorder.errors.values()),
+            "jobs": jobs["locked"],
+            "jobs_retried": jobs["retried"],
+        },
+        "job_queue": job_queue.queue_stats(),
+        "spans": spans,
+    }
+
+    print_report(result)
+    output = args.output or f"load_test-{result['commit']}.json"
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"results written to {output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
+
+    job_queue.get_workers().stop()
+    session_store.get_store().close()
+    repository.get_pool().close()
+    tmp.cleanup()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Seeded benchmark database generator.
+
+Usage: python benchmarks/seed_db.py OUT.db [--users 10000] [--goals 1000000] [--assessments 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import passwords
+import repository
+from career_engine import CareerAdvisor
+
+GOAL_TYPES = ["Skill Development", "Certification", "Project Completion", "Job Application"]
+STATUSES = ["In Progress", "Completed", "On Hold", "Cancelled"]
+BATCH = 50_000
+
+
+def _timestamps(rng, n, start=datetime(2024, 1, 1)):
+    for _ in range(n):
+        yield (start + timedelta(seconds=rng.randrange(60 * 60 * 24 * 730))).isoformat(" ")
+
+
+def seed(path, users=10_000, goals=1_000_000, assessments=0, schema_version=repository.SCHEMA_VERSION, seed=1):
+    """Create a reproducible database at path with the requested row counts."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    # Assessments are written as legacy JSON rows; migration 5 packs them
+    repository.migrate(conn, target=min(schema_version, 4))
+
+    with conn:
+        conn.executemany("INSERT INTO users (id, username, password, email, created_at) VALUES (?, ?, ?, ?, ?)",
+                         ((u, f"user{u}", passwords.LEGACY.hash(f"user{u}"), f"user{u}@example.com", ts)
+                          for u, ts in zip(range(1, users + 1), _timestamps(rng, users))))
+
+    def goal_rows():
+        for i, ts in enumerate(_timestamps(rng, goals)):
+            yield (rng.randint(1, users), rng.choice(GOAL_TYPES), f"Seeded goal {i}",
+                   "2026-12-31", rng.choice(STATUSES), ts)
+
+    advisor = CareerAdvisor()
+
+    def assessment_rows():
+        for ts in _timestamps(rng, assessments):
+            yield (rng.randint(1, users),
+                   json.dumps({s: rng.randint(1, 7) for s in advisor.technical_skills}),
+                   json.dumps({t: rng.randint(4, 20) / 4 for t in advisor.personality_traits}),
+                   json.dumps({i: rng.randint(3, 15) / 3 for i in advisor.career_interests}),
+                   json.dumps({}), ts)
+
+    for sql, rows in (
+        ("""INSERT INTO progress (user_id, goal_type, goal_description, target_date, completion_status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)""", goal_rows()),
+        ("""INSERT INTO assessments (user_id, technical_skills, personality_traits, career_interests, recommendations, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)""", assessment_rows()),
+    ):
+        while True:
+            batch = [row for _, row in zip(range(BATCH), rows)]
+            if not batch:
+                break
+            with conn:
+                conn.executemany(sql, batch)
+
+    repository.migrate(conn, target=schema_version)
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--goals", type=int, default=1_000_000)
+    parser.add_argument("--assessments", type=int, default=0)
+    parser.add_argument("--schema-version", type=int, default=repository.SCHEMA_VERSION)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    seed(args.path, args.users, args.goals, args.assessments, args.schema_version, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+# AI-Powered Career and Skills Advisor - Career Matching Engine
+# Per-user scoring and the vectorized batch scorer over the career catalog
+# (data/careers.json, loaded by catalog_store)
+
+import os
+
+import numpy as np
+
+import catalog_store
+import metrics
+
+TECH_WEIGHT = 0.6
+PERSONALITY_WEIGHT = 0.4
+
+# How many careers a stored or displayed ranking keeps
+RANKING_DEPTH = 25
+
+# Top-k search over the catalog: "exact" scans every career, "tree" is an
+# exact ball-tree search and "lsh" is approximate random-projection hashing
+INDEX_MODES = ("exact", "tree", "lsh")
+INDEX_MODE = os.environ.get("CAREER_INDEX_MODE", "exact")
+LSH_TABLES = 64
+LSH_BITS = 10
+LSH_SHORTLIST_FACTOR = 4
+
+# Career Data and Models
+class CareerAdvisor:
+    def __init__(self, career_paths=None, catalog=None):
+        catalog = catalog or catalog_store.get_catalog()
+        self.catalog = catalog
+        self.catalog_version = catalog.version
+        self._compiled = None
+        self._indexes = {}
+
+        self.technical_skills = list(catalog.technical_skills)
+        self.personality_traits = list(catalog.personality_traits)
+        self.career_interests = list(catalog.career_interests)
+        self.career_paths = catalog.career_paths
+
+        if career_paths is not None:
+            self.career_paths = career_paths
+    
+    @metrics.timed("engine.calculate_career_match")
+    def calculate_career_match(self, technical_scores, personality_scores, interest_scores):
+        recommendations = []
+        
+        for career, details in self.career_paths.items():
+            # Technical skill match
+            tech_match = 0
+            for skill in details["key_skills"]:
+                if skill in technical_scores:
+                    tech_match += technical_scores[skill]
+            tech_match = tech_match / len(details["key_skills"]) if details["key_skills"] else 0
+            
+            # Personality match
+            personality_match = 0
+            for trait in details["personality_fit"]:
+                if trait in personality_scores:
+                    personality_match += personality_scores[trait]
+                elif trait in interest_scores:
+                    personality_match += interest_scores[trait]
+            personality_match = personality_match / len(details["personality_fit"]) if details["personality_fit"] else 0
+            
+            # Overall match score
+            overall_score = (tech_match * TECH_WEIGHT) + (personality_match * PERSONALITY_WEIGHT)
+            
+            recommendations.append({
+                "career": career,
+                "score": overall_score,
+                "details": details,
+                "tech_match": tech_match,
+                "personality_match": personality_match
+            })
+        
+        return sorted(recommendations, key=lambda x: x['score'], reverse=True)
+
+    def score_layout(self):
+        """Canonical order of the stored score vector, grouped by assessment."""
+        return {
+            "technical_skills": list(self.technical_skills),
+            "personality_traits": list(self.personality_traits),
+            "career_interests": list(self.career_interests),
+        }
+
+    def compile_catalog(self):
+        if self._compiled is None:
+            self._compiled = CompiledCatalog(self)
+        return self._compiled
+
+    @metrics.timed("engine.batch_career_match")
+    def batch_career_match(self, technical_scores_list, personality_scores_list,
+                           interest_scores_list, top_k=5):
+        """Score a cohort of users at once.
+
+        Takes parallel lists of the same score dicts accepted by
+        calculate_career_match and returns one ranked list per user, in the
+        same order calculate_career_match would produce, truncated to top_k.
+        """
+        catalog = self.compile_catalog()
+        tech, traits = catalog.encode_users(technical_scores_list,
+                                            personality_scores_list,
+                                            interest_scores_list)
+        return catalog.to_recommendations(catalog.top_k(tech, traits, top_k))
+
+    def career_index(self, mode=None):
+        mode = mode or INDEX_MODE
+        if mode not in self._indexes:
+            self._indexes[mode] = CareerIndex(self.compile_catalog(), mode)
+        return self._indexes[mode]
+
+    @metrics.timed("engine.top_careers")
+    def top_careers(self, technical_scores, personality_scores, interest_scores,
+                    k=RANKING_DEPTH, mode=None):
+        """Best k careers for one user through the configured career index.
+
+        In "exact" mode this is calculate_career_match()[:k]; the other
+        modes avoid scanning the whole catalog.
+        """
+        catalog = self.compile_catalog()
+        tech, traits = catalog.encode_users([technical_scores], [personality_scores], [interest_scores])
+        return catalog.to_recommendations(self.career_index(mode).top_k(tech, traits, k))[0]
+
+
+# Process-wide Advisor
+@catalog_store.compiler("advisor")
+def _compile_advisor(catalog):
+    advisor = CareerAdvisor(catalog=catalog)
+    advisor.career_index()
+    return advisor
+
+def get_advisor():
+    """Return the shared advisor for the current catalog, with its compiled catalog and index.
+
+    Streamlit re-executes the page script on every interaction, so the pages
+    call this instead of CareerAdvisor(). It is built once per catalog
+    snapshot and is read-only once published; when the catalog files change
+    the next snapshot comes with its own advisor.
+    """
+    return catalog_store.get_catalog().compiled("advisor")
+
+# Compiled Catalog for Batch Scoring
+class CompiledCatalog:
+    """Career catalog compiled into dense weight matrices.
+
+    tech_weights is careers x technical skills and trait_weights is
+    careers x (personality traits + interests); both hold 0/1 incidence so a
+    matrix multiply yields the same per-career sums as the scalar loop, which
+    are then divided by the per-career counts exactly like
+    calculate_career_match does.
+    """
+
+    def __init__(self, advisor):
+        self.careers = list(advisor.career_paths.keys())
+        self.details = [advisor.career_paths[c] for c in self.careers]
+        self.skills = list(advisor.technical_skills)
+        # Personality traits take precedence over interests of the same name,
+        # mirroring the if/elif lookup in calculate_career_match
+        self.traits = list(advisor.personality_traits) + [
+            i for i in advisor.career_interests if i not in advisor.personality_traits
+        ]
+        self.skill_index = {s: i for i, s in enumerate(self.skills)}
+        self.trait_index = {t: i for i, t in enumerate(self.traits)}
+
+        n_careers = len(self.careers)
+        self.tech_weights = np.zeros((n_careers, len(self.skills)))
+        self.trait_weights = np.zeros((n_careers, len(self.traits)))
+        self.tech_counts = np.zeros(n_careers)
+        self.trait_counts = np.zeros(n_careers)
+
+        for row, details in enumerate(self.details):
+            for skill in details["key_skills"]:
+                self.tech_counts[row] += 1
+                if skill in self.skill_index:
+                    self.tech_weights[row, self.skill_index[skill]] += 1
+            for trait in details["personality_fit"]:
+                self.trait_counts[row] += 1
+                if trait in self.trait_index:
+                    self.trait_weights[row, self.trait_index[trait]] += 1
+
+        # Careers with no skills/traits score 0 for that component
+        self._tech_divisor = np.where(self.tech_counts > 0, self.tech_counts, np.inf)
+        self._trait_divisor = np.where(self.trait_counts > 0, self.trait_counts, np.inf)
+
+    def encode_users(self, technical_scores_list, personality_scores_list, interest_scores_list):
+        """Turn per-user score dicts into (N x skills) and (N x traits) matrices."""
+        n_users = len(technical_scores_list)
+        tech = np.zeros((n_users, len(self.skills)))
+        traits = np.zeros((n_users, len(self.traits)))
+
+        for u in range(n_users):
+            for skill, score in technical_scores_list[u].items():
+                col = self.skill_index.get(skill)
+                if col is not None:
+                    tech[u, col] = score
+            for trait, score in interest_scores_list[u].items():
+                col = self.trait_index.get(trait)
+                if col is not None:
+                    traits[u, col] = score
+            for trait, score in personality_scores_list[u].items():
+                col = self.trait_index.get(trait)
+                if col is not None:
+                    traits[u, col] = score
+
+        return tech, traits
+
+    def tech_sums(self, tech):
+        """Per-career sums of the users' key skill scores, N x careers."""
+        return np.asarray(tech, dtype=float) @ self.tech_weights.T
+
+    def score(self, tech, traits):
+        """Return (overall, tech_match, personality_match), each N x careers."""
+        tech_match = self.tech_sums(tech) / self._tech_divisor
+        personality_match = (np.asarray(traits, dtype=float) @ self.trait_weights.T) / self._trait_divisor
+        overall = (tech_match * TECH_WEIGHT) + (personality_match * PERSONALITY_WEIGHT)
+        return overall, tech_match, personality_match
+
+    def score_deltas(self, tech_sums, personality_match, tech_deltas, careers=None):
+        """(overall, tech_match, personality_match) after changing technical skills, without rescoring.
+
+        tech_sums (careers,) and personality_match (careers,) are one user's
+        cached tech_sums() and score() rows; tech_deltas is scenarios x
+        skills of changes to that user's skill scores. Each scenario updates
+        the per-career sums by its deltas, so with whole-number scores the
+        sums are exact. The personality match is the cached row, which a
+        batched score() may round differently in the last bit, so scores
+        agree with rescoring to about 1e-15. Each array is scenarios x
+        careers, or scenarios x len(careers) when only those career indices
+        are wanted.
+        """
+        careers = slice(None) if careers is None else careers
+        sums = np.asarray(tech_sums)[careers][None, :] + (
+            np.asarray(tech_deltas, dtype=float) @ self.tech_weights[careers].T)
+        tech_match = sums / self._tech_divisor[careers]
+        personality_match = np.broadcast_to(np.asarray(personality_match)[careers], tech_match.shape)
+        overall = (tech_match * TECH_WEIGHT) + (personality_match * PERSONALITY_WEIGHT)
+        return overall, tech_match, personality_match
+
+    def top_k(self, tech, traits, k=5):
+        """Rank careers for every user and keep the best k.
+
+        Returns a dict of N x k arrays: career indices, overall scores,
+        tech_match and personality_match. Ties are broken by catalog order,
+        the same as the stable sort in calculate_career_match.
+        """
+        return self.rank_scores(*self.score(tech, traits), k)
+
+    def rank_scores(self, overall, tech_match, personality_match, k=5):
+        """top_k over already computed N x careers scores."""
+        n_users, n_careers = overall.shape
+        k = max(0, min(k, n_careers))
+        rows = np.arange(n_users)[:, None]
+
+        if k < n_careers:
+            # k-th best score per user, then keep everything strictly above it
+            # plus the lowest-index careers tied with it
+            kth_col = np.argpartition(-overall, k - 1, axis=1)[:, k - 1:k]
+            kth = np.take_along_axis(overall, kth_col, axis=1)
+            above = overall > kth
+            tied = overall == kth
+            room = k - above.sum(axis=1, keepdims=True)
+            selected = above | (tied & (np.cumsum(tied, axis=1) <= room))
+            candidates = np.nonzero(selected)[1].reshape(n_users, k)
+        else:
+            candidates = np.broadcast_to(np.arange(n_careers), (n_users, n_careers))
+
+        return self._sort_candidates(candidates, overall[rows, candidates],
+                                     tech_match[rows, candidates], personality_match[rows, candidates])
+
+    def rank_candidates(self, tech, traits, candidates):
+        """Exactly score and rank N x m candidate career indices per user.
+
+        Used by CareerIndex to re-rank what a tree or hash lookup returned.
+        """
+        candidates = np.sort(candidates, axis=1)
+        return self._sort_candidates(candidates, *self.score_candidates(tech, traits, candidates))
+
+    def score_candidates(self, tech, traits, candidates):
+        """(overall, tech_match, personality_match) for N x m career indices, unsorted."""
+        tech = np.asarray(tech, dtype=float)
+        traits = np.asarray(traits, dtype=float)
+        tech_match = np.einsum("ns,nms->nm", tech, self.tech_weights[candidates]) / self._tech_divisor[candidates]
+        personality_match = np.einsum("nt,nmt->nm", traits, self.trait_weights[candidates]) / self._trait_divisor[candidates]
+        overall = (tech_match * TECH_WEIGHT) + (personality_match * PERSONALITY_WEIGHT)
+        return overall, tech_match, personality_match
+
+    @staticmethod
+    def _sort_candidates(candidates, overall, tech_match, personality_match):
+        # candidates are in ascending catalog order, so a stable sort keeps ties in that order
+        order = np.argsort(-overall, axis=1, kind="stable")
+        rows = np.arange(candidates.shape[0])[:, None]
+        return {
+            "indices": candidates[rows, order],
+            "score": overall[rows, order],
+            "tech_match": tech_match[rows, order],
+            "personality_match": personality_match[rows, order],
+        }
+
+    def career_vectors(self):
+        """careers x (skills + traits) such that career_vectors @ user_vector is the overall score."""
+        return np.hstack([
+            self.tech_weights * (TECH_WEIGHT / self._tech_divisor)[:, None],
+            self.trait_weights * (PERSONALITY_WEIGHT / self._trait_divisor)[:, None],
+        ])
+
+    def to_recommendations(self, ranked):
+        """Expand top_k output into the list-of-dicts shape used by the pages."""
+        results = []
+        for u in range(ranked["indices"].shape[0]):
+            results.append([
+                {
+                    "career": self.careers[idx],
+                    "score": float(ranked["score"][u, j]),
+                    "details": self.details[idx],
+                    "tech_match": float(ranked["tech_match"][u, j]),
+                    "personality_match": float(ranked["personality_match"][u, j]),
+                }
+                for j, idx in enumerate(ranked["indices"][u])
+            ])
+        return results
+
+
+# Top-k Career Search
+class CareerIndex:
+    """Sublinear top-k search over a compiled catalog.
+
+    The overall score is an inner product between a career vector and the
+    user's (skills + traits) vector. Padding every career vector to the same
+    norm turns that maximum inner product search into a nearest-neighbour
+    search, which a ball tree answers exactly and random hyperplane hashing
+    answers approximately. Candidates from either are re-ranked with the
+    exact scorer, so returned scores always match calculate_career_match.
+    """
+
+    def __init__(self, catalog, mode=INDEX_MODE, n_tables=LSH_TABLES, n_bits=LSH_BITS, seed=0):
+        if mode not in INDEX_MODES:
+            raise ValueError(f"unknown career index mode {mode!r}; expected one of {INDEX_MODES}")
+        self.catalog = catalog
+        self.mode = mode
+        if mode == "exact":
+            return
+
+        vectors = self._vectors = catalog.career_vectors()
+        norms = np.linalg.norm(vectors, axis=1)
+        max_norm = norms.max() if len(norms) and norms.max() > 0 else 1.0
+        padding = np.sqrt(np.clip(1 - (norms / max_norm) ** 2, 0, None))
+        augmented = np.hstack([vectors / max_norm, padding[:, None]])
+
+        if mode == "tree":
+            from sklearn.neighbors import BallTree
+            self._tree = BallTree(augmented)
+        else:
+            # All vectors share the positive orthant; centring them spreads
+            # the hyperplane hashes instead of landing everything in a few buckets
+            self._center = augmented.mean(axis=0)
+            augmented = augmented - self._center
+            rng = np.random.default_rng(seed)
+            self._planes = rng.standard_normal((n_tables, augmented.shape[1], n_bits))
+            self._powers = 1 << np.arange(n_bits)
+            self._buckets = []
+            for codes in self._hash(augmented):
+                order = np.argsort(codes, kind="stable")
+                keys, starts = np.unique(codes[order], return_index=True)
+                self._buckets.append(dict(zip(keys.tolist(), np.split(order, starts[1:]))))
+
+    def _hash(self, vectors):
+        """tables x rows bucket codes."""
+        return (np.einsum("rd,tdb->trb", vectors, self._planes) > 0) @ self._powers
+
+    def _queries(self, tech, traits):
+        queries = np.hstack([np.asarray(tech, dtype=float), np.asarray(traits, dtype=float)])
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms > 0, norms, 1.0)
+        return np.hstack([queries, np.zeros((queries.shape[0], 1))])
+
+    def top_k(self, tech, traits, k=5):
+        """Same contract as CompiledCatalog.top_k."""
+        if self.mode == "exact":
+            return self.catalog.top_k(tech, traits, k)
+        k = max(0, min(k, len(self.catalog.careers)))
+        queries = self._queries(tech, traits)
+        if k == 0 or queries.shape[0] == 0:
+            return self.catalog.top_k(tech, traits, k)
+
+        if self.mode == "tree":
+            _, candidates = self._tree.query(queries, k=k)
+            return self.catalog.rank_candidates(tech, traits, candidates)
+
+        ranked = []
+        codes = self._hash(queries - self._center)
+        users = np.hstack([np.asarray(tech, dtype=float), np.asarray(traits, dtype=float)])
+        shortlist = k * LSH_SHORTLIST_FACTOR
+        for u in range(queries.shape[0]):
+            found = [self._buckets[t].get(int(codes[t, u])) for t in range(len(self._buckets))]
+            found = [f for f in found if f is not None]
+            candidates = np.unique(np.concatenate(found)) if found else np.empty(0, dtype=int)
+            if len(candidates) < k:
+                # Too few hash hits: fall back to scanning for this user
+                result = self.catalog.top_k(tech[u:u + 1], traits[u:u + 1], k)
+            else:
+                if len(candidates) > shortlist:
+                    # Cheap pre-score of every hit, exact scoring only for the best few
+                    approx = self._vectors[candidates] @ users[u]
+                    candidates = candidates[np.argpartition(-approx, shortlist - 1)[:shortlist]]
+                result = self.catalog.rank_candidates(tech[u:u + 1], traits[u:u + 1], candidates[None, :])
+            ranked.append({key: value[:, :k] for key, value in result.items()})
+        return {key: np.vstack([r[key] for r in ranked]) for key in ("indices", "score", "tech_match", "personality_match")}
@@ -0,0 +1,226 @@
+# AI-Powered Career and Skills Advisor - Trained Recommendation Model
+# Offline training on historical assessments and fast batched inference.
+# The weighted heuristic in career_engine stays the fallback whenever no
+# trained model is available.
+#
+# Usage: python career_model.py [--db career_advisor.db] [--model logistic_regression] [--out PATH]
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+import repository
+import score_store
+from career_engine import get_advisor
+
+MODEL_PATH = os.environ.get("CAREER_MODEL_PATH", os.path.join("models", "career_model.joblib"))
+
+# "heuristic" always uses the 0.6/0.4 weighted match; "model" uses the
+# trained model when one is available and falls back to the heuristic otherwise
+RECOMMENDER = os.environ.get("CAREER_RECOMMENDER", "heuristic")
+
+MIN_TRAINING_ROWS = 50
+
+
+def feature_names(advisor):
+    return [name for group in advisor.score_layout().values() for name in group]
+
+
+def build_estimator(name):
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.neighbors import KNeighborsClassifier
+
+    estimators = {
+        "logistic_regression": lambda: LogisticRegression(max_iter=1000),
+        "random_forest": lambda: RandomForestClassifier(n_estimators=25, max_depth=12, n_jobs=-1, random_state=0),
+        "knn": lambda: KNeighborsClassifier(n_neighbors=15),
+    }
+    if name not in estimators:
+        raise ValueError(f"unknown model {name!r}; expected one of {sorted(estimators)}")
+    return estimators[name]()
+
+
+# Training
+def load_training_data(advisor):
+    """Feature matrix and career labels from every assessment with a stored ranking.
+
+    Features come straight from the packed score vectors; the label is the
+    top career of the ranking saved with the assessment.
+    """
+    layout = advisor.score_layout()
+    features = feature_names(advisor)
+    blobs, labels = [], []
+    with repository.connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("""SELECT score_vector, recommendations FROM assessments
+                       WHERE fingerprint IS NOT NULL AND score_layout = ?""",
+                       (score_store.layout_id(conn, layout),))
+        for blob, recommendations_json in cursor:
+            ranking = json.loads(recommendations_json or "{}").get("ranking")
+            if not ranking:
+                continue
+            blobs.append(blob)
+            labels.append(ranking[0]["career"])
+    X = score_store.scores_matrix(blobs, len(features))
+    return np.nan_to_num(X.astype(float)), np.array(labels)
+
+
+def train(model_name="logistic_regression", out_path=MODEL_PATH, test_size=0.2):
+    """Fit scaler + model on historical assessments and write the artifact once."""
+    import joblib
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    advisor = get_advisor()
+    X, y = load_training_data(advisor)
+    if len(y) < MIN_TRAINING_ROWS or len(set(y)) < 2:
+        raise ValueError(f"need at least {MIN_TRAINING_ROWS} assessments covering 2+ careers, found {len(y)}")
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=0)
+    scaler = StandardScaler().fit(X_train)
+    model = build_estimator(model_name).fit(scaler.transform(X_train), y_train)
+    accuracy = float(model.score(scaler.transform(X_test), y_test))
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    artifact = {
+        "model_name": model_name,
+        "catalog_version": advisor.catalog_version,
+        "features": feature_names(advisor),
+        "scaler": scaler,
+        "model": model,
+        "accuracy": accuracy,
+        "trained_rows": int(len(y)),
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    # Uncompressed so the arrays inside can be memory-mapped on load
+    tmp_path = out_path + ".tmp"
+    joblib.dump(artifact, tmp_path)
+    os.replace(tmp_path, out_path)
+    return artifact
+
+
+# Inference
+class CareerModel:
+    """A trained artifact loaded for batched inference."""
+
+    def __init__(self, artifact):
+        self.name = artifact["model_name"]
+        self.catalog_version = artifact["catalog_version"]
+        self.features = artifact["features"]
+        self.version = f"{self.name}@{artifact['trained_at']}"
+        self.accuracy = artifact["accuracy"]
+        scaler, model = artifact["scaler"], artifact["model"]
+        self.classes = np.asarray(model.classes_)
+        if hasattr(model, "n_jobs"):
+            # Thread fan-out costs more than it saves at page-sized batches
+            model.n_jobs = 1
+        self._model = model
+        # Folding the scaler in by hand skips sklearn's per-call validation
+        self._mean = np.asarray(scaler.mean_)
+        self._scale = np.asarray(scaler.scale_)
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        import joblib
+        return cls(joblib.load(path, mmap_mode="r"))
+
+    def encode(self, technical_list, personality_list, interest_list):
+        X = np.zeros((len(technical_list), len(self.features)))
+        column = {f: i for i, f in enumerate(self.features)}
+        for u, scores in enumerate(zip(technical_list, personality_list, interest_list)):
+            for group in scores:
+                for name, value in group.items():
+                    if name in column:
+                        X[u, column[name]] = value
+        return X
+
+    def predict_proba(self, X):
+        """(N x features) raw scores -> (N x classes) probabilities."""
+        return self._model.predict_proba((np.asarray(X, dtype=float) - self._mean) / self._scale)
+
+    def top_k(self, X, k=5):
+        """(indices into classes, probabilities), best first, for a batch of users."""
+        proba = self.predict_proba(X)
+        k = min(k, proba.shape[1])
+        top = np.argsort(-proba, axis=1, kind="stable")[:, :k]
+        return top, np.take_along_axis(proba, top, axis=1)
+
+
+# (path, mtime, model) of the last artifact looked at
+_loaded = (None, None, None)
+_model_lock = threading.Lock()
+
+
+def get_career_model(path=MODEL_PATH):
+    """The process-wide model, reloaded if the artifact changes.
+
+    None when there is no artifact or it was trained for another catalog
+    version; callers then fall back to the heuristic.
+    """
+    global _loaded
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    loaded = _loaded
+    if loaded[:2] != (path, mtime):
+        with _model_lock:
+            if _loaded[:2] != (path, mtime):
+                _loaded = (path, mtime, CareerModel.load(path))
+            loaded = _loaded
+    # Checked per call: the catalog can be reloaded under a loaded model
+    model = loaded[2]
+    return model if model.catalog_version == get_advisor().catalog_version else None
+
+
+def model_recommendations(model, advisor, technical_scores, personality_scores, interest_scores, k):
+    """Rank careers by model probability, with the heuristic match scores for display."""
+    catalog = advisor.compile_catalog()
+    top, proba = model.top_k(model.encode([technical_scores], [personality_scores], [interest_scores]), k)
+    careers = [(str(model.classes[c]), p) for c, p in zip(top[0], proba[0])
+               if str(model.classes[c]) in advisor.career_paths]
+    if not careers:
+        return []
+    indices = np.array([[catalog.careers.index(career) for career, _ in careers]])
+    tech, traits = catalog.encode_users([technical_scores], [personality_scores], [interest_scores])
+    overall, tech_match, personality_match = catalog.score_candidates(tech, traits, indices)
+    return [
+        {
+            "career": career,
+            "score": float(overall[0, j]),
+            "details": advisor.career_paths[career],
+            "tech_match": float(tech_match[0, j]),
+            "personality_match": float(personality_match[0, j]),
+            "model_probability": float(probability),
+        }
+        for j, (career, probability) in enumerate(careers)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the career recommendation model from stored assessments.")
+    parser.add_argument("--db", help="database file (default: CAREER_ADVISOR_DB or career_advisor.db)")
+    parser.add_argument("--model", default="logistic_regression",
+                        choices=["logistic_regression", "random_forest", "knn"])
+    parser.add_argument("--out", default=MODEL_PATH)
+    args = parser.parse_args(argv)
+
+    if args.db:
+        repository.set_database(args.db)
+    start = time.perf_counter()
+    artifact = train(args.model, args.out)
+    print(f"Trained {artifact['model_name']} on {artifact['trained_rows']} assessments in "
+          f"{time.perf_counter() - start:.1f}s - held-out accuracy {artifact['accuracy']:.3f} -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# AI-Powered Career and Skills Advisor - Catalog Data
+# Careers, learning resources and question banks are versioned JSON files in
+# data/ (or CAREER_CATALOG_DIR) rather than Python literals, so they can be
+# edited without a redeploy.
+#
+# load_catalog() reads and validates every file into an immutable Catalog
+# snapshot. Structures derived from it (the compiled career matrices and
+# index, the scoring banks) are registered with @compiler(name) and built
+# once per snapshot. get_catalog() returns the current snapshot and, at most
+# every CATALOG_CHECK_SECONDS, compares the files' mtimes; when they changed,
+# a background thread loads and compiles the new snapshot and then swaps it
+# in with one assignment. Callers never wait for a reload: they keep the
+# snapshot they were handed, and a file that fails validation is reported
+# and ignored until it is fixed.
+#
+# Bump "version" in careers.json whenever a change affects scoring; stored
+# rankings, recommendation fingerprints and trained models are keyed by it.
+
+import json
+import os
+import sys
+import threading
+import time
+
+CATALOG_DIR = os.environ.get("CAREER_CATALOG_DIR",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+CATALOG_CHECK_SECONDS = float(os.environ.get("CAREER_CATALOG_CHECK_SECONDS", "2"))
+
+CATALOG_FILES = ("careers.json", "learning_resources.json", "questions.json")
+RESOURCE_KINDS = ("course", "certification", "project")
+RESOURCE_LEVELS = ("beginner", "intermediate", "advanced")
+
+
+class CatalogError(ValueError):
+    """A catalog file is missing, unreadable or invalid."""
+
+
+# Compilers
+COMPILERS = {}
+
+
+def compiler(name):
+    """Register fn(catalog) -> structure, built once per catalog snapshot."""
+    def register(fn):
+        COMPILERS[name] = fn
+        return fn
+    return register
+
+
+# Snapshot
+class Catalog:
+    """One validated, read-only version of every catalog file."""
+
+    def __init__(self, careers, learning_resources, questions, signature=None):
+        self.version = careers["version"]
+        self.technical_skills = list(careers["technical_skills"])
+        self.personality_traits = list(careers["personality_traits"])
+        self.career_interests = list(careers["career_interests"])
+        self.career_paths = careers["career_paths"]
+        self.learning_resources = learning_resources["resources"]
+        self.personality_questions = questions["personality"]
+        self.riasec_questions = questions["riasec"]
+        self.reverse_scored_phrases = tuple(questions.get("reverse_scored_phrases", ()))
+        self.signature = signature
+        self.loaded_at = time.time()
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def is_reverse_scored(self, question):
+        """Negatively keyed items are scored as (low + high) - answer."""
+        return any(phrase in question for phrase in self.reverse_scored_phrases)
+
+    def compiled(self, name):
+        """The structure registered as name, built for this snapshot on first use."""
+        value = self._compiled.get(name)
+        if value is None:
+            with self._lock:
+                if name not in self._compiled:
+                    self._compiled[name] = COMPILERS[name](self)
+                value = self._compiled[name]
+        return value
+
+    def compile_all(self):
+        for name in list(COMPILERS):
+            self.compiled(name)
+        return self
+
+
+# Loading and Validation
+def _strings(value, where, allowed=None):
+    if not isinstance(value, list) or not all(isinstance(v, str) and v for v in value):
+        raise CatalogError(f"{where}: expected a list of non-empty strings")
+    if len(set(value)) != len(value):
+        raise CatalogError(f"{where}: duplicate entries")
+    if allowed is not None:
+        unknown = [v for v in value if v not in allowed]
+        if unknown:
+            raise CatalogError(f"{where}: unknown {unknown[:5]}")
+    return value
+
+
+def _mapping(value, where):
+    if not isinstance(value, dict) or not value:
+        raise CatalogError(f"{where}: expected a non-empty object")
+    return value
+
+
+def _version(data, where):
+    if not isinstance(data.get("version"), int):
+        raise CatalogError(f"{where}: missing integer \"version\"")
+
+
+def validate_careers(data, where="careers.json"):
+    _version(_mapping(data, where), where)
+    skills = set(_strings(data.get("technical_skills"), f"{where} technical_skills"))
+    traits = set(_strings(data.get("personality_traits"), f"{where} personality_traits"))
+    traits |= set(_strings(data.get("career_interests"), f"{where} career_interests"))
+    for career, details in _mapping(data.get("career_paths"), f"{where} career_paths").items():
+        at = f"{where} career_paths[{career!r}]"
+        if not isinstance(details, dict):
+            raise CatalogError(f"{at}: expected an object")
+        for field in ("description", "salary_range", "growth_rate"):
+            if not isinstance(details.get(field), str):
+                raise CatalogError(f"{at}: missing string {field!r}")
+        _strings(details.get("key_skills"), f"{at} key_skills", skills)
+        _strings(details.get("personality_fit"), f"{at} personality_fit", traits)
+
+
+def validate_learning_resources(data, careers, where="learning_resources.json"):
+    _version(_mapping(data, where), where)
+    skills = set(careers["technical_skills"])
+    resources = data.get("resources")
+    if not isinstance(resources, list):
+        raise CatalogError(f"{where} resources: expected a list")
+    for i, resource in enumerate(resources):
+        at = f"{where} resources[{i}]"
+        if not isinstance(resource, dict):
+            raise CatalogError(f"{at}: expected an object")
+        if not isinstance(resource.get("title"), str) or not resource["title"]:
+            raise CatalogError(f"{at}: missing string 'title'")
+        if resource.get("kind") not in RESOURCE_KINDS:
+            raise CatalogError(f"{at}: 'kind' must be one of {RESOURCE_KINDS}")
+        for field, allowed in (("skills", skills), ("levels", RESOURCE_LEVELS)):
+            if not resource.get(field):
+                raise CatalogError(f"{at}: no {field}")
+            _strings(resource[field], f"{at} {field}", allowed)
+        rating = resource.get("rating", 0)
+        if not isinstance(rating, (int, float)) or isinstance(rating, bool):
+            raise CatalogError(f"{at}: 'rating' must be a number")
+        if not isinstance(resource.get("url", ""), str):
+            raise CatalogError(f"{at}: 'url' must be a string")
+
+
+def validate_questions(data, careers, where="questions.json"):
+    _version(_mapping(data, where), where)
+    _strings(data.get("reverse_scored_phrases", []), f"{where} reverse_scored_phrases")
+    # Bank groups become the trait and interest names the careers are matched on
+    for bank, groups in (("personality", careers["personality_traits"]), ("riasec", careers["career_interests"])):
+        questions = _mapping(data.get(bank), f"{where} {bank}")
+        if list(questions) != list(groups):
+            raise CatalogError(f"{where} {bank}: groups must be {groups} in that order")
+        for group, items in questions.items():
+            if not items:
+                raise CatalogError(f"{where} {bank}[{group!r}]: no questions")
+            _strings(items, f"{where} {bank}[{group!r}]")
+
+
+def _read(directory, name):
+    path = os.path.join(directory, name)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise CatalogError(f"{path}: {e}") from e
+
+
+def signature(directory=None):
+    """(mtime_ns, size) of every catalog file; changes when any file is rewritten."""
+    directory = directory or CATALOG_DIR
+    stats = []
+    for name in CATALOG_FILES:
+        try:
+            st = os.stat(os.path.join(directory, name))
+            stats.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stats.append(None)
+    return tuple(stats)
+
+
+def load_catalog(directory=None):
+    """Read and validate every catalog file. Raises CatalogError."""
+    directory = directory or CATALOG_DIR
+    before = signature(directory)
+    careers = _read(directory, "careers.json")
+    validate_careers(careers)
+    resources = _read(directory, "learning_resources.json")
+    validate_learning_resources(resources, careers)
+    questions = _read(directory, "questions.json")
+    validate_questions(questions, careers)
+    return Catalog(careers, resources, questions, before)
+
+
+# Process-wide Catalog
+_current = None
+_checked_at = 0.0
+_load_lock = threading.Lock()
+_reload_lock = threading.Lock()
+_failed_signature = None
+
+
+def get_catalog():
+    """The current catalog snapshot, starting a reload if the files changed."""
+    global _current, _checked_at
+    current = _current
+    if current is None:
+        with _load_lock:
+            if _current is None:
+                _current = load_catalog().compile_all()
+                _checked_at = time.monotonic()
+            return _current
+    now = time.monotonic()
+    if now - _checked_at >= CATALOG_CHECK_SECONDS:
+        _checked_at = now
+        # _current, not current: a caller holding the previous snapshot must not reload again
+        changed = signature()
+        if changed != _current.signature and changed != _failed_signature and _reload_lock.acquire(blocking=False):
+            threading.Thread(target=_reload_in_background, name="catalog-reload", daemon=True).start()
+    return current
+
+
+def _reload_in_background():
+    try:
+        if signature() != _current.signature:
+            reload()
+    except CatalogError as e:
+        print(f"catalog reload skipped, keeping version {_current.version}: {e}", file=sys.stderr)
+    finally:
+        _reload_lock.release()
+
+
+def reload():
+    """Load, validate and compile the files now, then publish the new snapshot.
+
+    Raises CatalogError and keeps the current snapshot if a file is invalid.
+    """
+    global _current, _failed_signature
+    try:
+        catalog = load_catalog().compile_all()
+    except CatalogError:
+        _failed_signature = signature()
+        raise
+    _failed_signature = None
+    _current = catalog
+    return catalog
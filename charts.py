@@ -0,0 +1,114 @@
+# AI-Powered Career and Skills Advisor - Charts
+# Score charts built straight from plotly graph objects (no DataFrame or
+# plotly.express) and cached by their input scores, so navigating back to
+# a page reuses the figure instead of rebuilding it.
+
+from functools import lru_cache
+
+import plotly.graph_objects as go
+
+import metrics
+
+CHART_CACHE_SIZE = 512
+
+
+def _key(scores):
+    """Hashable, order-preserving key for a {label: score} dict."""
+    return tuple((label, float(value)) for label, value in scores.items())
+
+
+def _bar(labels, values, title, x_title, y_title, colorscale, tickangle=None):
+    fig = go.Figure(go.Bar(
+        x=list(labels),
+        y=list(values),
+        marker=dict(color=list(values), colorscale=colorscale, showscale=True,
+                    colorbar=dict(title=y_title)),
+    ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    if tickangle is not None:
+        fig.update_xaxes(tickangle=tickangle)
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _skills_bar(items):
+    items = items[:10]
+    return _bar([label for label, _ in items], [value for _, value in items],
+                "Top 10 Technical Skills", "Skill", "Proficiency", "Viridis", tickangle=45)
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _top_skills_bar(items):
+    items = sorted(items, key=lambda item: item[1], reverse=True)[:8]
+    return _bar([label for label, _ in items], [value for _, value in items],
+                "Top Skills Proficiency", "Skills", "Proficiency Level", "Viridis", tickangle=45)
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _personality_radar(items):
+    fig = go.Figure(go.Scatterpolar(
+        r=[value for _, value in items],
+        theta=[label for label, _ in items],
+        fill='toself',
+        name='Your Profile'
+    ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[1, 5])),
+        showlegend=True,
+        title="Personality Traits Profile"
+    )
+    return fig
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _interest_bar(items):
+    return _bar([label for label, _ in items], [value for _, value in items],
+                "Career Interest Profile (RIASEC)", "Interest Type", "Score", "Plasma")
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _skill_trend(skill, period, user_points, cohort_points):
+    fig = go.Figure()
+    for name, points, dash in (("You", user_points, None), ("All users", cohort_points, "dot")):
+        if points:
+            fig.add_trace(go.Scatter(x=[start for start, _ in points], y=[score for _, score in points],
+                                     mode="lines+markers", name=name, line=dict(dash=dash)))
+    fig.update_layout(title=f"{skill}: average score per {period}", xaxis_title=period.capitalize(),
+                      yaxis_title="Proficiency", yaxis=dict(range=[1, 7]))
+    return fig
+
+
+# The returned figures are shared between sessions; do not modify them.
+# Each call is timed as a chart.* span, cache hits included.
+@metrics.timed("chart.skills_bar")
+def skills_bar(technical_scores):
+    """First ten skills of the assessment page, as entered."""
+    return _skills_bar(_key(technical_scores))
+
+
+@metrics.timed("chart.top_skills_bar")
+def top_skills_bar(technical_scores):
+    """The eight strongest skills, for the dashboard."""
+    return _top_skills_bar(_key(technical_scores))
+
+
+@metrics.timed("chart.personality_radar")
+def personality_radar(personality_scores):
+    return _personality_radar(_key(personality_scores))
+
+
+@metrics.timed("chart.interest_bar")
+def interest_bar(interest_scores):
+    return _interest_bar(_key(interest_scores))
+
+
+@metrics.timed("chart.skill_trend")
+def skill_trend(skill, period, user_rows, cohort_rows):
+    """A user's (period_start, samples, avg_score) rows against the cohort's, as lines."""
+    return _skill_trend(skill, period, tuple((row[0], float(row[2])) for row in user_rows),
+                        tuple((row[0], float(row[2])) for row in cohort_rows))
+
+
+def clear_cache():
+    for builder in (_skills_bar, _top_skills_bar, _personality_radar, _interest_bar, _skill_trend):
+        builder.cache_clear()
@@ -0,0 +1,170 @@
+# AI-Powered Career and Skills Advisor - Bulk Assessment Ingestion
+# Headless entry point for onboarding whole cohorts from CSV or JSONL exports
+#
+# Each row holds a user_id, an optional ISO-8601 created_at and one column
+# per question, named like the widget keys on the assessment pages:
+#   tech_<skill>           1-7   e.g. "tech_Python Programming"
+#   <Trait>_<i>            1-5   e.g. "Openness_0" .. "Openness_3"
+#   interest_<Type>_<i>    1-5   e.g. "interest_Realistic_0"
+#
+# Usage: python ingest_assessments.py FILE [FILE ...] [--chunk-size 5000] [--db career_advisor.db]
+
+import argparse
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+import repository
+from career_engine import RANKING_DEPTH, get_advisor
+from recommendation_cache import assessment_fingerprint, serialize_ranking
+from scoring import valid_technical
+
+CHUNK_SIZE = 5000
+
+
+class AssessmentLayout:
+    """Column order of an export row, matching the assessment page widget keys."""
+
+    def __init__(self, advisor):
+        self.catalog_version = advisor.catalog_version
+        self.skills = list(advisor.technical_skills)
+        self.tech_columns = [f"tech_{skill}" for skill in self.skills]
+        # The advisor's catalog snapshot throughout, even if the files are edited meanwhile
+        self.personality = advisor.catalog.compiled("personality_bank")
+        self.interests = advisor.catalog.compiled("interest_bank")
+        self.personality_columns = [f"{trait}_{i}" for trait, questions in self.personality.grouped.items()
+                                    for i in range(len(questions))]
+        self.interest_columns = [f"interest_{interest}_{i}" for interest, questions in self.interests.grouped.items()
+                                 for i in range(len(questions))]
+        self.columns = self.tech_columns + self.personality_columns + self.interest_columns
+
+    def parse(self, row):
+        """Return (user_id, created_at, answers) or None if the row is unusable.
+
+        created_at is optional but must be ISO-8601 when given; it comes
+        back in the stored timestamp format.
+        """
+        try:
+            user_id = int(row["user_id"])
+            answers = [float(row[c]) for c in self.columns]
+            created_at = row.get("created_at")
+            created_at = repository.parse_timestamp(created_at) if created_at else None
+        except (KeyError, TypeError, ValueError):
+            return None
+        return user_id, created_at, answers
+
+    def score(self, answers):
+        """Answer matrix (rows x columns) -> valid mask, technical, personality, interest matrices."""
+        n_tech = len(self.tech_columns)
+        n_personality = len(self.personality_columns)
+        tech = answers[:, :n_tech]
+        personality = answers[:, n_tech:n_tech + n_personality]
+        interests = answers[:, n_tech + n_personality:]
+
+        valid = valid_technical(tech) & self.personality.valid(personality) & self.interests.valid(interests)
+        return valid, tech, self.personality.score(personality), self.interests.score(interests)
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl") or path.endswith(".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ingest_chunk(rows, layout, index):
+    """Score and store one chunk in a single transaction. Returns (stored, rejected)."""
+    parsed = [p for p in (layout.parse(row) for row in rows) if p is not None]
+    rejected = len(rows) - len(parsed)
+    if not parsed:
+        return 0, rejected
+
+    catalog = index.catalog
+    answers = np.array([answers for _, _, answers in parsed])
+    valid, tech, personality, interests = layout.score(answers)
+    rejected += int((~valid).sum())
+
+    traits = np.zeros((len(parsed), len(catalog.traits)))
+    for col, trait in enumerate(layout.personality.groups):
+        traits[:, catalog.trait_index[trait]] = personality[:, col]
+    for col, interest in enumerate(layout.interests.groups):
+        traits[:, catalog.trait_index[interest]] = interests[:, col]
+    tech_features = np.zeros((len(parsed), len(catalog.skills)))
+    for col, skill in enumerate(layout.skills):
+        tech_features[:, catalog.skill_index[skill]] = tech[:, col]
+
+    ranked = catalog.to_recommendations(index.top_k(tech_features, traits, RANKING_DEPTH))
+
+    records = []
+    for i in np.flatnonzero(valid):
+        user_id, created_at, _ = parsed[i]
+        technical_skills = dict(zip(layout.skills, tech[i].tolist()))
+        personality_traits = dict(zip(layout.personality.groups, personality[i].tolist()))
+        career_interests = dict(zip(layout.interests.groups, interests[i].tolist()))
+        fingerprint = assessment_fingerprint(technical_skills, personality_traits, career_interests,
+                                             layout.catalog_version)
+        records.append((user_id, technical_skills, personality_traits, career_interests,
+                        serialize_ranking(ranked[i], layout.catalog_version), fingerprint, created_at))
+
+    repository.save_assessments(records)
+    return len(records), rejected
+
+
+def ingest(paths, chunk_size=CHUNK_SIZE, progress=None):
+    """Stream every file through ingest_chunk. Returns (stored, rejected, seconds)."""
+    repository.init_database()
+    advisor = get_advisor()
+    index = advisor.career_index()
+    layout = AssessmentLayout(advisor)
+
+    stored = rejected = 0
+    start = time.perf_counter()
+    for path in paths:
+        for rows in chunks(read_rows(path), chunk_size):
+            ok, bad = ingest_chunk(rows, layout, index)
+            stored += ok
+            rejected += bad
+            if progress:
+                progress(stored, rejected, time.perf_counter() - start)
+    return stored, rejected, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load completed assessments from CSV/JSONL files.")
+    parser.add_argument("files", nargs="+", help=".csv, .jsonl or .ndjson files")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per transaction")
+    parser.add_argument("--db", help="database file (default: CAREER_ADVISOR_DB or career_advisor.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        repository.set_database(args.db)
+
+    def progress(stored, rejected, elapsed):
+        print(f"\r{stored} stored, {rejected} rejected, {stored / elapsed:,.0f} rows/sec",
+              end="", file=sys.stderr)
+
+    stored, rejected, elapsed = ingest(args.files, args.chunk_size, progress)
+    print(file=sys.stderr)
+    print(f"Ingested {stored} assessments ({rejected} rejected) in {elapsed:.2f}s "
+          f"- {stored / elapsed if elapsed else 0:,.0f} rows/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
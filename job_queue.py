@@ -0,0 +1,302 @@
+# AI-Powered Career and Skills Advisor - Background Jobs
+# A local job queue stored in the jobs table and drained by a pool of worker
+# threads, so scoring, model inference and persistence run off the Streamlit
+# script thread. Pages submit a job, then poll get_job() until it is done.
+#
+# - Backpressure: submit() raises QueueFull once MAX_QUEUED_JOBS are waiting.
+# - Retries: a failing job is requeued with exponential backoff until it has
+#   been tried max_attempts times, then marked failed with the error.
+# - Deduplication: a job with the dedupe_key of a queued or running job, or
+#   of one done within DEDUPE_DONE_SECONDS, returns that job instead, so
+#   recent results double as a cache.
+# - Retention: workers delete done and failed jobs JOB_RETENTION_HOURS after
+#   they finished.
+# - Metrics: enqueue, start and finish times are kept per job; queue_stats()
+#   reports depth by status and wait/run percentiles by kind.
+# - Jobs left running by a process that died are requeued (or failed, if out
+#   of attempts) when workers start, once STALE_JOB_SECONDS have passed.
+#
+# Workers start with the app (CAREER_JOB_WORKERS, 0 to disable) or as a
+# separate process:
+#   python job_queue.py [--workers 4] [--db career_advisor.db]
+
+import argparse
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+
+import metrics
+import repository
+
+JOB_WORKERS = int(os.environ.get("CAREER_JOB_WORKERS", "2"))
+MAX_QUEUED_JOBS = int(os.environ.get("CAREER_MAX_QUEUED_JOBS", "1000"))
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+STALE_JOB_SECONDS = 300
+POLL_SECONDS = 0.5
+STATS_WINDOW = 1000
+# Same bound as the recommendation cache's time to live
+DEDUPE_DONE_SECONDS = 60 * 60
+JOB_RETENTION_HOURS = float(os.environ.get("CAREER_JOB_RETENTION_HOURS", "24"))
+PRUNE_INTERVAL_SECONDS = 60
+
+PENDING = ("queued", "running")
+
+
+class QueueFull(Exception):
+    """Too many jobs are already waiting."""
+
+
+# Handlers
+HANDLERS = {}
+
+
+def handler(kind):
+    """Register fn(payload) -> JSON-serializable result as the handler for kind."""
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+@handler("recommend")
+def _recommend(payload):
+    from recommendation_cache import get_recommendations, serialize_ranking
+
+    fingerprint, ranking = get_recommendations(payload["user_id"], payload["technical_skills"],
+                                               payload["personality_traits"], payload["career_interests"])
+    return {"fingerprint": fingerprint, "recommendations": serialize_ranking(ranking)}
+
+
+@handler("save_assessment")
+def _save_assessment(payload):
+    repository.save_assessment(payload["user_id"], payload["technical_skills"], payload["personality_traits"],
+                               payload["career_interests"], payload["recommendations"], payload.get("fingerprint"))
+
+
+# Queue
+_done = threading.Condition()
+
+
+def submit(kind, payload, dedupe_key=None, max_attempts=MAX_ATTEMPTS):
+    """Queue a job and return its id (or the id of the job it duplicates)."""
+    if kind not in HANDLERS:
+        raise ValueError(f"unknown job kind {kind!r}; expected one of {sorted(HANDLERS)}")
+    with repository.connection() as conn:
+        if dedupe_key is not None:
+            row = conn.execute("""SELECT id FROM jobs WHERE kind = ? AND dedupe_key = ?
+                               AND (status IN ('queued', 'running') OR (status = 'done' AND finished_at >= ?))
+                               ORDER BY id DESC LIMIT 1""",
+                               (kind, dedupe_key, time.time() - DEDUPE_DONE_SECONDS)).fetchone()
+            if row is not None:
+                return row[0]
+        depth = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+        if depth >= MAX_QUEUED_JOBS:
+            raise QueueFull(f"{depth} jobs already queued")
+        now = time.time()
+        job_id = conn.execute("""INSERT INTO jobs (kind, payload, dedupe_key, status, attempts, max_attempts,
+                                                   run_after, enqueued_at)
+                              VALUES (?, ?, ?, 'queued', 0, ?, ?, ?)""",
+                              (kind, json.dumps(payload), dedupe_key, max_attempts, now, now)).lastrowid
+    get_workers().wake()
+    return job_id
+
+
+def get_job(job_id):
+    """The job as a dict (status, result, error, attempts, timings), or None."""
+    with repository.connection() as conn:
+        row = conn.execute("""SELECT id, kind, status, result, error, attempts, enqueued_at, started_at, finished_at
+                           FROM jobs WHERE id = ?""", (job_id,)).fetchone()
+    if row is None:
+        return None
+    job = dict(row)
+    job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+    return job
+
+
+def wait_for(job_id, timeout):
+    """Wait up to timeout seconds for the job to finish; returns get_job()."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = get_job(job_id)
+        remaining = deadline - time.monotonic()
+        if job is None or job["status"] not in PENDING or remaining <= 0:
+            return job
+        with _done:
+            _done.wait(min(remaining, POLL_SECONDS))
+
+
+def queue_stats():
+    """Queue depth by status and wait/run milliseconds by kind over recent jobs."""
+    with repository.connection() as conn:
+        depth = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        rows = conn.execute("""SELECT kind, status, attempts, started_at - enqueued_at, finished_at - started_at
+                            FROM jobs WHERE status IN ('done', 'failed')
+                            ORDER BY finished_at DESC LIMIT ?""", (STATS_WINDOW,)).fetchall()
+    kinds = {}
+    for kind, status, attempts, wait, run in rows:
+        stats = kinds.setdefault(kind, {"done": 0, "failed": 0, "retried": 0, "wait": [], "run": []})
+        stats[status] += 1
+        stats["retried"] += attempts > 1
+        stats["wait"].append(wait * 1000)
+        stats["run"].append(run * 1000)
+    for stats in kinds.values():
+        for key in ("wait", "run"):
+            values = sorted(stats.pop(key))
+            stats[f"{key}_p50_ms"] = values[len(values) // 2]
+            stats[f"{key}_p95_ms"] = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return {"depth": {status: depth.get(status, 0) for status in ("queued", "running", "done", "failed")},
+            "kinds": kinds}
+
+
+def prune_finished(older_than=None):
+    """Delete done and failed jobs that finished more than older_than seconds ago; returns how many."""
+    if older_than is None:
+        older_than = JOB_RETENTION_HOURS * 3600
+    with repository.connection() as conn:
+        return conn.execute("DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                            (time.time() - older_than,)).rowcount
+
+
+# Workers
+def _claim(conn):
+    now = time.time()
+    return conn.execute("""UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1
+                        WHERE id = (SELECT id FROM jobs WHERE status = 'queued' AND run_after <= ?
+                                    ORDER BY run_after, id LIMIT 1)
+                        RETURNING id, kind, payload, attempts, max_attempts""", (now, now)).fetchone()
+
+
+def _requeue_stale(conn):
+    now = time.time()
+    conn.execute("""UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                                    finished_at = CASE WHEN attempts >= max_attempts THEN ? END,
+                                    error = 'worker stopped before finishing', run_after = ?
+                 WHERE status = 'running' AND started_at < ?""", (now, now, now - STALE_JOB_SECONDS))
+
+
+def run_one():
+    """Claim and run one queued job. Returns False when nothing was due."""
+    with repository.connection() as conn:
+        job = _claim(conn)
+    if job is None:
+        return False
+    job_id, kind, payload, attempts, max_attempts = job
+    try:
+        with metrics.span(f"job.{kind}"):
+            result = HANDLERS[kind](json.loads(payload))
+    except Exception:
+        error = traceback.format_exc(limit=5)
+        with repository.connection() as conn:
+            if attempts < max_attempts:
+                conn.execute("UPDATE jobs SET status = 'queued', error = ?, run_after = ? WHERE id = ?",
+                             (error, time.time() + RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1), job_id))
+            else:
+                conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                             (error, time.time(), job_id))
+    else:
+        with repository.connection() as conn:
+            conn.execute("UPDATE jobs SET status = 'done', result = ?, error = NULL, finished_at = ? WHERE id = ?",
+                         (json.dumps(result) if result is not None else None, time.time(), job_id))
+    with _done:
+        _done.notify_all()
+    return True
+
+
+class WorkerPool:
+    """Threads that drain the queue until stopped."""
+
+    def __init__(self, workers=JOB_WORKERS):
+        self.workers = workers
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def start(self):
+        if self._threads or not self.workers:
+            return self
+        with repository.connection() as conn:
+            _requeue_stale(conn)
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _sweep_due(self):
+        """True for the one worker that should prune finished jobs now."""
+        with self._sweep_lock:
+            now = time.monotonic()
+            if now < self._next_sweep:
+                return False
+            self._next_sweep = now + PRUNE_INTERVAL_SECONDS
+            return True
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.clear()
+            try:
+                if self._sweep_due():
+                    prune_finished()
+                if run_one():
+                    continue
+            except sqlite3.Error:
+                traceback.print_exc()
+            # Nothing due: sleep until a submit wakes us or a retry comes due
+            self._wake.wait(POLL_SECONDS)
+
+
+_workers = None
+_workers_lock = threading.Lock()
+
+
+def get_workers():
+    """The process-wide worker pool, started on first use."""
+    global _workers
+    if _workers is None:
+        with _workers_lock:
+            if _workers is None:
+                _workers = WorkerPool().start()
+                atexit.register(_workers.stop)
+    return _workers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run background job workers.")
+    parser.add_argument("--workers", type=int, default=max(JOB_WORKERS, 1))
+    parser.add_argument("--db", help="database file (default: CAREER_ADVISOR_DB or career_advisor.db)")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        repository.set_database(args.db)
+    pool = WorkerPool(args.workers).start()
+    print(f"{args.workers} workers running on {repository.DB_PATH}; Ctrl+C to stop", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(10)
+            stats = queue_stats()
+            print(f"depth {stats['depth']}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# AI-Powered Career and Skills Advisor - Learning Paths
+# Resources from data/learning_resources.json are compiled, once per catalog
+# snapshot, into an inverted index from (skill, proficiency band) to
+# resources already ranked within each kind, so a page lookup is a dict get
+# and a slice. learning_path() picks the user's skill gaps and orders them by
+# how much closing each one would raise their best career match scores.
+
+import numpy as np
+
+import catalog_store
+from career_engine import get_advisor
+
+# Proficiency bands over the 1-7 technical scale, matching resource "levels"
+PROFICIENCY_BANDS = (("beginner", 1, 2), ("intermediate", 3, 4), ("advanced", 5, 7))
+
+# Skills scored below this need improvement; a path assumes it raises them to it
+IMPROVED_LEVEL = 5
+PATH_SKILLS = 5
+RESOURCES_PER_KIND = 3
+# Gain is measured on the mean score of this many best-matching careers
+GAIN_TOP_CAREERS = 5
+
+
+def proficiency_band(score):
+    for band, low, high in PROFICIENCY_BANDS:
+        if score <= high:
+            return band
+    return PROFICIENCY_BANDS[-1][0]
+
+
+class ResourceIndex:
+    """Resources by (skill, band), ranked per kind by rating, then file order.
+
+    (skill, None) holds every band, as the fallback when a skill has no
+    resources at the user's level.
+    """
+
+    def __init__(self, resources):
+        ranked = sorted(enumerate(resources), key=lambda item: (-item[1].get("rating", 0), item[0]))
+        postings = {}
+        for _, resource in ranked:
+            for skill in resource["skills"]:
+                for band in list(resource["levels"]) + [None]:
+                    postings.setdefault((skill, band), {}).setdefault(resource["kind"], []).append(resource)
+        self._postings = {key: {kind: tuple(items) for kind, items in by_kind.items()}
+                          for key, by_kind in postings.items()}
+
+    def __len__(self):
+        return len(self._postings)
+
+    def top(self, skill, score, limit=RESOURCES_PER_KIND):
+        """{kind: best resources} for a skill at the user's proficiency; {} if none."""
+        by_kind = self._postings.get((skill, proficiency_band(score))) or self._postings.get((skill, None), {})
+        return {kind: by_kind[kind][:limit] for kind in catalog_store.RESOURCE_KINDS if kind in by_kind}
+
+
+@catalog_store.compiler("resource_index")
+def _compile_resource_index(catalog):
+    return ResourceIndex(catalog.learning_resources)
+
+
+def skill_gains(technical_scores, personality_scores, interest_scores, skills, advisor=None):
+    """Expected match-score gain from raising each skill to IMPROVED_LEVEL.
+
+    The gain is how much the mean score of the user's GAIN_TOP_CAREERS best
+    careers (as calculate_career_match would rank them) rises; the careers
+    may change as the skill does.
+    """
+    advisor = advisor or get_advisor()
+    catalog = advisor.compile_catalog()
+    tech, traits = catalog.encode_users([technical_scores], [personality_scores], [interest_scores])
+    base, _, personality_match = catalog.score(tech, traits)
+    deltas = np.zeros((len(skills), len(catalog.skills)))
+    for row, skill in enumerate(skills):
+        col = catalog.skill_index.get(skill)
+        if col is not None:
+            deltas[row, col] = max(IMPROVED_LEVEL - technical_scores[skill], 0)
+    scenarios = np.vstack([base, catalog.score_deltas(catalog.tech_sums(tech)[0], personality_match[0], deltas)[0]])
+    top = min(GAIN_TOP_CAREERS, scenarios.shape[1])
+    means = -np.partition(-scenarios, top - 1, axis=1)[:, :top].mean(axis=1)
+    return dict(zip(skills, (means[1:] - means[0]).tolist()))
+
+
+def learning_path(technical_scores, personality_scores=None, interest_scores=None,
+                  max_skills=PATH_SKILLS, limit=RESOURCES_PER_KIND):
+    """The user's skill gaps, biggest expected gain first, each with its top resources.
+
+    Returns a list of {"skill", "score", "band", "gain", "resources"} dicts;
+    gains tie-break on the weaker skill.
+    """
+    gaps = [skill for skill, score in technical_scores.items() if score < IMPROVED_LEVEL]
+    if not gaps:
+        return []
+    # One snapshot for both, so resources and careers agree
+    advisor = get_advisor()
+    index = advisor.catalog.compiled("resource_index")
+    gains = skill_gains(technical_scores, personality_scores or {}, interest_scores or {}, gaps, advisor)
+    gaps.sort(key=lambda skill: (-round(gains[skill], 9), technical_scores[skill]))
+    return [
+        {
+            "skill": skill,
+            "score": technical_scores[skill],
+            "band": proficiency_band(technical_scores[skill]),
+            "gain": gains[skill],
+            "resources": index.top(skill, technical_scores[skill], limit),
+        }
+        for skill in gaps[:max_skills]
+    ]
@@ -1,21 +1,22 @@
 # AI-Powered Career and Skills Advisor - Complete Prototype
 # Main Application File
 
+# Only what the login screen needs is imported here. pandas, plotly, numpy,
+# the charts and the scoring modules are imported inside the pages that use
+# them, so a cold start renders the login form without loading them.
+# benchmarks/import_time.py checks this against a budget.
+import time
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import json
-import pickle
-from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-from sklearn.neighbors import KNeighborsClassifier
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-import sqlite3
-import hashlib
+import metrics
+import repository
+import session_store
+from passwords import HasherBusy
+from repository import create_user, verify_user
+
+# How long the recommendations page waits inline for its scoring job before
+# showing a progress message and polling
+RECOMMENDATION_WAIT_SECONDS = 1.0
 
 # Page Configuration
 st.set_page_config(
@@ -32,171 +33,6 @@ if 'user_data' not in st.session_state:
 if 'assessment_complete' not in st.session_state:
     st.session_state.assessment_complete = False
 
-# Database Setup
-def init_database():
-    conn = sqlite3.connect('career_advisor.db')
-    c = conn.cursor()
-    
-    # Users table
-    c.execute('''CREATE TABLE IF NOT EXISTS users
-                 (id INTEGER PRIMARY KEY, 
-                  username TEXT UNIQUE, 
-                  password TEXT, 
-                  email TEXT,
-                  created_at TIMESTAMP)''')
-    
-    # Assessments table
-    c.execute('''CREATE TABLE IF NOT EXISTS assessments
-                 (id INTEGER PRIMARY KEY,
-                  user_id INTEGER,
-                  technical_skills TEXT,
-                  personality_traits TEXT,
-                  career_interests TEXT,
-                  recommendations TEXT,
-                  created_at TIMESTAMP,
-                  FOREIGN KEY(user_id) REFERENCES users(id))''')
-    
-    # Progress tracking table
-    c.execute('''CREATE TABLE IF NOT EXISTS progress
-                 (id INTEGER PRIMARY KEY,
-                  user_id INTEGER,
-                  goal_type TEXT,
-                  goal_description TEXT,
-                  target_date TEXT,
-                  completion_status TEXT,
-                  created_at TIMESTAMP,
-                  FOREIGN KEY(user_id) REFERENCES users(id))''')
-    
-    conn.commit()
-    conn.close()
-
-# Authentication Functions
-def hash_password(password):
-    return hashlib.sha256(str.encode(password)).hexdigest()
-
-def create_user(username, password, email):
-    conn = sqlite3.connect('career_advisor.db')
-    c = conn.cursor()
-    try:
-        hashed_pw = hash_password(password)
-        c.execute("INSERT INTO users (username, password, email, created_at) VALUES (?, ?, ?, ?)",
-                  (username, hashed_pw, email, datetime.now()))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        return False
-    finally:
-        conn.close()
-
-def verify_user(username, password):
-    conn = sqlite3.connect('career_advisor.db')
-    c = conn.cursor()
-    hashed_pw = hash_password(password)
-    c.execute("SELECT id, username FROM users WHERE username=? AND password=?", 
-              (username, hashed_pw))
-    user = c.fetchone()
-    conn.close()
-    return user
-
-# Career Data and Models
-class CareerAdvisor:
-    def __init__(self):
-        self.technical_skills = [
-            "Python Programming", "Java Programming", "JavaScript", "Database Management",
-            "Web Development", "Mobile Development", "Data Structures & Algorithms",
-            "Machine Learning", "Artificial Intelligence", "Cybersecurity",
-            "Cloud Computing", "DevOps", "Software Testing", "System Design",
-            "Computer Networks", "UI/UX Design", "Project Management"
-        ]
-        
-        self.personality_traits = [
-            "Openness", "Conscientiousness", "Extraversion", 
-            "Agreeableness", "Neuroticism"
-        ]
-        
-        self.career_interests = [
-            "Realistic", "Investigative", "Artistic", 
-            "Social", "Enterprising", "Conventional"
-        ]
-        
-        self.career_paths = {
-            "Software Developer": {
-                "description": "Design and develop software applications and systems",
-                "key_skills": ["Python Programming", "Java Programming", "Software Testing"],
-                "salary_range": "$70K - $120K",
-                "growth_rate": "25%",
-                "personality_fit": ["Conscientiousness", "Openness"]
-            },
-            "Data Scientist": {
-                "description": "Analyze complex data to extract insights and build predictive models",
-                "key_skills": ["Machine Learning", "Python Programming", "Data Structures & Algorithms"],
-                "salary_range": "$90K - $150K",
-                "growth_rate": "35%",
-                "personality_fit": ["Openness", "Conscientiousness"]
-            },
-            "Cybersecurity Analyst": {
-                "description": "Protect organizations from cyber threats and security breaches",
-                "key_skills": ["Cybersecurity", "Computer Networks", "System Design"],
-                "salary_range": "$80K - $130K",
-                "growth_rate": "28%",
-                "personality_fit": ["Conscientiousness", "Investigative"]
-            },
-            "AI Engineer": {
-                "description": "Develop and implement artificial intelligence solutions",
-                "key_skills": ["Artificial Intelligence", "Machine Learning", "Python Programming"],
-                "salary_range": "$100K - $160K",
-                "growth_rate": "40%",
-                "personality_fit": ["Openness", "Investigative"]
-            },
-            "Full Stack Developer": {
-                "description": "Develop both frontend and backend of web applications",
-                "key_skills": ["Web Development", "JavaScript", "Database Management"],
-                "salary_range": "$75K - $125K",
-                "growth_rate": "30%",
-                "personality_fit": ["Conscientiousness", "Openness"]
-            },
-            "Product Manager": {
-                "description": "Lead product development and strategy",
-                "key_skills": ["Project Management", "UI/UX Design", "System Design"],
-                "salary_range": "$95K - $140K",
-                "growth_rate": "20%",
-                "personality_fit": ["Extraversion", "Enterprising"]
-            }
-        }
-    
-    def calculate_career_match(self, technical_scores, personality_scores, interest_scores):
-        recommendations = []
-        
-        for career, details in self.career_paths.items():
-            # Technical skill match
-            tech_match = 0
-            for skill in details["key_skills"]:
-                if skill in technical_scores:
-                    tech_match += technical_scores[skill]
-            tech_match = tech_match / len(details["key_skills"]) if details["key_skills"] else 0
-            
-            # Personality match
-            personality_match = 0
-            for trait in details["personality_fit"]:
-                if trait in personality_scores:
-                    personality_match += personality_scores[trait]
-                elif trait in interest_scores:
-                    personality_match += interest_scores[trait]
-            personality_match = personality_match / len(details["personality_fit"]) if details["personality_fit"] else 0
-            
-            # Overall match score
-            overall_score = (tech_match * 0.6) + (personality_match * 0.4)
-            
-            recommendations.append({
-                "career": career,
-                "score": overall_score,
-                "details": details,
-                "tech_match": tech_match,
-                "personality_match": personality_match
-            })
-        
-        return sorted(recommendations, key=lambda x: x['score'], reverse=True)
-
 # Authentication UI
 def authentication_page():
     st.title("🎓 AI Career and Skills Advisor")
@@ -210,11 +46,19 @@ def authentication_page():
         password = st.text_input("Password", type="password", key="login_password")
         
         if st.button("Login"):
-            user = verify_user(username, password)
+            try:
+                user = verify_user(username, password)
+            except HasherBusy:
+                st.error("Too many sign-ins right now, please try again in a moment")
+                return
             if user:
                 st.session_state.logged_in = True
                 st.session_state.user_id = user[0]
                 st.session_state.username = user[1]
+                # Debug page access (users.is_admin, set with admin_users.py)
+                st.session_state.is_admin = repository.is_admin(user[0])
+                # Profile and scores saved from earlier visits
+                st.session_state.user_data = session_store.get_store().get(user[0])
                 st.success("Login successful!")
                 st.rerun()
             else:
@@ -229,7 +73,12 @@ def authentication_page():
         
         if st.button("Register"):
             if new_password == confirm_password:
-                if create_user(new_username, new_password, new_email):
+                try:
+                    created = create_user(new_username, new_password, new_email)
+                except HasherBusy:
+                    st.error("Too many sign-ins right now, please try again in a moment")
+                    return
+                if created:
                     st.success("Account created successfully! Please login.")
                 else:
                     st.error("Username already exists")
@@ -275,10 +124,13 @@ def profile_page():
 
 # Skills Assessment
 def skills_assessment_page():
+    import charts
+    from career_engine import get_advisor
+
     st.title("🛠️ Technical Skills Assessment")
     st.markdown("Rate your proficiency level for each skill (1 = Beginner, 7 = Expert)")
     
-    advisor = CareerAdvisor()
+    advisor = get_advisor()
     technical_scores = {}
     
     # Create skills assessment grid
@@ -305,104 +157,41 @@ def skills_assessment_page():
     if st.button("Analyze Skills"):
         st.subheader("📊 Your Skills Profile")
         
-        # Create radar chart
-        skills_df = pd.DataFrame(list(technical_scores.items()), 
-                               columns=['Skill', 'Proficiency'])
-        
-        fig = px.bar(skills_df.head(10), x='Skill', y='Proficiency', 
-                     title="Top 10 Technical Skills",
-                     color='Proficiency',
-                     color_continuous_scale='viridis')
-        if fig is not None:
-            fig.update_xaxes(tickangle=45)
-
-
+        fig = charts.skills_bar(technical_scores)
         st.plotly_chart(fig, use_container_width=True)
         
         st.session_state.user_data['technical_skills'] = technical_scores
+        st.session_state.user_data['skill_summary'] = skill_summary(technical_scores)
         st.success("Technical skills assessment completed!")
 
 # Personality Assessment
 def personality_assessment_page():
+    import charts
+    from scoring import personality_bank
+
     st.title("🧠 Personality Assessment")
     st.markdown("Answer these questions honestly to understand your personality traits")
     
-    # Big Five Personality Test Questions
-    personality_questions = {
-        "Openness": [
-            "I enjoy exploring new ideas and concepts",
-            "I am creative and imaginative",
-            "I prefer routine and familiar tasks",
-            "I am curious about different fields of study"
-        ],
-        "Conscientiousness": [
-            "I am organized and methodical in my work",
-            "I complete tasks on time",
-            "I pay attention to details",
-            "I plan ahead for projects"
-        ],
-        "Extraversion": [
-            "I enjoy working in teams",
-            "I am comfortable speaking in public",
-            "I prefer working alone",
-            "I am energized by social interactions"
-        ],
-        "Agreeableness": [
-            "I enjoy helping others",
-            "I am cooperative in group settings",
-            "I trust others easily",
-            "I avoid conflicts when possible"
-        ],
-        "Neuroticism": [
-            "I remain calm under pressure",
-            "I worry about deadlines",
-            "I get stressed easily",
-            "I handle criticism well"
-        ]
-    }
-    
-    personality_scores = {}
-    
-    for trait, questions in personality_questions.items():
+    bank = personality_bank()
+    answers = []
+    
+    for trait, questions in bank.grouped.items():
         st.subheader(f"{trait}")
-        trait_scores = []
         
         for i, question in enumerate(questions):
-            score = st.slider(
+            answers.append(st.slider(
                 question, 1, 5, 3,
                 key=f"{trait}_{i}",
                 help="1 = Strongly Disagree, 5 = Strongly Agree"
-            )
-            # Reverse scoring for negative items
-            if "prefer routine" in question or "prefer working alone" in question or "get stressed easily" in question or "worry about" in question:
-                score = 6 - score
-            trait_scores.append(score)
-        
-        personality_scores[trait] = np.mean(trait_scores)
+            ))
+    
+    # Reverse-keyed items are handled by the scoring module
+    personality_scores = bank.profile(answers)
     
     if st.button("Complete Personality Assessment"):
         st.subheader("🎯 Your Personality Profile")
         
-        # Create personality radar chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatterpolar(
-            r=list(personality_scores.values()),
-            theta=list(personality_scores.keys()),
-            fill='toself',
-            name='Your Profile'
-        ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[1, 5]
-                )),
-            showlegend=True,
-            title="Personality Traits Profile"
-        )
-        
+        fig = charts.personality_radar(personality_scores)
         st.plotly_chart(fig, use_container_width=True)
         
         st.session_state.user_data['personality_traits'] = personality_scores
@@ -410,69 +199,31 @@ def personality_assessment_page():
 
 # Career Interest Assessment (RIASEC)
 def career_interest_page():
+    import charts
+    from scoring import interest_bank
+
     st.title("🎯 Career Interest Assessment")
     st.markdown("Based on Holland's Career Interest Model (RIASEC)")
     
-    riasec_questions = {
-        "Realistic": [
-            "I enjoy working with tools and machines",
-            "I like hands-on problem solving",
-            "I prefer practical applications over theory"
-        ],
-        "Investigative": [
-            "I enjoy analyzing data and research",
-            "I like solving complex problems",
-            "I am curious about how things work"
-        ],
-        "Artistic": [
-            "I enjoy creative and innovative work",
-            "I like designing and creating new things",
-            "I value self-expression in my work"
-        ],
-        "Social": [
-            "I enjoy helping and teaching others",
-            "I like working in team environments",
-            "I am motivated by making a positive impact"
-        ],
-        "Enterprising": [
-            "I enjoy leading and managing projects",
-            "I like taking on business challenges",
-            "I am motivated by achieving goals"
-        ],
-        "Conventional": [
-            "I enjoy organized and structured work",
-            "I like following established procedures",
-            "I am detail-oriented and systematic"
-        ]
-    }
-    
-    interest_scores = {}
-    
-    for interest, questions in riasec_questions.items():
+    bank = interest_bank()
+    answers = []
+    
+    for interest, questions in bank.grouped.items():
         st.subheader(f"{interest}")
-        interest_score_list = []
         
         for i, question in enumerate(questions):
-            score = st.slider(
+            answers.append(st.slider(
                 question, 1, 5, 3,
                 key=f"interest_{interest}_{i}",
                 help="1 = Not at all, 5 = Very much"
-            )
-            interest_score_list.append(score)
-        
-        interest_scores[interest] = np.mean(interest_score_list)
+            ))
+    
+    interest_scores = bank.profile(answers)
     
     if st.button("Complete Interest Assessment"):
         st.subheader("📈 Your Interest Profile")
         
-        # Create interest bar chart
-        interest_df = pd.DataFrame(list(interest_scores.items()), 
-                                 columns=['Interest Type', 'Score'])
-        
-        fig = px.bar(interest_df, x='Interest Type', y='Score',
-                     title="Career Interest Profile (RIASEC)",
-                     color='Score',
-                     color_continuous_scale='plasma')
+        fig = charts.interest_bar(interest_scores)
         st.plotly_chart(fig, use_container_width=True)
         
         st.session_state.user_data['career_interests'] = interest_scores
@@ -480,21 +231,77 @@ def career_interest_page():
 
 # Career Recommendations
 def recommendations_page():
+    import job_queue
+    from recommendation_cache import (cached_recommendations, load_ranking, load_saved_recommendations,
+                                      serialize_ranking)
+
     st.title("🎯 Career Recommendations")
     
-    if not all(key in st.session_state.user_data for key in ['technical_skills', 'personality_traits', 'career_interests']):
-        st.warning("Please complete all assessments first!")
-        return
+    user_data = st.session_state.user_data
     
-    advisor = CareerAdvisor()
+    if not all(key in user_data for key in ['technical_skills', 'personality_traits', 'career_interests']):
+        # Returning users get their stored ranking without rescoring
+        saved = load_saved_recommendations(st.session_state.user_id)
+        if saved is None:
+            st.warning("Please complete all assessments first!")
+            return
+        st.info("Showing the recommendations from your last saved assessment.")
+        show_recommendations(saved)
+        return
     
-    # Get recommendations
-    recommendations = advisor.calculate_career_match(
-        st.session_state.user_data['technical_skills'],
-        st.session_state.user_data['personality_traits'],
-        st.session_state.user_data['career_interests']
+    # Get recommendations (memoized on the assessment fingerprint); a miss is
+    # scored by a background job that this page polls
+    fingerprint, recommendations = cached_recommendations(
+        user_data['technical_skills'],
+        user_data['personality_traits'],
+        user_data['career_interests']
     )
+    if recommendations is None:
+        try:
+            job_id = job_queue.submit("recommend", {
+                'user_id': st.session_state.user_id,
+                'technical_skills': user_data['technical_skills'],
+                'personality_traits': user_data['personality_traits'],
+                'career_interests': user_data['career_interests'],
+            }, dedupe_key=fingerprint)
+        except job_queue.QueueFull:
+            st.warning("The advisor is busy right now. Please try again in a moment.")
+            return
+        job = job_queue.wait_for(job_id, timeout=RECOMMENDATION_WAIT_SECONDS)
+        if job['status'] == 'failed':
+            st.error("Sorry, we could not compute your recommendations. Please try again.")
+            return
+        if job['status'] != 'done':
+            st.info("⏳ Working out your career matches...")
+            time.sleep(job_queue.POLL_SECONDS)
+            st.rerun()
+        fingerprint = job['result']['fingerprint']
+        recommendations = load_ranking(job['result']['recommendations'])
+        if recommendations is None:
+            # Ranked under a catalog that was reloaded meanwhile; the rerun
+            # fingerprints against the current catalog and submits again,
+            # but only once, so a worker that lags behind cannot loop the page
+            if st.session_state.get('recommendations_stale'):
+                st.session_state.recommendations_stale = False
+                st.error("Sorry, we could not compute your recommendations. Please try again.")
+                return
+            st.session_state.recommendations_stale = True
+            st.rerun()
+        st.session_state.recommendations_stale = False
+        user_data['recommendations'] = job['result']['recommendations']
+    else:
+        user_data['recommendations'] = serialize_ranking(recommendations)
+    user_data['assessment_fingerprint'] = fingerprint
+    
+    show_recommendations(recommendations)
+    show_what_if(user_data)
     
+    # Save recommendations to database
+    if st.button("Save Recommendations"):
+        st.session_state.save_job_id = save_assessment_to_db()
+    show_save_status()
+
+def show_recommendations(recommendations):
     st.subheader("🏆 Top Career Matches for You")
     
     for i, rec in enumerate(recommendations[:5]):
@@ -509,36 +316,77 @@ def recommendations_page():
             with col2:
                 st.write(f"**Technical Match:** {rec['tech_match']:.1f}/7")
                 st.write(f"**Personality Match:** {rec['personality_match']:.1f}/7")
+                if 'model_probability' in rec:
+                    st.write(f"**Model Confidence:** {rec['model_probability']:.0%}")
                 st.write("**Key Skills:**")
                 for skill in rec['details']['key_skills']:
                     st.write(f"- {skill}")
-    
-    # Save recommendations to database
-    if st.button("Save Recommendations"):
-        save_assessment_to_db()
-        st.success("Recommendations saved to your profile!")
+
+def show_what_if(user_data):
+    from what_if import TECH_LEVELS, WhatIf
+
+    st.subheader("🔮 What If?")
+    st.write("See how your top matches would move if you changed one skill.")
+    
+    technical_skills = user_data['technical_skills']
+    simulator = WhatIf(technical_skills, user_data['personality_traits'], user_data['career_interests'])
+    skill = st.selectbox("Skill", list(technical_skills), key="what_if_skill")
+    level = st.slider(f"New {skill} level", TECH_LEVELS[0], TECH_LEVELS[-1], int(technical_skills[skill]),
+                      key=f"what_if_{skill}")
+    
+    ranked = simulator.rankings([{skill: level}])[0]
+    before = simulator.positions([rec['career'] for rec in ranked])
+    for i, (rec, position) in enumerate(zip(ranked, before)):
+        moved = int(position) - (i + 1)
+        change = f"▲{moved}" if moved > 0 else f"▼{-moved}" if moved < 0 else "–"
+        st.write(f"#{i+1} {rec['career']} - {rec['score']:.2f}/7 ({change})")
 
 def save_assessment_to_db():
-    conn = sqlite3.connect('career_advisor.db')
-    c = conn.cursor()
-    
+    """Queue the assessment for saving; the job id, or None (with a warning shown) if the queue is full."""
+    import job_queue
+
     user_data = st.session_state.user_data
-    
-    c.execute("""INSERT INTO assessments 
-                 (user_id, technical_skills, personality_traits, career_interests, recommendations, created_at)
-                 VALUES (?, ?, ?, ?, ?, ?)""",
-              (st.session_state.user_id,
-               json.dumps(user_data.get('technical_skills', {})),
-               json.dumps(user_data.get('personality_traits', {})),
-               json.dumps(user_data.get('career_interests', {})),
-               json.dumps(user_data.get('recommendations', {})),
-               datetime.now()))
-    
-    conn.commit()
-    conn.close()
+    try:
+        return job_queue.submit("save_assessment", {
+            'user_id': st.session_state.user_id,
+            'technical_skills': user_data.get('technical_skills', {}),
+            'personality_traits': user_data.get('personality_traits', {}),
+            'career_interests': user_data.get('career_interests', {}),
+            'recommendations': user_data.get('recommendations', {}),
+            'fingerprint': user_data.get('assessment_fingerprint'),
+        })
+    except job_queue.QueueFull:
+        st.warning("The advisor is busy right now. Please try saving again in a moment.")
+        return None
+
+def show_save_status():
+    """Report the queued save until its job finishes, then whether it worked."""
+    import job_queue
+
+    job_id = st.session_state.get('save_job_id')
+    if job_id is None:
+        return
+    job = job_queue.wait_for(job_id, timeout=RECOMMENDATION_WAIT_SECONDS)
+    if job is not None and job['status'] in job_queue.PENDING:
+        st.info("💾 Saving your recommendations...")
+        time.sleep(job_queue.POLL_SECONDS)
+        st.rerun()
+    st.session_state.save_job_id = None
+    if job is None or job['status'] == 'failed':
+        st.error("Sorry, we could not save your recommendations. Please try again.")
+    else:
+        st.success("Recommendations saved to your profile!")
 
 # Learning Resources
+RESOURCE_HEADINGS = {
+    "course": "**📖 Recommended Courses:**",
+    "certification": "**🏆 Certifications:**",
+    "project": "**🛠️ Practice Projects:**",
+}
+
 def learning_resources_page():
+    from learning_paths import IMPROVED_LEVEL, learning_path
+
     st.title("📚 Personalized Learning Resources")
     
     if 'technical_skills' not in st.session_state.user_data:
@@ -546,51 +394,57 @@ def learning_resources_page():
         return
     
     # Identify skill gaps and recommend resources
-    technical_skills = st.session_state.user_data['technical_skills']
+    user_data = st.session_state.user_data
     
     st.subheader("🎯 Recommended Learning Paths")
-    
-    # Skills that need improvement (score < 5)
-    improvement_skills = {k: v for k, v in technical_skills.items() if v < 5}
-    
-    learning_resources = {
-        "Python Programming": {
-            "courses": ["Python for Everybody (Coursera)", "Complete Python Bootcamp (Udemy)"],
-            "certifications": ["PCAP – Certified Associate in Python Programming"],
-            "projects": ["Build a Web Scraper", "Create a Data Analysis Dashboard"]
-        },
-        "Machine Learning": {
-            "courses": ["Machine Learning by Andrew Ng (Coursera)", "Fast.ai Practical Deep Learning"],
-            "certifications": ["Google Machine Learning Engineer"],
-            "projects": ["House Price Prediction", "Image Classification Model"]
-        },
-        "Web Development": {
-            "courses": ["The Complete Web Developer Course (Udemy)", "Frontend Masters"],
-            "certifications": ["AWS Certified Developer"],
-            "projects": ["Personal Portfolio Website", "E-commerce Platform"]
-        }
-    }
-    
-    for skill, score in sorted(improvement_skills.items(), key=lambda x: x[1])[:5]:
-        with st.expander(f"Improve {skill} (Current: {score}/7)"):
-            if skill in learning_resources:
-                resource = learning_resources[skill]
-                
-                st.write("**📖 Recommended Courses:**")
-                for course in resource["courses"]:
-                    st.write(f"- {course}")
-                
-                st.write("**🏆 Certifications:**")
-                for cert in resource["certifications"]:
-                    st.write(f"- {cert}")
-                
-                st.write("**🛠️ Practice Projects:**")
-                for project in resource["projects"]:
-                    st.write(f"- {project}")
+    st.caption(f"Skills below {IMPROVED_LEVEL}/7, ordered by how much reaching {IMPROVED_LEVEL} "
+               "would raise your top career match scores")
+    
+    path = learning_path(user_data['technical_skills'], user_data.get('personality_traits'),
+                         user_data.get('career_interests'))
+    
+    for step in path:
+        with st.expander(f"Improve {step['skill']} (Current: {step['score']}/7, "
+                         f"+{step['gain']:.2f} match score)"):
+            if step['resources']:
+                for kind, resources in step['resources'].items():
+                    st.write(RESOURCE_HEADINGS[kind])
+                    for resource in resources:
+                        title = f"[{resource['title']}]({resource['url']})" if resource.get('url') else resource['title']
+                        st.write(f"- {title}")
             else:
                 st.write("Customized learning plan coming soon!")
 
 # Progress Tracking
+GOALS_PER_PAGE = 20
+GOAL_HISTORY_ROWS = 10
+
+def apply_goal_status_changes(changes):
+    """Save {goal_id: status} in one transaction and patch the goal list shown.
+
+    Runs as a widget callback, before the rerun draws the page, so the list
+    shows the new statuses without being queried again.
+    """
+    updated = repository.update_goal_statuses(st.session_state.user_id, changes)
+    view = st.session_state.get('goal_view')
+    if view is not None:
+        status_filter = view['filters'][0]
+        goals = [dict(goal, completion_status=changes.get(goal['id'], goal['completion_status']))
+                 for goal in view['goals']]
+        # Goals moved out of the status being filtered on leave the list
+        view['goals'] = [goal for goal in goals
+                         if status_filter == "All" or goal['completion_status'] == status_filter]
+    st.session_state.goal_update_message = f"Updated {updated} goal{'s' if updated != 1 else ''}."
+
+def update_one_goal(goal_id):
+    apply_goal_status_changes({goal_id: st.session_state[f"status_{goal_id}"]})
+
+def update_selected_goals():
+    selected = st.session_state.bulk_goal_ids
+    if selected:
+        apply_goal_status_changes(dict.fromkeys(selected, st.session_state.bulk_goal_status))
+    st.session_state.bulk_goal_ids = []
+
 def progress_tracking_page():
     st.title("📊 Progress Tracking")
     
@@ -600,8 +454,7 @@ def progress_tracking_page():
     col1, col2 = st.columns(2)
     
     with col1:
-        goal_type = st.selectbox("Goal Type", 
-                                ["Skill Development", "Certification", "Project Completion", "Job Application"])
+        goal_type = st.selectbox("Goal Type", repository.GOAL_TYPES)
         goal_description = st.text_area("Goal Description")
         
     with col2:
@@ -610,32 +463,68 @@ def progress_tracking_page():
     
     if st.button("Add Goal"):
         # Save goal to database
-        conn = sqlite3.connect('career_advisor.db')
-        c = conn.cursor()
-        
-        c.execute("""INSERT INTO progress 
-                     (user_id, goal_type, goal_description, target_date, completion_status, created_at)
-                     VALUES (?, ?, ?, ?, ?, ?)""",
-                  (st.session_state.user_id, goal_type, goal_description, 
-                   str(target_date), "In Progress", datetime.now()))
-        
-        conn.commit()
-        conn.close()
+        repository.add_goal(st.session_state.user_id, goal_type, goal_description, target_date)
+        # It may belong on the page being shown
+        st.session_state.pop('goal_view', None)
         st.success("Goal added successfully!")
     
-    # Display existing goals
+    # Display existing goals, one keyset page at a time
     st.subheader("📋 Your Current Goals")
     
-    conn = sqlite3.connect('career_advisor.db')
-    goals_df = pd.read_sql_query("""SELECT * FROM progress 
-                                   WHERE user_id = ? 
-                                   ORDER BY created_at DESC""", 
-                                conn, params=(st.session_state.user_id,))
-    conn.close()
-    
-    if not goals_df.empty:
-        for _, goal in goals_df.iterrows():
-            with st.expander(f"{goal['goal_type']}: {goal['goal_description'][:50]}..."):
+    fcol1, fcol2, fcol3 = st.columns([2, 2, 1])
+    with fcol1:
+        status_filter = st.selectbox("Filter by Status", ["All"] + repository.GOAL_STATUSES, key="goal_status_filter")
+    with fcol2:
+        type_filter = st.selectbox("Filter by Type", ["All"] + repository.GOAL_TYPES, key="goal_type_filter")
+    with fcol3:
+        if st.button("🔄 Refresh"):
+            st.session_state.pop('goal_view', None)
+    
+    # Cursors of the pages visited so far; reset whenever the filters change
+    filters = (status_filter, type_filter)
+    if st.session_state.get('goal_filters') != filters:
+        st.session_state.goal_filters = filters
+        st.session_state.goal_cursors = [None]
+    cursors = st.session_state.goal_cursors
+    
+    # The page of goals is kept in session state; status changes patch it
+    # instead of re-querying, and paging, filtering or adding a goal reload it
+    view_key = (st.session_state.user_id, filters, cursors[-1])
+    view = st.session_state.get('goal_view')
+    if view is None or view['key'] != view_key:
+        goals, next_cursor = repository.list_goals_page(
+            st.session_state.user_id,
+            limit=GOALS_PER_PAGE,
+            after=cursors[-1],
+            status=None if status_filter == "All" else status_filter,
+            goal_type=None if type_filter == "All" else type_filter
+        )
+        view = st.session_state.goal_view = {
+            'key': view_key,
+            'filters': filters,
+            'goals': [dict(goal) for goal in goals],
+            'next_cursor': next_cursor,
+        }
+    goals, next_cursor = view['goals'], view['next_cursor']
+    
+    message = st.session_state.pop('goal_update_message', None)
+    if message:
+        st.success(message)
+    
+    if goals:
+        # Bulk triage: nothing reruns until the form is submitted
+        labels = {goal['id']: f"{goal['goal_type']}: {goal['goal_summary']} ({goal['completion_status']})"
+                  for goal in goals}
+        with st.form("bulk_goal_status"):
+            bcol1, bcol2 = st.columns([3, 1])
+            with bcol1:
+                st.multiselect("Goals to update", list(labels), format_func=labels.get, key="bulk_goal_ids")
+            with bcol2:
+                st.selectbox("New Status", repository.GOAL_STATUSES, key="bulk_goal_status")
+            st.form_submit_button("Apply to Selected", on_click=update_selected_goals)
+        
+        for goal in goals:
+            with st.expander(f"{goal['goal_type']}: {goal['goal_summary']}..."):
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
@@ -643,121 +532,265 @@ def progress_tracking_page():
                     st.write(f"**Status:** {goal['completion_status']}")
                 
                 with col2:
-                    new_status = st.selectbox("Update Status", 
-                                            ["In Progress", "Completed", "On Hold", "Cancelled"],
-                                            key=f"status_{goal['id']}")
+                    st.selectbox("Update Status", 
+                                 repository.GOAL_STATUSES,
+                                 key=f"status_{goal['id']}")
                 
                 with col3:
-                    if st.button("Update", key=f"update_{goal['id']}"):
-                        conn = sqlite3.connect('career_advisor.db')
-                        c = conn.cursor()
-                        c.execute("UPDATE progress SET completion_status = ? WHERE id = ?",
-                                (new_status, goal['id']))
-                        conn.commit()
-                        conn.close()
-                        st.success("Goal updated!")
-                        st.rerun()
+                    st.button("Update", key=f"update_{goal['id']}", on_click=update_one_goal, args=(goal['id'],))
+    else:
+        st.info("No goals match these filters.")
+    
+    pcol1, pcol2, pcol3 = st.columns([1, 2, 1])
+    with pcol1:
+        if st.button("← Previous", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    with pcol2:
+        st.caption(f"Page {len(cursors)}")
+    with pcol3:
+        if st.button("Next →", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
+    
+    history = repository.goal_status_history(st.session_state.user_id, limit=GOAL_HISTORY_ROWS)
+    if history:
+        with st.expander("🕘 Recent Status Changes"):
+            for change in history:
+                st.write(f"{change['changed_at'][:16]} · goal #{change['goal_id']}: "
+                         f"{change['old_status']} → {change['new_status']}")
 
 # Dashboard
+# What counts towards "Profile Completion": (step, done(user_data, stats))
+PROFILE_STEPS = (
+    ("Save your profile", lambda user_data, stats: bool(user_data.get('name'))),
+    ("Skills assessment", lambda user_data, stats: 'technical_skills' in user_data),
+    ("Personality test", lambda user_data, stats: 'personality_traits' in user_data),
+    ("Career interests", lambda user_data, stats: 'career_interests' in user_data),
+    ("Save your recommendations", lambda user_data, stats: stats['assessments'] > 0),
+    ("Set a learning goal", lambda user_data, stats: stats['goals'] > 0),
+)
+
+def skill_summary(technical_scores):
+    """Count and average of the skill scores, stored with them when assessed."""
+    values = list(technical_scores.values())
+    return {'count': len(values), 'average': sum(values) / len(values) if values else 0.0}
+
+def profile_completion(user_data, stats):
+    """(percent complete, steps still to do) from the session data and user_stats."""
+    todo = [step for step, done in PROFILE_STEPS if not done(user_data, stats)]
+    return round(100 * (len(PROFILE_STEPS) - len(todo)) / len(PROFILE_STEPS)), todo
+
 def dashboard_page():
+    import charts
+
     st.title("📊 Career Development Dashboard")
     
-    if not st.session_state.user_data:
+    user_data = st.session_state.user_data
+    if not user_data:
         st.warning("Please complete your profile and assessments first!")
         return
     
+    # Counters kept current by triggers on progress and assessments
+    stats = repository.user_stats(st.session_state.user_id)
+    # Sessions saved before skill_summary existed
+    skills = user_data.get('skill_summary') or skill_summary(user_data.get('technical_skills', {}))
+    completion, todo = profile_completion(user_data, stats)
+    
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Skills Assessed", len(st.session_state.user_data.get('technical_skills', {})))
+        st.metric("Skills Assessed", skills['count'])
     
     with col2:
-        avg_skill = np.mean(list(st.session_state.user_data.get('technical_skills', {1: 1}).values()))
-        st.metric("Average Skill Level", f"{avg_skill:.1f}/7")
+        st.metric("Average Skill Level", f"{skills['average']:.1f}/7")
     
     with col3:
-        # Count goals from database
-        conn = sqlite3.connect('career_advisor.db')
-        c = conn.cursor()
-        c.execute("SELECT COUNT(*) FROM progress WHERE user_id = ? AND completion_status = 'In Progress'",
-                  (st.session_state.user_id,))
-        active_goals = c.fetchone()[0]
-        conn.close()
-        st.metric("Active Goals", active_goals)
+        st.metric("Active Goals", stats['active_goals'],
+                  help=f"{stats['completed_goals']} completed, {stats['on_hold_goals']} on hold")
     
     with col4:
-        st.metric("Profile Completion", "85%")
+        st.metric("Profile Completion", f"{completion}%",
+                  help="Still to do: " + ", ".join(todo) if todo else "All done!")
     
     # Skills overview chart
     if 'technical_skills' in st.session_state.user_data:
         st.subheader("🛠️ Skills Overview")
         
-        skills_data = st.session_state.user_data['technical_skills']
-        top_skills = dict(sorted(skills_data.items(), key=lambda x: x[1], reverse=True)[:8])
-        
-        fig = px.bar(x=list(top_skills.keys()), y=list(top_skills.values()),
-                     title="Top Skills Proficiency",
-                     labels={'x': 'Skills', 'y': 'Proficiency Level'},
-                     color=list(top_skills.values()),
-                     color_continuous_scale='viridis')
-        if fig is not None:
-           fig.update_xaxes(tickangle=45)
-
+        fig = charts.top_skills_bar(st.session_state.user_data['technical_skills'])
         st.plotly_chart(fig, use_container_width=True)
     
+    # Skill trends across saved assessments, from the weekly/monthly rollups
+    if stats['assessments'] > 0 and 'technical_skills' in user_data:
+        st.subheader("📉 Skill Trends")
+        tcol1, tcol2 = st.columns([3, 1])
+        with tcol1:
+            skill = st.selectbox("Skill", list(user_data['technical_skills']), key="trend_skill")
+        with tcol2:
+            period = st.radio("Per", repository.ROLLUP_PERIODS, index=1, horizontal=True, key="trend_period")
+        user_rows = repository.skill_trend(st.session_state.user_id, skill, period)
+        if user_rows:
+            fig = charts.skill_trend(skill, period, user_rows, repository.cohort_skill_trend(skill, period))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info(f"No saved assessments include {skill} yet.")
+    
     # Recent activity
     st.subheader("📈 Recent Activity")
     st.write("- Completed Technical Skills Assessment")
     st.write("- Updated career interests profile")
     st.write("- Added new learning goal: Complete Python certification")
 
+# Cohort Analytics
+def cohort_analytics_page():
+    import pandas as pd
+    import plotly.express as px
+
+    st.title("👥 Cohort Analytics")
+    st.write("Aggregates across every user, kept current as assessments and goals are saved.")
+
+    skill_rows = repository.cohort_skill_distribution()
+    match_rows = repository.cohort_career_matches()
+    goal_rows = repository.cohort_goal_completion()
+
+    if not (skill_rows or match_rows or goal_rows):
+        st.info("No assessments or goals have been recorded yet.")
+        return
+
+    if skill_rows:
+        st.subheader("🛠️ Skill Distribution")
+        skills_df = pd.DataFrame([tuple(row) for row in skill_rows], columns=['Skill', 'Level', 'Assessments'])
+        fig = px.bar(skills_df, x='Skill', y='Assessments', color='Level',
+                     title="Self-Rated Skill Levels",
+                     color_continuous_scale='viridis')
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+
+    if match_rows:
+        st.subheader("🎯 Average Career Match")
+        matches_df = pd.DataFrame([tuple(row) for row in match_rows],
+                                  columns=['Career', 'Rankings', 'Match Score', 'Technical Match',
+                                           'Personality Match'])
+        fig = px.bar(matches_df, x='Career', y=['Match Score', 'Technical Match', 'Personality Match'],
+                     barmode='group', title="Average Match per Career")
+        st.plotly_chart(fig, use_container_width=True)
+
+    if goal_rows:
+        st.subheader("📊 Goal Completion by Type")
+        goals_df = pd.DataFrame([tuple(row) for row in goal_rows],
+                                columns=['Goal Type', 'Goals', 'Completed', 'Completion Rate'])
+        fig = px.bar(goals_df, x='Goal Type', y='Completion Rate', text='Completed',
+                     title="Share of Goals Completed", range_y=[0, 1])
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(goals_df, use_container_width=True)
+
+# Debug (admins only)
+def debug_page():
+    import json
+
+    import job_queue
+
+    st.title("🩺 Debug")
+    if not metrics.ENABLED:
+        st.warning("Instrumentation is off (CAREER_METRICS=0); only profiling is available.")
+
+    st.subheader("⏱️ Timings")
+    prefix = st.text_input("Span prefix", placeholder="page. / db. / engine. / chart. / job.",
+                           key="debug_span_prefix")
+    spans = metrics.snapshot()
+    rows = [dict(span=name, **{key: round(value, 3) for key, value in stats.items()})
+            for name, stats in spans.items() if name.startswith(prefix)]
+    if rows:
+        st.dataframe(rows, use_container_width=True)
+    else:
+        st.info("No spans recorded yet.")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("Reset timings"):
+            metrics.reset()
+            st.rerun()
+    with col2:
+        st.download_button("Download JSON", json.dumps(spans, indent=2),
+                           file_name="metrics.json", mime="application/json")
+    with col3:
+        st.download_button("Download Prometheus", metrics.prometheus_text(),
+                           file_name="metrics.prom", mime="text/plain")
+
+    st.subheader("🔬 Profiling")
+    # Kept outside the widget key so the mode survives on the other pages
+    mode = st.radio("Profile each page run in this session", metrics.PROFILE_MODES,
+                    index=metrics.PROFILE_MODES.index(st.session_state.get("profile_mode", "off")),
+                    format_func={"off": "Off", "cprofile": "cProfile", "sampling": "Sampling"}.get,
+                    horizontal=True, key="debug_profile_mode")
+    st.session_state.profile_mode = mode
+    report = st.session_state.get("profile_report")
+    if report:
+        st.caption(f"Last profiled page: {report[0]}")
+        st.code(report[1], language=None)
+
+    st.subheader("📬 Job Queue")
+    st.json(job_queue.queue_stats())
+
 # Main Application Logic
+PAGES = {
+    "🏠 Dashboard": dashboard_page,
+    "👤 Profile": profile_page,
+    "🛠️ Skills Assessment": skills_assessment_page,
+    "🧠 Personality Test": personality_assessment_page,
+    "🎯 Career Interests": career_interest_page,
+    "🏆 Recommendations": recommendations_page,
+    "📚 Learning Resources": learning_resources_page,
+    "📊 Progress Tracking": progress_tracking_page,
+    "👥 Cohort Analytics": cohort_analytics_page,
+}
+DEBUG_PAGE = "🩺 Debug"
+
+
 def main():
-    init_database()
+    # Migrations run once per process; later reruns reuse the pool
+    repository.init_database()
     
     if not st.session_state.logged_in:
-        authentication_page()
+        with metrics.span("page.authentication_page"):
+            authentication_page()
         return
     
     # Sidebar navigation
     st.sidebar.title(f"Welcome, {st.session_state.username}!")
     st.sidebar.markdown("---")
     
-    page = st.sidebar.selectbox("Navigation", [
-        "🏠 Dashboard",
-        "👤 Profile",
-        "🛠️ Skills Assessment", 
-        "🧠 Personality Test",
-        "🎯 Career Interests",
-        "🏆 Recommendations",
-        "📚 Learning Resources",
-        "📊 Progress Tracking"
-    ])
+    is_admin = st.session_state.get('is_admin', False)
+    page = st.sidebar.selectbox("Navigation", list(PAGES) + ([DEBUG_PAGE] if is_admin else []))
     
     # Logout button
     if st.sidebar.button("Logout"):
+        store = session_store.get_store()
+        store.put(st.session_state.user_id, st.session_state.user_data)
+        store.discard(st.session_state.user_id)
         st.session_state.logged_in = False
+        st.session_state.is_admin = False
         st.session_state.user_data = {}
         st.rerun()
     
-    # Page routing
-    if page == "🏠 Dashboard":
-        dashboard_page()
-    elif page == "👤 Profile":
-        profile_page()
-    elif page == "🛠️ Skills Assessment":
-        skills_assessment_page()
-    elif page == "🧠 Personality Test":
-        personality_assessment_page()
-    elif page == "🎯 Career Interests":
-        career_interest_page()
-    elif page == "🏆 Recommendations":
-        recommendations_page()
-    elif page == "📚 Learning Resources":
-        learning_resources_page()
-    elif page == "📊 Progress Tracking":
-        progress_tracking_page()
+    # Page routing. The session store gets user_data after every rerun,
+    # including pages that end in st.rerun(); it only writes when it changed.
+    try:
+        if page == DEBUG_PAGE:
+            with metrics.span("page.debug_page"):
+                debug_page()
+        else:
+            render = PAGES[page]
+            profile = metrics.profiled(st.session_state.get("profile_mode", "off"))
+            try:
+                with metrics.span(f"page.{render.__name__}"), profile:
+                    render()
+            finally:
+                if profile.report is not None:
+                    st.session_state.profile_report = (page, profile.report)
+    finally:
+        session_store.get_store().put(st.session_state.user_id, st.session_state.user_data)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,314 @@
+# AI-Powered Career and Skills Advisor - Instrumentation
+# Timing spans aggregated into in-process latency histograms.
+#
+#   with metrics.span("page.dashboard"): ...
+#   @metrics.timed("engine.calculate_career_match")
+#
+# Spans are named <area>.<what>: page.* (one page run), db.* (one SQL
+# statement, by verb and table, plus db.connection for each borrowed
+# connection), engine.*, chart.* and job.*. snapshot() gives count, mean and
+# p50/p95/p99/max per span; prometheus_text() gives the same histograms in
+# the Prometheus text format. With CAREER_METRICS_FILE set, a background
+# thread rewrites that file every METRICS_FILE_SECONDS (Prometheus text for
+# .prom/.txt, JSON otherwise).
+#
+# CAREER_METRICS=0 disables everything: span() returns a shared no-op and
+# timed() leaves functions undecorated. profiled() wraps one page run in
+# cProfile or a stack sampler, for the debug page's per-session profiling.
+
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+ENABLED = os.environ.get("CAREER_METRICS", "1") != "0"
+METRICS_FILE = os.environ.get("CAREER_METRICS_FILE")
+METRICS_FILE_SECONDS = 10.0
+
+# Log-spaced bucket bounds from 1 us to about 67 s, four per doubling, so a
+# percentile is within 19% of the true value
+BUCKETS = tuple(1e-6 * 2 ** (i / 4) for i in range(105))
+# Every fourth bound (a doubling) is exported to Prometheus
+PROMETHEUS_BUCKETS = BUCKETS[::4]
+
+PROFILE_MODES = ("off", "cprofile", "sampling")
+PROFILE_LINES = 40
+SAMPLE_INTERVAL_SECONDS = 0.002
+
+
+# Histograms
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (capped at max)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(BUCKETS[i] if i < len(BUCKETS) else self.max, self.max)
+        return self.max
+
+
+_histograms = {}
+_lock = threading.Lock()
+_writer = None
+
+
+def record(name, seconds):
+    """Add one observation to the named histogram."""
+    # Histogram.observe inlined: this runs for every span
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+            if METRICS_FILE and _writer is None:
+                _start_writer()
+        histogram.counts[bisect_left(BUCKETS, seconds)] += 1
+        histogram.count += 1
+        histogram.total += seconds
+        if seconds > histogram.max:
+            histogram.max = seconds
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+# Spans
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    """Context manager timing its block into the named histogram."""
+    return _Span(name) if ENABLED else _NO_SPAN
+
+
+def timed(name):
+    """Decorator timing every call into the named histogram."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        wrapper.__name__ = fn.__name__
+        wrapper.__qualname__ = fn.__qualname__
+        wrapper.__doc__ = fn.__doc__
+        wrapper.__wrapped__ = fn
+        return wrapper
+    return decorate
+
+
+# Snapshots
+def snapshot():
+    """{span: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}, sorted by name."""
+    with _lock:
+        histograms = {name: (h.count, h.total, h.max, list(h.counts)) for name, h in _histograms.items()}
+    result = {}
+    for name in sorted(histograms):
+        count, total, peak, counts = histograms[name]
+        histogram = Histogram()
+        histogram.count, histogram.total, histogram.max, histogram.counts = count, total, peak, counts
+        result[name] = {
+            "count": count,
+            "mean_ms": total / count * 1000 if count else 0.0,
+            "p50_ms": histogram.percentile(50) * 1000,
+            "p95_ms": histogram.percentile(95) * 1000,
+            "p99_ms": histogram.percentile(99) * 1000,
+            "max_ms": peak * 1000,
+        }
+    return result
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Every span as a Prometheus histogram, career_advisor_span_seconds{span=...}."""
+    with _lock:
+        histograms = {name: (h.count, h.total, list(h.counts)) for name, h in _histograms.items()}
+    lines = ["# HELP career_advisor_span_seconds Time spent in instrumented spans.",
+             "# TYPE career_advisor_span_seconds histogram"]
+    for name in sorted(histograms):
+        count, total, counts = histograms[name]
+        label = _label(name)
+        cumulative = 0
+        position = 0
+        for bound in PROMETHEUS_BUCKETS:
+            # Fold in every fine bucket up to and including this bound
+            while position < len(BUCKETS) and BUCKETS[position] <= bound:
+                cumulative += counts[position]
+                position += 1
+            lines.append(f'career_advisor_span_seconds_bucket{{span="{label}",le="{bound:.6g}"}} {cumulative}')
+        lines.append(f'career_advisor_span_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+        lines.append(f'career_advisor_span_seconds_sum{{span="{label}"}} {total:.9f}')
+        lines.append(f'career_advisor_span_seconds_count{{span="{label}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_snapshot(path):
+    """Atomically write the metrics to path: Prometheus text for .prom/.txt, else JSON."""
+    if path.endswith((".prom", ".txt")):
+        text = prometheus_text()
+    else:
+        text = json.dumps({"written_at": time.time(), "spans": snapshot()}, indent=2)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _start_writer():
+    # Called under _lock, from the first record()
+    global _writer
+    _writer = threading.Thread(target=_write_periodically, name="metrics-writer", daemon=True)
+    _writer.start()
+
+
+def _write_periodically():
+    while True:
+        time.sleep(METRICS_FILE_SECONDS)
+        try:
+            write_snapshot(METRICS_FILE)
+        except OSError as e:
+            print(f"metrics: cannot write {METRICS_FILE}: {e}", file=sys.stderr)
+
+
+# Profiling
+class StackSampler:
+    """Samples one thread's Python stack on a timer while running.
+
+    Cheaper than cProfile on deep call trees and unaffected by call counts;
+    reports how often each function was running (self) or on the stack.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL_SECONDS):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.inclusive = Counter()
+        self.leaf = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            seen = set()
+            leaf = True
+            while frame is not None:
+                code = frame.f_code
+                where = f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+                if leaf:
+                    self.leaf[where] += 1
+                    leaf = False
+                if where not in seen:
+                    seen.add(where)
+                    self.inclusive[where] += 1
+                frame = frame.f_back
+
+    def report(self, lines=PROFILE_LINES):
+        if not self.samples:
+            return "no samples (the run was shorter than the sampling interval)"
+        out = [f"{self.samples} samples every {self.interval * 1000:.0f} ms",
+               f"{'on stack':>9} {'running':>8}  function"]
+        for where, count in self.inclusive.most_common(lines):
+            out.append(f"{count / self.samples:>9.0%} {self.leaf[where] / self.samples:>8.0%}  {where}")
+        return "\n".join(out)
+
+
+class profiled:
+    """Profile the block in "cprofile" or "sampling" mode; .report holds the result text.
+
+    Mode "off" does nothing, so callers can always wrap their work.
+    """
+
+    def __init__(self, mode):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode {mode!r}; expected one of {PROFILE_MODES}")
+        self.mode = mode
+        self.report = None
+        self._profiler = None
+
+    def __enter__(self):
+        if self.mode == "cprofile":
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.mode == "sampling":
+            self._profiler = StackSampler(threading.get_ident()).start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.mode == "cprofile":
+            import io
+            import pstats
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            self.report = out.getvalue()
+        elif self.mode == "sampling":
+            self._profiler.stop()
+            self.report = self._profiler.report()
+        return False
@@ -0,0 +1,173 @@
+# AI-Powered Career and Skills Advisor - Password Hashing
+# Salted, cost-tunable password hashes stored with their parameters, e.g.
+#   scrypt$16384$8$1$<salt>$<hash>
+#   pbkdf2_sha256$600000$<salt>$<hash>
+# Unsalted SHA-256 hex digests from before this format are still accepted
+# and are rehashed with the current hasher on the next successful login.
+#
+# Hashing is deliberately slow, so it runs on a small bounded pool: a burst
+# of logins queues for those workers instead of taking every core from the
+# other sessions.
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+PASSWORD_HASHER = os.environ.get("CAREER_PASSWORD_HASHER", "scrypt")
+SCRYPT_N = int(os.environ.get("CAREER_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = int(os.environ.get("CAREER_PBKDF2_ITERATIONS", "600000"))
+SALT_BYTES = 16
+
+# At most HASH_WORKERS hashes run at once and at most HASH_QUEUE_LIMIT more
+# wait; beyond that callers get HasherBusy instead of piling up
+HASH_WORKERS = int(os.environ.get("CAREER_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+HASH_QUEUE_LIMIT = int(os.environ.get("CAREER_HASH_QUEUE_LIMIT", "64"))
+
+
+class HasherBusy(Exception):
+    """Too many password hashes are already queued."""
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _unb64(text):
+    return base64.b64decode(text.encode("ascii"))
+
+
+class ScryptHasher:
+    algorithm = "scrypt"
+
+    def __init__(self, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+        self.n, self.r, self.p = n, r, p
+
+    def _derive(self, password, salt, n, r, p):
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * n * r * p, dklen=32)
+
+    def hash(self, password):
+        salt = os.urandom(SALT_BYTES)
+        digest = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.algorithm}${self.n}${self.r}${self.p}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password, encoded):
+        _, n, r, p, salt, digest = encoded.split("$")
+        return hmac.compare_digest(self._derive(password, _unb64(salt), int(n), int(r), int(p)), _unb64(digest))
+
+    def needs_rehash(self, encoded):
+        return encoded.split("$")[1:4] != [str(self.n), str(self.r), str(self.p)]
+
+
+class Pbkdf2Hasher:
+    algorithm = "pbkdf2_sha256"
+
+    def __init__(self, iterations=PBKDF2_ITERATIONS):
+        self.iterations = iterations
+
+    def hash(self, password):
+        salt = os.urandom(SALT_BYTES)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations)
+        return f"{self.algorithm}${self.iterations}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password, encoded):
+        _, iterations, salt, digest = encoded.split("$")
+        derived = hashlib.pbkdf2_hmac("sha256", password.encode(), _unb64(salt), int(iterations))
+        return hmac.compare_digest(derived, _unb64(digest))
+
+    def needs_rehash(self, encoded):
+        return encoded.split("$")[1] != str(self.iterations)
+
+
+class LegacySha256Hasher:
+    """The original unsalted hex digest; verify only, always rehashed."""
+    algorithm = "sha256"
+
+    def hash(self, password):
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def verify(self, password, encoded):
+        return hmac.compare_digest(self.hash(password), encoded)
+
+    def needs_rehash(self, encoded):
+        return True
+
+
+HASHERS = {
+    "scrypt": ScryptHasher,
+    "pbkdf2_sha256": Pbkdf2Hasher,
+}
+
+LEGACY = LegacySha256Hasher()
+
+
+def current_hasher():
+    if PASSWORD_HASHER not in HASHERS:
+        raise ValueError(f"unknown password hasher {PASSWORD_HASHER!r}; expected one of {sorted(HASHERS)}")
+    return HASHERS[PASSWORD_HASHER]()
+
+
+def identify(encoded):
+    """The hasher able to check encoded, with the stored parameters."""
+    algorithm = encoded.split("$", 1)[0]
+    if algorithm in HASHERS:
+        return HASHERS[algorithm]()
+    return LEGACY
+
+
+# Bounded hashing pool
+_executor = None
+_slots = threading.BoundedSemaphore(HASH_WORKERS + HASH_QUEUE_LIMIT)
+_executor_lock = threading.Lock()
+
+
+def _submit(fn, *args):
+    global _executor
+    if not _slots.acquire(blocking=False):
+        raise HasherBusy("password hashing queue is full")
+    try:
+        if _executor is None:
+            with _executor_lock:
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-hash")
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future.result()
+
+
+def hash_password(password):
+    return _submit(current_hasher().hash, password)
+
+
+def _check(password, encoded):
+    hasher = identify(encoded)
+    if not hasher.verify(password, encoded):
+        return False, None
+    current = current_hasher()
+    if hasher.algorithm != current.algorithm or hasher.needs_rehash(encoded):
+        return True, current.hash(password)
+    return True, None
+
+
+# Checked when the username does not exist, so unknown users cost the same
+# as a wrong password
+_dummy_hash = None
+
+
+def check_password(password, encoded):
+    """Return (ok, new_hash); new_hash is set when encoded should be upgraded."""
+    global _dummy_hash
+    if encoded is None:
+        if _dummy_hash is None:
+            _dummy_hash = hash_password("")
+        _submit(_check, password, _dummy_hash)
+        return False, None
+    return _submit(_check, password, encoded)
@@ -0,0 +1,159 @@
+# AI-Powered Career and Skills Advisor - Recommendation Cache
+# Memoized career rankings keyed by an assessment fingerprint, backed by the
+# assessments.recommendations column
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import repository
+from career_engine import RANKING_DEPTH, get_advisor
+from career_model import RECOMMENDER, get_career_model, model_recommendations
+
+CACHE_MAX_ENTRIES = 1024
+CACHE_TTL_SECONDS = 60 * 60
+
+
+def assessment_fingerprint(technical_scores, personality_scores, interest_scores,
+                           catalog_version=None, ranker=None):
+    """Stable hash of the three score dicts, the catalog version and the ranker.
+
+    Keys are sorted and scores rounded so that the same answers always give
+    the same fingerprint, whatever the dict order or float type (the pages
+    produce numpy floats). ranker is None for the heuristic and the model
+    version otherwise, so model and heuristic rankings never collide.
+    """
+    if catalog_version is None:
+        catalog_version = get_advisor().catalog_version
+    payload = {
+        "catalog_version": catalog_version,
+        "technical_skills": {k: round(float(v), 6) for k, v in technical_scores.items()},
+        "personality_traits": {k: round(float(v), 6) for k, v in personality_scores.items()},
+        "career_interests": {k: round(float(v), 6) for k, v in interest_scores.items()},
+    }
+    if ranker is not None:
+        payload["ranker"] = ranker
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RecommendationCache:
+    """Thread-safe LRU cache with a per-entry time to live."""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = RecommendationCache()
+
+
+# Storage format for assessments.recommendations
+def serialize_ranking(recommendations, catalog_version=None):
+    if catalog_version is None:
+        catalog_version = get_advisor().catalog_version
+    return {
+        "catalog_version": catalog_version,
+        "ranking": [
+            {
+                "career": rec["career"],
+                "score": float(rec["score"]),
+                "tech_match": float(rec["tech_match"]),
+                "personality_match": float(rec["personality_match"]),
+                **({"model_probability": rec["model_probability"]} if "model_probability" in rec else {}),
+            }
+            for rec in recommendations
+        ],
+    }
+
+
+def deserialize_ranking(stored, advisor):
+    """Rebuild page-ready recommendations, or None if stored for another catalog."""
+    if not stored or stored.get("catalog_version") != advisor.catalog_version:
+        return None
+    return [
+        dict(rec, details=advisor.career_paths[rec["career"]])
+        for rec in stored["ranking"]
+        if rec["career"] in advisor.career_paths
+    ]
+
+
+def _ranking_key(technical_scores, personality_scores, interest_scores):
+    advisor = get_advisor()
+    model = get_career_model() if RECOMMENDER == "model" else None
+    fingerprint = assessment_fingerprint(technical_scores, personality_scores, interest_scores,
+                                         advisor.catalog_version, model.version if model else None)
+    return advisor, model, fingerprint
+
+
+def _cached(advisor, fingerprint):
+    # Entries hold the advisor they were ranked with; a catalog reload that
+    # keeps the version (say, a new description) still misses
+    entry = _cache.get(fingerprint)
+    return entry[1] if entry is not None and entry[0] is advisor else None
+
+
+def cached_recommendations(technical_scores, personality_scores, interest_scores):
+    """Return (fingerprint, ranking) from memory only; ranking is None on a miss."""
+    advisor, _, fingerprint = _ranking_key(technical_scores, personality_scores, interest_scores)
+    return fingerprint, _cached(advisor, fingerprint)
+
+
+def get_recommendations(user_id, technical_scores, personality_scores, interest_scores):
+    """Return (fingerprint, ranking) using memory, then storage, then scoring."""
+    advisor, model, fingerprint = _ranking_key(technical_scores, personality_scores, interest_scores)
+
+    ranking = _cached(advisor, fingerprint)
+    if ranking is not None:
+        return fingerprint, ranking
+
+    ranking = deserialize_ranking(repository.find_recommendations(user_id, fingerprint), advisor)
+    if ranking is None and model is not None:
+        ranking = model_recommendations(model, advisor, technical_scores, personality_scores,
+                                        interest_scores, RANKING_DEPTH) or None
+    if ranking is None:
+        ranking = advisor.top_careers(technical_scores, personality_scores, interest_scores)
+
+    _cache.put(fingerprint, (advisor, ranking))
+    return fingerprint, ranking
+
+
+def load_ranking(stored):
+    """Page-ready ranking from serialize_ranking output, e.g. a finished job's result."""
+    return deserialize_ranking(stored, get_advisor())
+
+
+def load_saved_recommendations(user_id):
+    """Ranking from the user's latest saved assessment, for returning users."""
+    advisor = get_advisor()
+    return deserialize_ranking(repository.latest_recommendations(user_id), advisor)
@@ -0,0 +1,928 @@
+# AI-Powered Career and Skills Advisor - Data Access Layer
+# Pooled SQLite connections, schema migrations and the queries used by the pages
+
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import metrics
+import passwords
+
+DB_PATH = os.environ.get("CAREER_ADVISOR_DB", "career_advisor.db")
+POOL_SIZE = int(os.environ.get("CAREER_ADVISOR_DB_POOL", "8"))
+
+# Applied to every pooled connection. WAL lets readers proceed while a
+# writer commits, and synchronous=NORMAL is durable across app crashes in
+# WAL mode (only an OS crash can lose the last transactions).
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=134217728",
+)
+
+
+# First day of the week (Monday) or month holding a timestamp, as SQL
+# around a placeholder for the timestamp expression
+PERIOD_START_SQL = {
+    "week": "date({}, '-6 days', 'weekday 1')",
+    "month": "date({}, 'start of month')",
+}
+# The same for a datetime.date, used when save_assessments adds to the rollups
+PERIOD_START = {
+    "week": lambda day: day - timedelta(days=day.weekday()),
+    "month": lambda day: day.replace(day=1),
+}
+ROLLUP_PERIODS = tuple(PERIOD_START_SQL)
+
+
+def score_store_step(name):
+    """Migration step running score_store.<name>(conn).
+
+    score_store needs numpy and the career catalog, so it is only imported
+    when a migration actually runs, not on every app start.
+    """
+    def step(conn):
+        import score_store
+        getattr(score_store, name)(conn)
+    return step
+
+
+# Schema migrations, applied in order and tracked with PRAGMA user_version.
+# Each step is SQL text or a callable taking the connection.
+# Never edit a released migration; append a new one instead.
+MIGRATIONS = [
+    # 1: initial schema
+    [
+        '''CREATE TABLE IF NOT EXISTS users
+                 (id INTEGER PRIMARY KEY,
+                  username TEXT UNIQUE,
+                  password TEXT,
+                  email TEXT,
+                  created_at TIMESTAMP)''',
+        '''CREATE TABLE IF NOT EXISTS assessments
+                 (id INTEGER PRIMARY KEY,
+                  user_id INTEGER,
+                  technical_skills TEXT,
+                  personality_traits TEXT,
+                  career_interests TEXT,
+                  recommendations TEXT,
+                  created_at TIMESTAMP,
+                  FOREIGN KEY(user_id) REFERENCES users(id))''',
+        '''CREATE TABLE IF NOT EXISTS progress
+                 (id INTEGER PRIMARY KEY,
+                  user_id INTEGER,
+                  goal_type TEXT,
+                  goal_description TEXT,
+                  target_date TEXT,
+                  completion_status TEXT,
+                  created_at TIMESTAMP,
+                  FOREIGN KEY(user_id) REFERENCES users(id))''',
+    ],
+    # 2: per-user lookups for goal listing, active goal counts and assessment history
+    [
+        "CREATE INDEX IF NOT EXISTS idx_progress_user_created ON progress (user_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_progress_user_status ON progress (user_id, completion_status)",
+        "CREATE INDEX IF NOT EXISTS idx_assessments_user_created ON assessments (user_id, created_at)",
+    ],
+    # 3: status-filtered goal pages walk (user_id, completion_status, created_at);
+    # it also covers the active goal count, so the narrower index goes
+    [
+        "CREATE INDEX IF NOT EXISTS idx_progress_user_status_created ON progress (user_id, completion_status, created_at)",
+        "DROP INDEX IF EXISTS idx_progress_user_status",
+    ],
+    # 4: fingerprint of the scores a stored ranking was computed from
+    [
+        "ALTER TABLE assessments ADD COLUMN fingerprint TEXT",
+    ],
+    # 5: scores as packed float32 vectors instead of JSON text; existing
+    # JSON rows are converted, their text is left in place
+    [
+        "CREATE TABLE IF NOT EXISTS score_layouts (id INTEGER PRIMARY KEY, features TEXT UNIQUE)",
+        "ALTER TABLE assessments ADD COLUMN score_vector BLOB",
+        "ALTER TABLE assessments ADD COLUMN score_layout INTEGER REFERENCES score_layouts(id)",
+        score_store_step("backfill_score_vectors"),
+    ],
+    # 6: cohort aggregates, kept current by triggers (goals, rankings) and by
+    # save_assessments (skill levels, which live in the packed vectors)
+    [
+        """CREATE TABLE IF NOT EXISTS goal_stats
+                 (goal_type TEXT,
+                  completion_status TEXT,
+                  goals INTEGER NOT NULL,
+                  PRIMARY KEY (goal_type, completion_status))""",
+        """CREATE TABLE IF NOT EXISTS career_match_stats
+                 (career TEXT PRIMARY KEY,
+                  rankings INTEGER NOT NULL,
+                  score_sum REAL NOT NULL,
+                  tech_match_sum REAL NOT NULL,
+                  personality_match_sum REAL NOT NULL)""",
+        """CREATE TABLE IF NOT EXISTS skill_level_stats
+                 (skill TEXT,
+                  level INTEGER,
+                  assessments INTEGER NOT NULL,
+                  PRIMARY KEY (skill, level))""",
+        lambda conn: rebuild_cohort_stats(conn),
+        """CREATE TRIGGER IF NOT EXISTS goal_stats_insert AFTER INSERT ON progress BEGIN
+               INSERT INTO goal_stats (goal_type, completion_status, goals)
+               VALUES (coalesce(NEW.goal_type, ''), coalesce(NEW.completion_status, ''), 1)
+               ON CONFLICT (goal_type, completion_status) DO UPDATE SET goals = goals + 1;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS goal_stats_delete AFTER DELETE ON progress BEGIN
+               UPDATE goal_stats SET goals = goals - 1
+               WHERE goal_type = coalesce(OLD.goal_type, '') AND completion_status = coalesce(OLD.completion_status, '');
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS goal_stats_update AFTER UPDATE OF goal_type, completion_status ON progress
+           WHEN OLD.goal_type IS NOT NEW.goal_type OR OLD.completion_status IS NOT NEW.completion_status BEGIN
+               UPDATE goal_stats SET goals = goals - 1
+               WHERE goal_type = coalesce(OLD.goal_type, '') AND completion_status = coalesce(OLD.completion_status, '');
+               INSERT INTO goal_stats (goal_type, completion_status, goals)
+               VALUES (coalesce(NEW.goal_type, ''), coalesce(NEW.completion_status, ''), 1)
+               ON CONFLICT (goal_type, completion_status) DO UPDATE SET goals = goals + 1;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS career_match_stats_insert AFTER INSERT ON assessments BEGIN
+               INSERT INTO career_match_stats (career, rankings, score_sum, tech_match_sum, personality_match_sum)
+               SELECT value ->> 'career', 1, value ->> 'score', value ->> 'tech_match', value ->> 'personality_match'
+               FROM json_each(NEW.recommendations, '$.ranking') WHERE true
+               ON CONFLICT (career) DO UPDATE SET
+                   rankings = rankings + 1,
+                   score_sum = score_sum + excluded.score_sum,
+                   tech_match_sum = tech_match_sum + excluded.tech_match_sum,
+                   personality_match_sum = personality_match_sum + excluded.personality_match_sum;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS career_match_stats_delete AFTER DELETE ON assessments BEGIN
+               UPDATE career_match_stats SET
+                   rankings = rankings - 1,
+                   score_sum = score_sum - ranked.score,
+                   tech_match_sum = tech_match_sum - ranked.tech_match,
+                   personality_match_sum = personality_match_sum - ranked.personality_match
+               FROM (SELECT value ->> 'career' AS career, value ->> 'score' AS score,
+                            value ->> 'tech_match' AS tech_match, value ->> 'personality_match' AS personality_match
+                     FROM json_each(OLD.recommendations, '$.ranking')) AS ranked
+               WHERE career_match_stats.career = ranked.career;
+           END""",
+    ],
+    # 7: persisted st.session_state.user_data, written behind by session_store
+    [
+        """CREATE TABLE IF NOT EXISTS user_sessions
+                 (user_id INTEGER PRIMARY KEY,
+                  data TEXT NOT NULL,
+                  updated_at TIMESTAMP,
+                  FOREIGN KEY(user_id) REFERENCES users(id))""",
+    ],
+    # 8: background jobs (see job_queue); times are epoch seconds for metrics
+    [
+        """CREATE TABLE IF NOT EXISTS jobs
+                 (id INTEGER PRIMARY KEY,
+                  kind TEXT NOT NULL,
+                  payload TEXT,
+                  dedupe_key TEXT,
+                  status TEXT NOT NULL,
+                  attempts INTEGER NOT NULL,
+                  max_attempts INTEGER NOT NULL,
+                  result TEXT,
+                  error TEXT,
+                  run_after REAL,
+                  enqueued_at REAL,
+                  started_at REAL,
+                  finished_at REAL)""",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs (status, run_after, id)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_kind_dedupe ON jobs (kind, dedupe_key)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at)",
+    ],
+    # 9: goal status audit trail, written by a trigger as part of the UPDATE
+    # itself, so bulk status changes cost no extra statements
+    [
+        """CREATE TABLE IF NOT EXISTS goal_status_history
+                 (id INTEGER PRIMARY KEY,
+                  goal_id INTEGER NOT NULL,
+                  user_id INTEGER,
+                  old_status TEXT,
+                  new_status TEXT,
+                  changed_at TIMESTAMP,
+                  FOREIGN KEY(goal_id) REFERENCES progress(id))""",
+        "CREATE INDEX IF NOT EXISTS idx_goal_status_history_goal ON goal_status_history (goal_id, id)",
+        "CREATE INDEX IF NOT EXISTS idx_goal_status_history_user ON goal_status_history (user_id, id)",
+        """CREATE TRIGGER IF NOT EXISTS goal_status_history_update AFTER UPDATE OF completion_status ON progress
+           WHEN OLD.completion_status IS NOT NEW.completion_status BEGIN
+               INSERT INTO goal_status_history (goal_id, user_id, old_status, new_status, changed_at)
+               VALUES (NEW.id, NEW.user_id, OLD.completion_status, NEW.completion_status,
+                       strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'));
+           END""",
+    ],
+    # 10: per-user dashboard counters, kept current by triggers
+    [
+        """CREATE TABLE IF NOT EXISTS user_stats
+                 (user_id INTEGER PRIMARY KEY,
+                  goals INTEGER NOT NULL DEFAULT 0,
+                  active_goals INTEGER NOT NULL DEFAULT 0,
+                  completed_goals INTEGER NOT NULL DEFAULT 0,
+                  on_hold_goals INTEGER NOT NULL DEFAULT 0,
+                  assessments INTEGER NOT NULL DEFAULT 0,
+                  last_assessment_at TIMESTAMP,
+                  FOREIGN KEY(user_id) REFERENCES users(id))""",
+        lambda conn: rebuild_user_stats(conn),
+        """CREATE TRIGGER IF NOT EXISTS user_stats_goal_insert AFTER INSERT ON progress
+           WHEN NEW.user_id IS NOT NULL BEGIN
+               INSERT INTO user_stats (user_id, goals, active_goals, completed_goals, on_hold_goals)
+               VALUES (NEW.user_id, 1, NEW.completion_status IS 'In Progress',
+                       NEW.completion_status IS 'Completed', NEW.completion_status IS 'On Hold')
+               ON CONFLICT (user_id) DO UPDATE SET
+                   goals = goals + 1,
+                   active_goals = active_goals + excluded.active_goals,
+                   completed_goals = completed_goals + excluded.completed_goals,
+                   on_hold_goals = on_hold_goals + excluded.on_hold_goals;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS user_stats_goal_delete AFTER DELETE ON progress
+           WHEN OLD.user_id IS NOT NULL BEGIN
+               UPDATE user_stats SET
+                   goals = goals - 1,
+                   active_goals = active_goals - (OLD.completion_status IS 'In Progress'),
+                   completed_goals = completed_goals - (OLD.completion_status IS 'Completed'),
+                   on_hold_goals = on_hold_goals - (OLD.completion_status IS 'On Hold')
+               WHERE user_id = OLD.user_id;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS user_stats_goal_update AFTER UPDATE OF user_id, completion_status ON progress
+           WHEN OLD.user_id IS NOT NEW.user_id OR OLD.completion_status IS NOT NEW.completion_status BEGIN
+               UPDATE user_stats SET
+                   goals = goals - 1,
+                   active_goals = active_goals - (OLD.completion_status IS 'In Progress'),
+                   completed_goals = completed_goals - (OLD.completion_status IS 'Completed'),
+                   on_hold_goals = on_hold_goals - (OLD.completion_status IS 'On Hold')
+               WHERE user_id = OLD.user_id;
+               INSERT INTO user_stats (user_id, goals, active_goals, completed_goals, on_hold_goals)
+               SELECT NEW.user_id, 1, NEW.completion_status IS 'In Progress',
+                      NEW.completion_status IS 'Completed', NEW.completion_status IS 'On Hold'
+               WHERE NEW.user_id IS NOT NULL
+               ON CONFLICT (user_id) DO UPDATE SET
+                   goals = goals + 1,
+                   active_goals = active_goals + excluded.active_goals,
+                   completed_goals = completed_goals + excluded.completed_goals,
+                   on_hold_goals = on_hold_goals + excluded.on_hold_goals;
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS user_stats_assessment_insert AFTER INSERT ON assessments
+           WHEN NEW.user_id IS NOT NULL BEGIN
+               INSERT INTO user_stats (user_id, assessments, last_assessment_at)
+               VALUES (NEW.user_id, 1, NEW.created_at)
+               ON CONFLICT (user_id) DO UPDATE SET
+                   assessments = assessments + 1,
+                   last_assessment_at = max(coalesce(last_assessment_at, excluded.last_assessment_at),
+                                            excluded.last_assessment_at);
+           END""",
+        # last_assessment_at is left as it was; only the count goes down
+        """CREATE TRIGGER IF NOT EXISTS user_stats_assessment_delete AFTER DELETE ON assessments
+           WHEN OLD.user_id IS NOT NULL BEGIN
+               UPDATE user_stats SET assessments = assessments - 1 WHERE user_id = OLD.user_id;
+           END""",
+    ],
+    # 11: technical skill time series (one row per assessment and skill,
+    # written by save_assessments) with weekly and monthly rollups per user
+    # and for the cohort; save_assessments adds each batch to the rollups
+    # (see score_store.add_skill_rollups) and triggers take deletes out
+    [
+        """CREATE TABLE IF NOT EXISTS skill_scores
+                 (user_id INTEGER NOT NULL,
+                  skill TEXT NOT NULL,
+                  assessed_at TIMESTAMP NOT NULL,
+                  assessment_id INTEGER NOT NULL,
+                  score REAL NOT NULL,
+                  PRIMARY KEY (user_id, skill, assessed_at, assessment_id)) WITHOUT ROWID""",
+        "CREATE INDEX IF NOT EXISTS idx_skill_scores_assessment ON skill_scores (assessment_id)",
+        """CREATE TABLE IF NOT EXISTS skill_score_rollups
+                 (user_id INTEGER NOT NULL,
+                  skill TEXT NOT NULL,
+                  period TEXT NOT NULL,
+                  period_start TEXT NOT NULL,
+                  samples INTEGER NOT NULL,
+                  score_sum REAL NOT NULL,
+                  PRIMARY KEY (user_id, skill, period, period_start)) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS cohort_skill_rollups
+                 (skill TEXT NOT NULL,
+                  period TEXT NOT NULL,
+                  period_start TEXT NOT NULL,
+                  samples INTEGER NOT NULL,
+                  score_sum REAL NOT NULL,
+                  PRIMARY KEY (skill, period, period_start)) WITHOUT ROWID""",
+        score_store_step("backfill_skill_scores"),
+        lambda conn: rebuild_skill_rollups(conn),
+        f"""CREATE TRIGGER IF NOT EXISTS skill_scores_delete AFTER DELETE ON skill_scores BEGIN
+               UPDATE skill_score_rollups SET samples = samples - 1, score_sum = score_sum - OLD.score
+               WHERE user_id = OLD.user_id AND skill = OLD.skill
+                 AND ((period = 'week' AND period_start = {PERIOD_START_SQL['week'].format('OLD.assessed_at')})
+                   OR (period = 'month' AND period_start = {PERIOD_START_SQL['month'].format('OLD.assessed_at')}));
+               UPDATE cohort_skill_rollups SET samples = samples - 1, score_sum = score_sum - OLD.score
+               WHERE skill = OLD.skill
+                 AND ((period = 'week' AND period_start = {PERIOD_START_SQL['week'].format('OLD.assessed_at')})
+                   OR (period = 'month' AND period_start = {PERIOD_START_SQL['month'].format('OLD.assessed_at')}));
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS skill_scores_assessment_delete AFTER DELETE ON assessments BEGIN
+               DELETE FROM skill_scores WHERE assessment_id = OLD.id;
+           END""",
+    ],
+    # 12: Debug page access; granted with admin_users.py, never by signing up
+    [
+        "ALTER TABLE users ADD COLUMN is_admin INTEGER NOT NULL DEFAULT 0",
+    ],
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+
+def now():
+    # Same text the sqlite3 default datetime adapter produced
+    return datetime.now().isoformat(" ")
+
+
+def parse_timestamp(value):
+    """An ISO-8601 date or date and time (or a datetime) as stored timestamp text, like now().
+
+    Aware times are converted to local time. Raises ValueError for anything
+    else, such as "01/05/2024", which SQLite's date functions turn into NULL.
+    """
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value).strip())
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat(" ")
+
+
+def migrate(conn, target=SCHEMA_VERSION):
+    """Bring the schema up to target (default: latest). Returns the version found."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= target:
+        return version
+    # IMMEDIATE takes the write lock up front so two processes starting at
+    # once cannot both apply the same migration
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, statements in enumerate(MIGRATIONS[version:target], start=version + 1):
+            for statement in statements:
+                if callable(statement):
+                    statement(conn)
+                else:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {number}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return version
+
+
+# Query Timing
+# With metrics enabled, pooled connections time every statement in a db.*
+# span named after its verb and table.
+_STATEMENT_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+(\w+)", re.I)
+
+
+@lru_cache(maxsize=512)
+def _statement_name(sql):
+    """Span name for a statement: "db.select progress" for queries, "db.create" for DDL."""
+    words = sql.split(None, 1)
+    if not words:
+        return "db.empty"
+    verb = words[0].lower()
+    if verb not in ("select", "insert", "update", "delete", "replace", "with"):
+        return f"db.{verb}"
+    table = _STATEMENT_TABLE.search(sql)
+    return f"db.{verb} {table.group(1).lower()}" if table else f"db.{verb}"
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor recording each statement in a db.* span (the first row's work, not later fetches)."""
+
+    def execute(self, sql, parameters=()):
+        with metrics.span(_statement_name(sql)):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        with metrics.span(_statement_name(sql)):
+            return super().executemany(sql, seq_of_parameters)
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection whose cursors, and its execute shortcuts, are TimedCursors."""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+# Connection Pool
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared by all sessions.
+
+    Connections are opened lazily, configured with PRAGMAS once and then
+    reused, so the per-connection statement cache keeps prepared statements
+    warm across reruns. A connection is only ever used by one thread at a
+    time.
+    """
+
+    def __init__(self, path, size=POOL_SIZE, timeout=30.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        # Statements are only timed with metrics enabled; the plain
+        # connection keeps the C fast path otherwise
+        factory = TimedConnection if metrics.ENABLED else sqlite3.Connection
+        conn = sqlite3.connect(self.path, timeout=self.timeout, factory=factory,
+                               check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._open()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        return self._idle.get(timeout=self.timeout)
+
+    def release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; commits on success, rolls back on error.
+
+        The db.connection span covers the wait for it and the whole
+        transaction, commit included.
+        """
+        with metrics.span("db.connection"):
+            conn = self.acquire()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self.release(conn)
+
+    def close(self):
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._opened = 0
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide pool, running migrations the first time."""
+    global _pool
+    pool = _pool
+    if pool is not None:
+        return pool
+    with _pool_lock:
+        if _pool is None:
+            pool = ConnectionPool(DB_PATH)
+            conn = pool.acquire()
+            try:
+                migrate(conn)
+            finally:
+                pool.release(conn)
+            _pool = pool
+        return _pool
+
+
+def set_database(path):
+    """Point the process-wide pool at another database file (tools, benchmarks)."""
+    global _pool, DB_PATH
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = None
+        DB_PATH = path
+
+
+def connection():
+    return get_pool().connection()
+
+
+def explain(conn, query, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for query."""
+    return [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+
+
+def init_database():
+    get_pool()
+
+
+# Users
+# Passwords are stored in the self-describing format of the passwords
+# module; legacy SHA-256 digests are upgraded on the next successful login.
+def create_user(username, password, email):
+    encoded = passwords.hash_password(password)
+    try:
+        with connection() as conn:
+            conn.execute("INSERT INTO users (username, password, email, created_at) VALUES (?, ?, ?, ?)",
+                         (username, encoded, email, now()))
+        return True
+    except sqlite3.IntegrityError:
+        return False
+
+
+def verify_user(username, password):
+    """Return (id, username) when the password matches, else None.
+
+    Raises passwords.HasherBusy when too many logins are already queued.
+    """
+    with connection() as conn:
+        row = conn.execute("SELECT id, username, password FROM users WHERE username = ?", (username,)).fetchone()
+    ok, new_hash = passwords.check_password(password, row["password"] if row else None)
+    if not ok:
+        return None
+    if new_hash is not None:
+        # Only replace the hash that was checked, in case it changed meanwhile
+        with connection() as conn:
+            conn.execute("UPDATE users SET password = ? WHERE id = ? AND password = ?",
+                         (new_hash, row["id"], row["password"]))
+    return row["id"], row["username"]
+
+
+def is_admin(user_id):
+    with connection() as conn:
+        row = conn.execute("SELECT is_admin FROM users WHERE id = ?", (user_id,)).fetchone()
+    return bool(row and row[0])
+
+
+def set_admin(username, admin=True):
+    """Grant or revoke the Debug page for an existing user. Returns False if there is no such user."""
+    with connection() as conn:
+        return conn.execute("UPDATE users SET is_admin = ? WHERE username = ?",
+                            (int(admin), username)).rowcount > 0
+
+
+def admin_usernames():
+    with connection() as conn:
+        return [row[0] for row in conn.execute("SELECT username FROM users WHERE is_admin ORDER BY username")]
+
+
+# Sessions
+def load_user_session(user_id):
+    """The user's saved session data as JSON text, or None."""
+    with connection() as conn:
+        row = conn.execute("SELECT data FROM user_sessions WHERE user_id = ?", (user_id,)).fetchone()
+    return row[0] if row else None
+
+
+def save_user_sessions(rows):
+    """Upsert many (user_id, data JSON) rows in one transaction."""
+    updated_at = now()
+    with connection() as conn:
+        conn.executemany("""INSERT INTO user_sessions (user_id, data, updated_at) VALUES (?, ?, ?)
+                         ON CONFLICT (user_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at""",
+                         ((user_id, data, updated_at) for user_id, data in rows))
+
+
+# Assessments
+INSERT_ASSESSMENT_SQL = """INSERT INTO assessments
+                         (user_id, score_vector, score_layout, recommendations, fingerprint, created_at)
+                         VALUES (?, ?, ?, ?, ?, ?)"""
+
+
+def save_assessment(user_id, technical_skills, personality_traits, career_interests, recommendations,
+                    fingerprint=None):
+    save_assessments([(user_id, technical_skills, personality_traits, career_interests,
+                       recommendations, fingerprint, None)])
+
+
+def save_assessments(records):
+    """Insert many assessments with executemany in a single transaction.
+
+    Each record is (user_id, technical_skills, personality_traits,
+    career_interests, recommendations, fingerprint, created_at); the scores
+    are packed into a score vector here. created_at goes through
+    parse_timestamp (ValueError if it is not ISO-8601), and None means now.
+    The skill level aggregates, the skill_scores time series and its
+    rollups are updated in the same transaction.
+    """
+    import score_store
+
+    layout = score_store.current_layout()
+    records = [(user_id, technical_skills, personality_traits, career_interests, recommendations, fingerprint,
+                parse_timestamp(created_at) if created_at else now())
+               for user_id, technical_skills, personality_traits, career_interests, recommendations, fingerprint,
+                   created_at in records]
+    vectors = [score_store.pack_scores(layout, technical_skills, personality_traits, career_interests)
+               for _, technical_skills, personality_traits, career_interests, _, _, _ in records]
+    with connection() as conn:
+        # The write lock up front: no other writer can take ids between
+        # the insert and reading them back
+        conn.execute("BEGIN IMMEDIATE")
+        last_id = conn.execute("SELECT coalesce(max(id), 0) FROM assessments").fetchone()[0]
+        layout_key = score_store.layout_id(conn, layout)
+        score_store.add_skill_levels(conn, layout, vectors)
+        conn.executemany(INSERT_ASSESSMENT_SQL,
+                         ((user_id, vector, layout_key, json.dumps(recommendations), fingerprint, created_at)
+                          for (user_id, _, _, _, recommendations, fingerprint, created_at), vector
+                          in zip(records, vectors)))
+        assessment_ids = [row[0] for row in conn.execute("SELECT id FROM assessments WHERE id > ? ORDER BY id",
+                                                         (last_id,))]
+        score_store.add_skill_scores(conn, layout, assessment_ids, [record[0] for record in records],
+                                     [record[6] for record in records], vectors)
+
+
+def delete_assessments(assessment_ids):
+    """Delete assessments and take them out of every aggregate in one transaction.
+
+    Triggers update the other aggregates; skill_level_stats is decremented
+    here from the packed vectors. Returns how many assessments were deleted.
+    """
+    import score_store
+
+    layout = score_store.current_layout()
+    ids = json.dumps([int(assessment_id) for assessment_id in assessment_ids])
+    with connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        layout_key = score_store.layout_id(conn, layout)
+        blobs = [row[0] for row in conn.execute("""SELECT score_vector FROM assessments
+                                                WHERE id IN (SELECT value FROM json_each(?)) AND score_layout = ?""",
+                                                (ids, layout_key))]
+        score_store.add_skill_levels(conn, layout, blobs, sign=-1)
+        return conn.execute("DELETE FROM assessments WHERE id IN (SELECT value FROM json_each(?))", (ids,)).rowcount
+
+
+def find_recommendations(user_id, fingerprint):
+    """Stored recommendations for this exact assessment, or None."""
+    with connection() as conn:
+        row = conn.execute("""SELECT recommendations FROM assessments
+                           WHERE user_id = ? AND fingerprint = ?
+                           ORDER BY created_at DESC LIMIT 1""", (user_id, fingerprint)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def latest_recommendations(user_id):
+    """Recommendations from the user's most recent fingerprinted assessment, or None."""
+    with connection() as conn:
+        row = conn.execute("""SELECT recommendations FROM assessments
+                           WHERE user_id = ? AND fingerprint IS NOT NULL
+                           ORDER BY created_at DESC LIMIT 1""", (user_id,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+# Cohort Analytics
+# Counsellor views read small aggregate tables whose size depends on the
+# catalog, not on the number of users. goal_stats and career_match_stats are
+# maintained by triggers; skill_level_stats by save_assessments and
+# delete_assessments (see score_store), since SQL cannot read the packed
+# score vectors. Assessments deleted any other way stay counted there
+# until rebuild_cohort_stats runs.
+def rebuild_cohort_stats(conn, batch_size=50_000):
+    """Recompute every cohort aggregate from the base tables."""
+    import score_store
+
+    conn.execute("DELETE FROM goal_stats")
+    conn.execute("DELETE FROM career_match_stats")
+    conn.execute("DELETE FROM skill_level_stats")
+    conn.execute("""INSERT INTO goal_stats (goal_type, completion_status, goals)
+                 SELECT coalesce(goal_type, ''), coalesce(completion_status, ''), COUNT(*)
+                 FROM progress GROUP BY 1, 2""")
+    conn.execute("""INSERT INTO career_match_stats (career, rankings, score_sum, tech_match_sum, personality_match_sum)
+                 SELECT ranked.value ->> 'career', COUNT(*), SUM(ranked.value ->> 'score'),
+                        SUM(ranked.value ->> 'tech_match'), SUM(ranked.value ->> 'personality_match')
+                 FROM assessments, json_each(assessments.recommendations, '$.ranking') AS ranked
+                 GROUP BY 1""")
+
+    score_store.rebuild_skill_levels(conn, batch_size)
+
+
+def rebuild_user_stats(conn):
+    """Recompute every user's dashboard counters from progress and assessments."""
+    conn.execute("DELETE FROM user_stats")
+    conn.execute("""INSERT INTO user_stats (user_id, goals, active_goals, completed_goals, on_hold_goals)
+                 SELECT user_id, COUNT(*), SUM(completion_status IS 'In Progress'),
+                        SUM(completion_status IS 'Completed'), SUM(completion_status IS 'On Hold')
+                 FROM progress WHERE user_id IS NOT NULL GROUP BY user_id""")
+    conn.execute("""INSERT INTO user_stats (user_id, assessments, last_assessment_at)
+                 SELECT user_id, COUNT(*), MAX(created_at)
+                 FROM assessments WHERE user_id IS NOT NULL GROUP BY user_id
+                 ON CONFLICT (user_id) DO UPDATE SET
+                     assessments = excluded.assessments,
+                     last_assessment_at = excluded.last_assessment_at""")
+
+
+def cohort_skill_distribution():
+    """Rows of (skill, level, assessments)."""
+    with connection() as conn:
+        return conn.execute("""SELECT skill, level, assessments FROM skill_level_stats
+                           WHERE assessments > 0 ORDER BY skill, level""").fetchall()
+
+
+def cohort_career_matches():
+    """Rows of (career, rankings, avg_score, avg_tech_match, avg_personality_match), best first."""
+    with connection() as conn:
+        return conn.execute("""SELECT career, rankings, score_sum / rankings AS avg_score,
+                                  tech_match_sum / rankings AS avg_tech_match,
+                                  personality_match_sum / rankings AS avg_personality_match
+                           FROM career_match_stats WHERE rankings > 0
+                           ORDER BY avg_score DESC""").fetchall()
+
+
+def cohort_goal_completion():
+    """Rows of (goal_type, goals, completed, completion_rate)."""
+    with connection() as conn:
+        return conn.execute("""SELECT goal_type, SUM(goals) AS goals,
+                                  SUM(CASE WHEN completion_status = 'Completed' THEN goals ELSE 0 END) AS completed,
+                                  1.0 * SUM(CASE WHEN completion_status = 'Completed' THEN goals ELSE 0 END)
+                                      / SUM(goals) AS completion_rate
+                           FROM goal_stats GROUP BY goal_type HAVING SUM(goals) > 0
+                           ORDER BY goal_type""").fetchall()
+
+
+# Skill Trends
+# skill_scores holds every assessed technical score keyed by (user_id,
+# skill, assessed_at), so one user's history of one skill is a single
+# primary key range; the rollups hold weekly and monthly sums and counts,
+# added to per batch by save_assessments and taken back by triggers when
+# skill_scores rows are deleted.
+def rebuild_skill_rollups(conn):
+    """Recompute the weekly and monthly skill rollups from skill_scores."""
+    conn.execute("DELETE FROM skill_score_rollups")
+    conn.execute("DELETE FROM cohort_skill_rollups")
+    for period, start in PERIOD_START_SQL.items():
+        conn.execute(f"""INSERT INTO skill_score_rollups (user_id, skill, period, period_start, samples, score_sum)
+                     SELECT user_id, skill, ?, {start.format('assessed_at')}, COUNT(*), SUM(score)
+                     FROM skill_scores GROUP BY 1, 2, 4""", (period,))
+        conn.execute(f"""INSERT INTO cohort_skill_rollups (skill, period, period_start, samples, score_sum)
+                     SELECT skill, ?, {start.format('assessed_at')}, COUNT(*), SUM(score)
+                     FROM skill_scores GROUP BY 1, 3""", (period,))
+
+
+def _period_range(clauses, params, column, start, end):
+    if start is not None:
+        clauses.append(f"{column} >= ?")
+        params.append(str(start))
+    if end is not None:
+        clauses.append(f"{column} < ?")
+        params.append(str(end))
+
+
+def _check_period(period):
+    if period not in ROLLUP_PERIODS:
+        raise ValueError(f"unknown period {period!r}; expected one of {ROLLUP_PERIODS}")
+
+
+def skill_history(user_id, skill, start=None, end=None):
+    """Rows of (assessed_at, score) for one user's skill, oldest first; start <= assessed_at < end."""
+    clauses, params = ["user_id = ?", "skill = ?"], [user_id, skill]
+    _period_range(clauses, params, "assessed_at", start, end)
+    with connection() as conn:
+        return conn.execute(f"""SELECT assessed_at, score FROM skill_scores WHERE {' AND '.join(clauses)}
+                            ORDER BY assessed_at, assessment_id""", params).fetchall()
+
+
+def skill_trend(user_id, skill, period="month", start=None, end=None):
+    """Rows of (period_start, samples, avg_score) for one user's skill, oldest first.
+
+    period is "week" (starting Monday) or "month"; start and end bound
+    period_start as dates.
+    """
+    _check_period(period)
+    clauses, params = ["user_id = ?", "skill = ?", "period = ?", "samples > 0"], [user_id, skill, period]
+    _period_range(clauses, params, "period_start", start, end)
+    with connection() as conn:
+        return conn.execute(f"""SELECT period_start, samples, score_sum / samples AS avg_score
+                            FROM skill_score_rollups WHERE {' AND '.join(clauses)}
+                            ORDER BY period_start""", params).fetchall()
+
+
+def cohort_skill_trend(skill, period="month", start=None, end=None):
+    """Rows of (period_start, samples, avg_score) for a skill across every user, oldest first."""
+    _check_period(period)
+    clauses, params = ["skill = ?", "period = ?", "samples > 0"], [skill, period]
+    _period_range(clauses, params, "period_start", start, end)
+    with connection() as conn:
+        return conn.execute(f"""SELECT period_start, samples, score_sum / samples AS avg_score
+                            FROM cohort_skill_rollups WHERE {' AND '.join(clauses)}
+                            ORDER BY period_start""", params).fetchall()
+
+
+# Progress Goals
+GOAL_STATUSES = ["In Progress", "Completed", "On Hold", "Cancelled"]
+GOAL_TYPES = ["Skill Development", "Certification", "Project Completion", "Job Application"]
+
+# Only what the goal list renders; descriptions are cut to the 50 characters
+# shown in the expander title instead of shipping the whole text
+GOAL_LIST_COLUMNS = ("id, goal_type, substr(goal_description, 1, 50) AS goal_summary, "
+                     "target_date, completion_status, created_at")
+
+
+def goal_page_query(user_id, limit, after=None, status=None, goal_type=None):
+    """Build the keyset query for one page of a user's goals, newest first.
+
+    after is the (created_at, id) cursor of the last goal on the previous
+    page. Returns (sql, params); one extra row is fetched to tell whether
+    another page follows.
+    """
+    clauses = ["user_id = ?"]
+    params = [user_id]
+    if status:
+        clauses.append("completion_status = ?")
+        params.append(status)
+    if goal_type:
+        clauses.append("goal_type = ?")
+        params.append(goal_type)
+    if after is not None:
+        # The leading <= lets SQLite seek the index instead of filtering
+        clauses.append("created_at <= ? AND (created_at < ? OR id < ?)")
+        params.extend([after[0], after[0], after[1]])
+    sql = (f"SELECT {GOAL_LIST_COLUMNS} FROM progress WHERE {' AND '.join(clauses)} "
+           "ORDER BY created_at DESC, id DESC LIMIT ?")
+    params.append(limit + 1)
+    return sql, params
+
+
+def add_goal(user_id, goal_type, goal_description, target_date, completion_status="In Progress"):
+    with connection() as conn:
+        conn.execute("""INSERT INTO progress
+                     (user_id, goal_type, goal_description, target_date, completion_status, created_at)
+                     VALUES (?, ?, ?, ?, ?, ?)""",
+                     (user_id, goal_type, goal_description, str(target_date), completion_status, now()))
+
+
+def list_goals_page(user_id, limit=20, after=None, status=None, goal_type=None):
+    """Return (goals, next_cursor); next_cursor is None on the last page."""
+    sql, params = goal_page_query(user_id, limit, after, status, goal_type)
+    with connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        return rows[:limit], (last["created_at"], last["id"])
+    return rows, None
+
+
+def update_goal_statuses(user_id, changes):
+    """Apply {goal_id: status} to the user's goals in one transaction.
+
+    Goals of other users and goals already in that status are left alone.
+    Each change gets a goal_status_history row from the update trigger.
+    Returns how many goals changed.
+    """
+    unknown = set(changes.values()) - set(GOAL_STATUSES)
+    if unknown:
+        raise ValueError(f"unknown goal status {sorted(unknown)}; expected one of {GOAL_STATUSES}")
+    with connection() as conn:
+        cursor = conn.executemany("""UPDATE progress SET completion_status = ?
+                                  WHERE id = ? AND user_id = ? AND completion_status IS NOT ?""",
+                                  [(status, goal_id, user_id, status) for goal_id, status in changes.items()])
+        return cursor.rowcount
+
+
+def goal_status_history(user_id, limit=10, goal_id=None):
+    """The user's most recent goal status changes (optionally one goal's), newest first."""
+    if goal_id is None:
+        sql = "SELECT * FROM goal_status_history WHERE user_id = ? ORDER BY id DESC LIMIT ?"
+        params = (user_id, limit)
+    else:
+        sql = "SELECT * FROM goal_status_history WHERE goal_id = ? AND user_id = ? ORDER BY id DESC LIMIT ?"
+        params = (goal_id, user_id, limit)
+    with connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+USER_STATS_COLUMNS = ("goals", "active_goals", "completed_goals", "on_hold_goals", "assessments",
+                      "last_assessment_at")
+
+
+def user_stats(user_id):
+    """The user's goal and assessment counters (one primary key lookup); zeros for a new user."""
+    with connection() as conn:
+        row = conn.execute(f"SELECT {', '.join(USER_STATS_COLUMNS)} FROM user_stats WHERE user_id = ?",
+                           (user_id,)).fetchone()
+    if row is None:
+        return {**dict.fromkeys(USER_STATS_COLUMNS, 0), "last_assessment_at": None}
+    return dict(row)
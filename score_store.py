@@ -0,0 +1,229 @@
+# AI-Powered Career and Skills Advisor - Score Vector Storage
+# An assessment's scores are stored as one little-endian float32 vector in
+# the order of a score layout (technical skills, then personality traits,
+# then career interests). Layouts are registered in score_layouts so rows
+# written before a catalog change still decode. Kept apart from repository
+# so that screens which never touch scores do not load numpy or the catalog.
+
+import json
+from datetime import date
+from itertools import repeat
+
+import numpy as np
+
+import repository
+from career_engine import get_advisor
+
+SCORE_DTYPE = np.dtype("<f4")
+
+
+def current_layout():
+    return get_advisor().score_layout()
+
+
+def layout_id(conn, layout):
+    """Id of layout in score_layouts, registering it on first use."""
+    features = json.dumps(layout)
+    row = conn.execute("SELECT id FROM score_layouts WHERE features = ?", (features,)).fetchone()
+    if row is None:
+        return conn.execute("INSERT INTO score_layouts (features) VALUES (?)", (features,)).lastrowid
+    return row[0]
+
+
+def pack_scores(layout, technical_skills, personality_traits, career_interests):
+    values = [technical_skills.get(name, np.nan) for name in layout["technical_skills"]]
+    values += [personality_traits.get(name, np.nan) for name in layout["personality_traits"]]
+    values += [career_interests.get(name, np.nan) for name in layout["career_interests"]]
+    return np.array(values, dtype=SCORE_DTYPE).tobytes()
+
+
+def unpack_scores(layout, blob):
+    """Inverse of pack_scores: (technical_skills, personality_traits, career_interests) dicts."""
+    vector = np.frombuffer(blob, dtype=SCORE_DTYPE).tolist()
+    groups, start = [], 0
+    for names in layout.values():
+        groups.append({name: value for name, value in zip(names, vector[start:start + len(names)])
+                       if value == value})
+        start += len(names)
+    return tuple(groups)
+
+
+def scores_matrix(blobs, n_features):
+    """Join packed vectors into one buffer and view it as an N x features matrix."""
+    return np.frombuffer(b"".join(blobs), dtype=SCORE_DTYPE).reshape(-1, n_features)
+
+
+def backfill_score_vectors(conn, batch_size=10_000):
+    """Pack the JSON scores of rows written before migration 5."""
+    layout = current_layout()
+    layout_key = layout_id(conn, layout)
+    last_id = 0
+    while True:
+        rows = conn.execute("""SELECT id, technical_skills, personality_traits, career_interests
+                            FROM assessments WHERE id > ? AND score_vector IS NULL
+                            ORDER BY id LIMIT ?""", (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        conn.executemany("UPDATE assessments SET score_vector = ?, score_layout = ? WHERE id = ?",
+                         ((pack_scores(layout, *(json.loads(col or "{}") for col in row[1:])), layout_key, row[0])
+                          for row in rows))
+        last_id = rows[-1][0]
+
+
+def load_score_matrix(user_ids=None):
+    """Load a cohort's assessments as (assessment ids, user ids, float32 matrix).
+
+    Only rows in the current layout are returned; columns follow
+    current_layout(). With user_ids, only those users' assessments.
+    """
+    layout = current_layout()
+    n_features = sum(len(names) for names in layout.values())
+    with repository.connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        sql = "SELECT id, user_id, score_vector FROM assessments WHERE score_layout = ?"
+        params = [layout_id(conn, layout)]
+        if user_ids is not None:
+            sql += " AND user_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps([int(u) for u in user_ids]))
+        rows = cursor.execute(sql, params).fetchall()
+    if not rows:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty((0, n_features), dtype=SCORE_DTYPE)
+    ids, users, blobs = zip(*rows)
+    return np.array(ids), np.array(users), scores_matrix(blobs, n_features)
+
+
+# Skill level aggregates for the cohort analytics page
+def add_skill_levels(conn, layout, blobs, sign=1):
+    """Count the technical scores of packed vectors into skill_level_stats (sign=-1 takes them out)."""
+    skills = layout["technical_skills"]
+    n_features = sum(len(names) for names in layout.values())
+    levels = np.rint(scores_matrix(blobs, n_features)[:, :len(skills)])
+    counts = []
+    for j, skill in enumerate(skills):
+        column = levels[:, j]
+        values, n = np.unique(column[~np.isnan(column)].astype(int), return_counts=True)
+        counts.extend((skill, int(level), sign * int(count)) for level, count in zip(values, n))
+    conn.executemany("""INSERT INTO skill_level_stats (skill, level, assessments) VALUES (?, ?, ?)
+                     ON CONFLICT (skill, level) DO UPDATE SET assessments = assessments + excluded.assessments""",
+                     counts)
+
+
+def rebuild_skill_levels(conn, batch_size=50_000):
+    """Recount skill_level_stats from every vector in the current layout."""
+    layout = current_layout()
+    layout_key = layout_id(conn, layout)
+    last_id = 0
+    while True:
+        rows = conn.execute("""SELECT id, score_vector FROM assessments
+                            WHERE score_layout = ? AND id > ? ORDER BY id LIMIT ?""",
+                            (layout_key, last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        add_skill_levels(conn, layout, [row[1] for row in rows])
+        last_id = rows[-1][0]
+
+
+# Skill time series for the trend queries and its weekly and monthly rollups
+INSERT_SKILL_SCORE_SQL = """INSERT INTO skill_scores (user_id, skill, assessed_at, assessment_id, score)
+                            VALUES (?, ?, ?, ?, ?)"""
+UPSERT_SKILL_ROLLUP_SQL = """INSERT INTO skill_score_rollups (user_id, skill, period, period_start, samples, score_sum)
+                             VALUES (?, ?, ?, ?, ?, ?)
+                             ON CONFLICT (user_id, skill, period, period_start) DO UPDATE SET
+                                 samples = samples + excluded.samples, score_sum = score_sum + excluded.score_sum"""
+UPSERT_COHORT_ROLLUP_SQL = """INSERT INTO cohort_skill_rollups (skill, period, period_start, samples, score_sum)
+                              VALUES (?, ?, ?, ?, ?)
+                              ON CONFLICT (skill, period, period_start) DO UPDATE SET
+                                  samples = samples + excluded.samples, score_sum = score_sum + excluded.score_sum"""
+
+
+def skill_score_rows(layout, assessment_ids, user_ids, assessed_ats, blobs):
+    """skill_scores rows for the technical scores of packed vectors (missing scores skipped)."""
+    skills = layout["technical_skills"]
+    n_features = sum(len(names) for names in layout.values())
+    scores = scores_matrix(blobs, n_features)[:, :len(skills)].tolist()
+    return [(user_id, skill, assessed_at, assessment_id, score)
+            for assessment_id, user_id, assessed_at, row in zip(assessment_ids, user_ids, assessed_ats, scores)
+            if user_id is not None
+            for skill, score in zip(skills, row) if score == score]
+
+
+def add_skill_rollups(conn, layout, user_ids, assessed_ats, blobs):
+    """Add the technical scores of packed vectors to the weekly and monthly rollups.
+
+    Like add_skill_levels, the batch is summed per (user, skill, period
+    start) with numpy and each table gets one executemany upsert.
+    """
+    # Skills numbered in name order, so the sorted keys follow the primary keys
+    skills = np.array(sorted(layout["technical_skills"]), dtype=object)
+    skill_codes = np.argsort(np.argsort(np.array(layout["technical_skills"], dtype=object)))
+    n_features = sum(len(names) for names in layout.values())
+    known = np.array([user_id is not None for user_id in user_ids], dtype=bool)
+    scores = scores_matrix(blobs, n_features)[known, :len(skills)]
+    rows, cols = np.nonzero(~np.isnan(scores))
+    if not len(rows):
+        return
+    values = scores[rows, cols].astype(np.float64)
+    cols = skill_codes[cols]
+    users, user_codes = np.unique(np.array(user_ids)[known].astype(np.int64), return_inverse=True)
+    days = [date.fromisoformat(assessed_at[:10]) for assessed_at in np.array(assessed_ats)[known]]
+    user_rollups, cohort_rollups = [], []
+    for period, start in repository.PERIOD_START.items():
+        starts, start_codes = np.unique([start(day).isoformat() for day in days], return_inverse=True)
+        starts = starts.astype(object)
+        # (user, skill, period start) as one integer key per score
+        keys = (user_codes[rows] * len(skills) + cols) * len(starts) + start_codes[rows]
+        keys, inverse = np.unique(keys, return_inverse=True)
+        user_keys, skill_keys = np.divmod(keys, len(starts) * len(skills))
+        skill_keys, start_keys = np.divmod(skill_keys, len(starts))
+        samples = np.bincount(inverse)
+        sums = np.bincount(inverse, weights=values)
+        user_rollups += zip(users[user_keys].tolist(), skills[skill_keys].tolist(), repeat(period),
+                            starts[start_keys].tolist(), samples.tolist(), sums.tolist())
+        # and the cohort's, from those sums
+        keys, inverse = np.unique(skill_keys * len(starts) + start_keys, return_inverse=True)
+        skill_keys, start_keys = np.divmod(keys, len(starts))
+        cohort_rollups += zip(skills[skill_keys].tolist(), repeat(period), starts[start_keys].tolist(),
+                              np.bincount(inverse, weights=samples).astype(np.int64).tolist(),
+                              np.bincount(inverse, weights=sums).tolist())
+    conn.executemany(UPSERT_SKILL_ROLLUP_SQL, user_rollups)
+    conn.executemany(UPSERT_COHORT_ROLLUP_SQL, cohort_rollups)
+
+
+def add_skill_scores(conn, layout, assessment_ids, user_ids, assessed_ats, blobs):
+    conn.executemany(INSERT_SKILL_SCORE_SQL, skill_score_rows(layout, assessment_ids, user_ids, assessed_ats, blobs))
+    add_skill_rollups(conn, layout, user_ids, assessed_ats, blobs)
+
+
+def _assessed_at(created_at):
+    """A stored created_at as parse_timestamp text, or None if it is not a timestamp."""
+    try:
+        return repository.parse_timestamp(created_at)
+    except ValueError:
+        return None
+
+
+def backfill_skill_scores(conn, batch_size=10_000):
+    """Fill skill_scores from every stored vector, in whichever layout it was written.
+
+    Rows whose created_at is not ISO-8601 have no place in a time series
+    and are left out. The rollups are not touched; rebuild_skill_rollups
+    recomputes them afterwards.
+    """
+    layouts = {key: json.loads(features) for key, features in conn.execute("SELECT id, features FROM score_layouts")}
+    last_id = 0
+    while True:
+        rows = conn.execute("""SELECT id, user_id, created_at, score_layout, score_vector FROM assessments
+                            WHERE id > ? AND score_vector IS NOT NULL AND user_id IS NOT NULL
+                                  AND created_at IS NOT NULL
+                            ORDER BY id LIMIT ?""", (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        for layout_key, layout in layouts.items():
+            batch = [(assessment_id, user_id, assessed_at, blob)
+                     for assessment_id, user_id, created_at, key, blob in rows
+                     if key == layout_key and (assessed_at := _assessed_at(created_at)) is not None]
+            if batch:
+                ids, users, assessed_ats, blobs = zip(*batch)
+                conn.executemany(INSERT_SKILL_SCORE_SQL, skill_score_rows(layout, ids, users, assessed_ats, blobs))
+        last_id = rows[-1][0]
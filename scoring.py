@@ -0,0 +1,86 @@
+# AI-Powered Career and Skills Advisor - Assessment Scoring
+# Pure, UI-free scoring of raw answers into trait vectors. The Streamlit pages
+# and the bulk ingestion CLI are thin callers of this module.
+
+import numpy as np
+
+import catalog_store
+
+TECH_SCALE = (1, 7)
+LIKERT_SCALE = (1, 5)
+
+
+class QuestionBank:
+    """A question bank compiled for vectorized scoring.
+
+    Answers are laid out in bank order (every question of the first group,
+    then the second, ...). The reverse-key mask is computed once here, so
+    scoring never looks at the question text.
+    """
+
+    def __init__(self, questions, scale=LIKERT_SCALE, reverse_scored=None):
+        self.grouped = questions
+        self.groups = list(questions)
+        self.questions = [q for group in questions.values() for q in group]
+        self.scale = scale
+        self.sizes = np.array([len(group) for group in questions.values()])
+        self.starts = np.concatenate([[0], np.cumsum(self.sizes)[:-1]])
+        self.reverse_mask = np.array([bool(reverse_scored and reverse_scored(q)) for q in self.questions])
+
+    def __len__(self):
+        return len(self.questions)
+
+    def valid(self, answers):
+        """True for every row whose answers are all on the scale."""
+        answers = np.asarray(answers, dtype=float)
+        low, high = self.scale
+        return ((answers >= low) & (answers <= high)).all(axis=-1)
+
+    def score(self, answers):
+        """(..., questions) answers -> (..., groups) mean scores, reverse keys applied."""
+        answers = np.asarray(answers, dtype=float)
+        low, high = self.scale
+        keyed = np.where(self.reverse_mask, (low + high) - answers, answers)
+        return np.add.reduceat(keyed, self.starts, axis=-1) / self.sizes
+
+    def profile(self, answers):
+        """Score one respondent and return {group: score} like the pages store."""
+        return dict(zip(self.groups, self.score(answers).tolist()))
+
+
+# Compiled once per catalog snapshot (data/questions.json)
+@catalog_store.compiler("personality_bank")
+def _compile_personality(catalog):
+    return QuestionBank(catalog.personality_questions, reverse_scored=catalog.is_reverse_scored)
+
+
+@catalog_store.compiler("interest_bank")
+def _compile_interests(catalog):
+    return QuestionBank(catalog.riasec_questions)
+
+
+def personality_bank():
+    """The Big Five bank of the current catalog; render and score from the same one."""
+    return catalog_store.get_catalog().compiled("personality_bank")
+
+
+def interest_bank():
+    """The RIASEC bank of the current catalog."""
+    return catalog_store.get_catalog().compiled("interest_bank")
+
+
+def score_personality(answers):
+    """Big Five answers (..., questions) -> trait means (..., traits)."""
+    return personality_bank().score(answers)
+
+
+def score_interests(answers):
+    """RIASEC answers (..., questions) -> interest means (..., interests)."""
+    return interest_bank().score(answers)
+
+
+def valid_technical(answers):
+    answers = np.asarray(answers, dtype=float)
+    low, high = TECH_SCALE
+    return ((answers >= low) & (answers <= high)).all(axis=-1)
+
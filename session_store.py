@@ -0,0 +1,189 @@
+# AI-Powered Career and Skills Advisor - Session Store
+# Keeps each user's st.session_state.user_data (profile and assessment
+# scores) across logouts and server restarts.
+#
+# The pages call put() on every rerun; that only updates memory. A
+# background thread writes changed sessions behind, once a session has been
+# quiet for FLUSH_DEBOUNCE_SECONDS (or has waited FLUSH_MAX_DELAY_SECONDS),
+# batching every due session into one transaction. Sessions are rehydrated
+# from the database on first use after login, and at most MAX_SESSIONS are
+# held in memory; the least recently used are evicted, flushing first if
+# they have unsaved changes.
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import repository
+
+MAX_SESSIONS = int(os.environ.get("CAREER_SESSION_CACHE_SIZE", "2048"))
+FLUSH_DEBOUNCE_SECONDS = 2.0
+FLUSH_MAX_DELAY_SECONDS = 10.0
+FLUSH_INTERVAL_SECONDS = 0.5
+
+
+def _json_default(value):
+    # numpy scalars from the scoring code
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"cannot store {type(value).__name__} in a session")
+
+
+def encode(user_data):
+    return json.dumps(user_data, sort_keys=True, default=_json_default)
+
+
+class _Session:
+    __slots__ = ("encoded", "dirty_since", "changed_at")
+
+    def __init__(self, encoded):
+        self.encoded = encoded
+        self.dirty_since = None
+        self.changed_at = None
+
+
+class SessionStore:
+    """Thread-safe, bounded, write-behind store of user_data per user."""
+
+    def __init__(self, max_sessions=MAX_SESSIONS, debounce=FLUSH_DEBOUNCE_SECONDS,
+                 max_delay=FLUSH_MAX_DELAY_SECONDS, interval=FLUSH_INTERVAL_SECONDS):
+        self.max_sessions = max_sessions
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.interval = interval
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        # Held while choosing rows and writing them, so an older version of a
+        # session can never be written after a newer one. Always taken
+        # before _lock.
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._flusher = None
+
+    def get(self, user_id):
+        """A fresh copy of the user's data, loaded from the database if needed."""
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is not None:
+                self._sessions.move_to_end(user_id)
+                return json.loads(session.encoded)
+        # Under the write lock, so a session being evicted is read after its write
+        with self._write_lock:
+            stored = repository.load_user_session(user_id)
+        with self._lock:
+            # Another thread may have loaded or changed it meanwhile
+            session = self._sessions.get(user_id)
+            if session is None:
+                session = self._sessions[user_id] = _Session(stored or "{}")
+            encoded = session.encoded
+        self._evict()
+        return json.loads(encoded)
+
+    def put(self, user_id, user_data):
+        """Record the user's current data; written to the database later."""
+        encoded = encode(user_data)
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is not None and session.encoded == encoded:
+                self._sessions.move_to_end(user_id)
+                return
+            if session is None:
+                session = self._sessions[user_id] = _Session(encoded)
+            session.encoded = encoded
+            session.changed_at = now
+            if session.dirty_since is None:
+                session.dirty_since = now
+            self._sessions.move_to_end(user_id)
+        self._evict()
+        self._start()
+
+    def flush(self, user_id=None, force=True):
+        """Write dirty sessions now (all of them, or just user_id's)."""
+        with self._write_lock:
+            now = time.monotonic()
+            with self._lock:
+                due = [(uid, session) for uid, session in self._sessions.items()
+                       if session.dirty_since is not None and (user_id is None or uid == user_id)
+                       and (force or now - session.changed_at >= self.debounce
+                            or now - session.dirty_since >= self.max_delay)]
+                rows = [(uid, session.encoded) for uid, session in due]
+                for _, session in due:
+                    session.dirty_since = session.changed_at = None
+            try:
+                self._write(rows)
+            except Exception:
+                with self._lock:
+                    for (_, session), (_, encoded) in zip(due, rows):
+                        if session.dirty_since is None and session.encoded == encoded:
+                            session.dirty_since = session.changed_at = now
+                raise
+        return len(rows)
+
+    def discard(self, user_id):
+        """Flush and forget a user's session, e.g. on logout."""
+        self.flush(user_id)
+        with self._lock:
+            self._sessions.pop(user_id, None)
+
+    def close(self):
+        self._stopped = True
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict(self):
+        """Drop least recently used sessions over the limit, writing unsaved ones first."""
+        if len(self._sessions) <= self.max_sessions:
+            return
+        with self._write_lock:
+            with self._lock:
+                evicted = []
+                while len(self._sessions) > self.max_sessions:
+                    uid, session = self._sessions.popitem(last=False)
+                    if session.dirty_since is not None:
+                        evicted.append((uid, session.encoded))
+            self._write(evicted)
+
+    def _write(self, rows):
+        if rows:
+            repository.save_user_sessions(rows)
+
+    def _start(self):
+        if self._flusher is None:
+            with self._lock:
+                if self._flusher is None and not self._stopped:
+                    self._flusher = threading.Thread(target=self._run, name="session-flusher", daemon=True)
+                    self._flusher.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            try:
+                self.flush(force=False)
+            except sqlite3.Error:
+                # Still marked dirty; retried on the next pass
+                pass
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore()
+                atexit.register(_store.close)
+    return _store
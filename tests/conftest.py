@@ -0,0 +1,18 @@
+# AI-Powered Career and Skills Advisor - Test Fixtures
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository
+
+
+@pytest.fixture(autouse=True, scope="session")
+def scratch_database(tmp_path_factory):
+    """Point the repository pool at a throwaway file, never career_advisor.db."""
+    repository.set_database(str(tmp_path_factory.mktemp("db") / "test.db"))
+    yield
+    repository.get_pool().close()
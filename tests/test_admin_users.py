@@ -0,0 +1,27 @@
+# AI-Powered Career and Skills Advisor - Debug Page Access
+
+import admin_users
+import repository
+
+
+def user_id(username):
+    with repository.connection() as conn:
+        return conn.execute("SELECT id FROM users WHERE username = ?", (username,)).fetchone()[0]
+
+
+def test_signup_never_grants_admin():
+    assert repository.create_user("new_admin_name", "pw", "n@example.com")
+    assert not repository.is_admin(user_id("new_admin_name"))
+
+
+def test_grant_and_revoke_existing_users_only(capsys):
+    repository.create_user("counsellor", "pw", "c@example.com")
+    assert admin_users.main(["grant", "counsellor"]) == 0
+    assert repository.is_admin(user_id("counsellor"))
+    assert "counsellor" in repository.admin_usernames()
+
+    assert admin_users.main(["grant", "not_registered_yet"]) == 1
+    assert "not_registered_yet" not in repository.admin_usernames()
+
+    assert admin_users.main(["revoke", "counsellor"]) == 0
+    assert not repository.is_admin(user_id("counsellor"))
@@ -0,0 +1,57 @@
+# AI-Powered Career and Skills Advisor - Batch Scoring
+
+import numpy as np
+import pytest
+
+from career_engine import CareerAdvisor
+
+N_USERS = 300
+
+
+@pytest.fixture(scope="module")
+def advisor():
+    return CareerAdvisor()
+
+
+@pytest.fixture(scope="module")
+def cohort(advisor):
+    """A fixed sample of score dicts on the assessment scales (whole skill levels, Likert means)."""
+    rng = np.random.default_rng(42)
+    tech = rng.integers(1, 8, size=(N_USERS, len(advisor.technical_skills))).astype(float)
+    personality = rng.integers(1, 6, size=(N_USERS, len(advisor.personality_traits), 4)).mean(axis=2)
+    interests = rng.integers(1, 6, size=(N_USERS, len(advisor.career_interests), 3)).mean(axis=2)
+    return ([dict(zip(advisor.technical_skills, row)) for row in tech.tolist()],
+            [dict(zip(advisor.personality_traits, row)) for row in personality.tolist()],
+            [dict(zip(advisor.career_interests, row)) for row in interests.tolist()])
+
+
+def expected_rankings(advisor, cohort):
+    return [advisor.calculate_career_match(*user) for user in zip(*cohort)]
+
+
+def test_score_matches_calculate_career_match(advisor, cohort):
+    catalog = advisor.compile_catalog()
+    overall, tech_match, personality_match = catalog.score(*catalog.encode_users(*cohort))
+    columns = {career: j for j, career in enumerate(catalog.careers)}
+    for u, ranking in enumerate(expected_rankings(advisor, cohort)):
+        for rec in ranking:
+            j = columns[rec["career"]]
+            assert overall[u, j] == pytest.approx(rec["score"], rel=0, abs=1e-12)
+            assert tech_match[u, j] == pytest.approx(rec["tech_match"], rel=0, abs=1e-12)
+            assert personality_match[u, j] == pytest.approx(rec["personality_match"], rel=0, abs=1e-12)
+
+
+@pytest.mark.parametrize("k", [1, 5, None])
+def test_rank_scores_matches_calculate_career_match(advisor, cohort, k):
+    catalog = advisor.compile_catalog()
+    k = k or len(catalog.careers)
+    ranked = catalog.rank_scores(*catalog.score(*catalog.encode_users(*cohort)), k)
+    for u, ranking in enumerate(expected_rankings(advisor, cohort)):
+        assert [catalog.careers[j] for j in ranked["indices"][u]] == [rec["career"] for rec in ranking[:k]]
+        np.testing.assert_allclose(ranked["score"][u], [rec["score"] for rec in ranking[:k]], rtol=0, atol=1e-12)
+
+
+def test_batch_career_match_matches_calculate_career_match(advisor, cohort):
+    batch = advisor.batch_career_match(*cohort, top_k=5)
+    for got, ranking in zip(batch, expected_rankings(advisor, cohort)):
+        assert [rec["career"] for rec in got] == [rec["career"] for rec in ranking[:5]]
@@ -0,0 +1,72 @@
+# AI-Powered Career and Skills Advisor - Cohort Analytics
+
+import random
+
+import repository
+from career_engine import get_advisor
+
+USERS = list(range(980, 990))
+COHORT_TABLES = {
+    "goal_stats": ("goal_type, completion_status", "goals"),
+    "career_match_stats": ("career", "rankings, score_sum, tech_match_sum, personality_match_sum"),
+    "skill_level_stats": ("skill, level", "assessments"),
+}
+
+
+def cohort_tables(conn):
+    """Every cohort aggregate, sums rounded; rows counted down to zero are dropped."""
+    tables = {}
+    for table, (key, values) in COHORT_TABLES.items():
+        count = values.split(",")[0]
+        rows = conn.execute(f"SELECT {key}, {values} FROM {table} WHERE {count} > 0 ORDER BY {key}")
+        tables[table] = [tuple(round(value, 6) if isinstance(value, float) else value for value in row)
+                         for row in rows]
+    return tables
+
+
+def assessment(rng, advisor):
+    ranking = [{"career": career, "score": rng.uniform(1, 7), "tech_match": rng.uniform(1, 7),
+                "personality_match": rng.uniform(1, 5)}
+               for career in rng.sample(list(advisor.career_paths), 3)]
+    return (rng.choice(USERS),
+            {skill: rng.choice([1, 2, 3.4, 4.5, 5, 6.6, 7]) for skill in rng.sample(advisor.technical_skills, 4)},
+            {trait: 3.0 for trait in advisor.personality_traits},
+            {interest: 3.0 for interest in advisor.career_interests},
+            {"catalog_version": advisor.catalog_version, "ranking": ranking}, None, None)
+
+
+def test_cohort_tables_match_a_rebuild_after_saves_and_deletes():
+    rng = random.Random(12)
+    advisor = get_advisor()
+    for _ in range(20):
+        repository.save_assessments([assessment(rng, advisor) for _ in range(rng.randint(1, 8))])
+        repository.add_goal(rng.choice(USERS), rng.choice(["Skill", "Career", "Course"]), "goal", "2025-01-01")
+        with repository.connection() as conn:
+            assessments = [row[0] for row in conn.execute("SELECT id FROM assessments WHERE user_id BETWEEN ? AND ?",
+                                                          (USERS[0], USERS[-1]))]
+            goals = [row[0] for row in conn.execute("SELECT id FROM progress WHERE user_id BETWEEN ? AND ?",
+                                                    (USERS[0], USERS[-1]))]
+        repository.delete_assessments(rng.sample(assessments, min(3, len(assessments))))
+        with repository.connection() as conn:
+            conn.execute("UPDATE progress SET completion_status = ? WHERE id = ?",
+                         (rng.choice(repository.GOAL_STATUSES), rng.choice(goals)))
+            if rng.random() < 0.3:
+                conn.execute("DELETE FROM progress WHERE id = ?", (rng.choice(goals),))
+
+    with repository.connection() as conn:
+        live = cohort_tables(conn)
+        conn.execute("SAVEPOINT rebuild")
+        repository.rebuild_cohort_stats(conn)
+        rebuilt = cohort_tables(conn)
+        conn.execute("ROLLBACK TO rebuild")
+    assert live == rebuilt
+    assert all(live.values())
+
+
+def test_delete_assessments_counts_only_existing_rows():
+    advisor = get_advisor()
+    repository.save_assessments([assessment(random.Random(13), advisor)])
+    with repository.connection() as conn:
+        last_id = conn.execute("SELECT max(id) FROM assessments").fetchone()[0]
+    assert repository.delete_assessments([last_id, last_id + 1000]) == 1
+    assert repository.delete_assessments([last_id]) == 0
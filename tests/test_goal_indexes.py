@@ -0,0 +1,29 @@
+# AI-Powered Career and Skills Advisor - Goal Query Plans
+
+import sqlite3
+
+import pytest
+
+import repository
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    repository.migrate(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("filters, index", [
+    ({}, "idx_progress_user_created"),
+    ({"after": ("2026-01-01 00:00:00", 5)}, "idx_progress_user_created"),
+    ({"goal_type": "Certification"}, "idx_progress_user_created"),
+    ({"status": "On Hold"}, "idx_progress_user_status_created"),
+    ({"status": "Completed", "after": ("2026-01-01 00:00:00", 5)}, "idx_progress_user_status_created"),
+])
+def test_goal_pages_use_index(conn, filters, index):
+    plan = repository.explain(conn, *repository.goal_page_query(1, 20, **filters))
+    assert any(f"USING INDEX {index}" in line for line in plan), plan
+    # Newest first comes from the index order, not a sort
+    assert not any("TEMP B-TREE" in line for line in plan), plan
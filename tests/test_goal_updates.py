@@ -0,0 +1,75 @@
+# AI-Powered Career and Skills Advisor - Goal Status Updates
+
+import pytest
+
+import repository
+
+OWNER, OTHER = 990, 991
+
+
+def goal_stats(conn):
+    return [tuple(row) for row in conn.execute("""SELECT goal_type, completion_status, goals FROM goal_stats
+                                               WHERE goals > 0 ORDER BY 1, 2""")]
+
+
+def statuses(goal_ids):
+    with repository.connection() as conn:
+        return [conn.execute("SELECT completion_status FROM progress WHERE id = ?", (goal_id,)).fetchone()[0]
+                for goal_id in goal_ids]
+
+
+@pytest.fixture
+def goals():
+    """Three goals of OWNER and one of OTHER, all In Progress; ids in that order."""
+    for user_id, goal_type in ((OWNER, "Skill"), (OWNER, "Skill"), (OWNER, "Career"), (OTHER, "Skill")):
+        repository.add_goal(user_id, goal_type, "goal", "2025-06-30")
+    with repository.connection() as conn:
+        rows = conn.execute("SELECT id FROM progress WHERE user_id IN (?, ?) ORDER BY id DESC LIMIT 4",
+                            (OWNER, OTHER)).fetchall()
+    return [row[0] for row in reversed(rows)]
+
+
+def test_only_the_users_own_goals_change(goals):
+    mine, theirs = goals[0], goals[3]
+    assert repository.update_goal_statuses(OWNER, {mine: "Completed", theirs: "Completed"}) == 1
+    assert statuses([mine, theirs]) == ["Completed", "In Progress"]
+    assert repository.goal_status_history(OTHER, goal_id=theirs) == []
+
+
+def test_unchanged_statuses_are_skipped(goals):
+    assert repository.update_goal_statuses(OWNER, {goals[0]: "In Progress", goals[1]: "In Progress"}) == 0
+    assert repository.update_goal_statuses(OWNER, {goals[0]: "On Hold", goals[1]: "In Progress"}) == 1
+    assert repository.goal_status_history(OWNER, goal_id=goals[1]) == []
+
+
+def test_each_change_is_recorded_in_the_history(goals):
+    repository.update_goal_statuses(OWNER, {goals[0]: "On Hold", goals[2]: "Completed"})
+    repository.update_goal_statuses(OWNER, {goals[0]: "Completed"})
+
+    history = [(row["goal_id"], row["user_id"], row["old_status"], row["new_status"])
+               for row in repository.goal_status_history(OWNER, limit=3)]
+    assert history == [(goals[0], OWNER, "On Hold", "Completed"),
+                       (goals[2], OWNER, "In Progress", "Completed"),
+                       (goals[0], OWNER, "In Progress", "On Hold")]
+    assert len(repository.goal_status_history(OWNER, goal_id=goals[0])) == 2
+
+
+def test_unknown_status_is_rejected(goals):
+    with pytest.raises(ValueError):
+        repository.update_goal_statuses(OWNER, {goals[0]: "Done"})
+    assert statuses(goals[:1]) == ["In Progress"]
+
+
+def test_goal_stats_match_a_rebuild_after_bulk_updates(goals):
+    repository.update_goal_statuses(OWNER, dict.fromkeys(goals, "Completed"))
+    repository.update_goal_statuses(OTHER, dict.fromkeys(goals, "Cancelled"))
+    repository.update_goal_statuses(OWNER, {goals[1]: "On Hold", goals[2]: "Completed"})
+
+    with repository.connection() as conn:
+        live = goal_stats(conn)
+        conn.execute("SAVEPOINT rebuild")
+        repository.rebuild_cohort_stats(conn)
+        rebuilt = goal_stats(conn)
+        conn.execute("ROLLBACK TO rebuild")
+    assert live == rebuilt
+    assert statuses(goals) == ["Completed", "On Hold", "Completed", "Cancelled"]
@@ -0,0 +1,84 @@
+# AI-Powered Career and Skills Advisor - Login Screen Imports
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded only by the pages that need them (see the note at the top of main_app.py)
+HEAVY_MODULES = ("numpy", "pandas", "plotly", "sklearn", "scipy", "pyarrow", "joblib")
+PAGE_MODULES = ("career_engine", "career_model", "charts", "learning_paths", "score_store", "scoring", "what_if")
+
+# benchmarks/import_time.py --budget-ms default, for what the app adds to
+# importing streamlit; the test allows MARGIN times that for noisy machines
+IMPORT_BUDGET_MS = 60
+MARGIN = 3
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$")
+
+# Prints every module loaded after running the script given as argv[1]
+# ("-" for streamlit alone) the way `streamlit run` would
+LOADED_MODULES = """
+import json, runpy, sys
+import streamlit
+if sys.argv[1] != "-":
+    runpy.run_path(sys.argv[1], run_name="__main__")
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules(script, env):
+    result = subprocess.run([sys.executable, "-c", LOADED_MODULES, script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+@pytest.fixture(scope="module")
+def login_modules(tmp_path_factory):
+    """(modules after rendering the login screen, modules streamlit loads on its own)."""
+    env = dict(os.environ, CAREER_ADVISOR_DB=str(tmp_path_factory.mktemp("imports") / "app.db"))
+    # The first start creates and migrates the database; measure the next one
+    loaded_modules("main_app.py", env)
+    return loaded_modules("main_app.py", env), loaded_modules("-", env)
+
+
+def test_login_screen_skips_page_dependencies(login_modules):
+    app, _ = login_modules
+    assert "numpy" not in app
+    assert "sklearn" not in app
+    assert sorted(module for module in app if module in PAGE_MODULES) == []
+
+
+def test_login_screen_adds_no_heavy_modules(login_modules):
+    # streamlit may pull in parts of plotly itself; the app must not add any
+    app, streamlit_only = login_modules
+    added = app - streamlit_only
+    assert sorted(module for module in added if module.split(".")[0] in HEAVY_MODULES) == []
+
+
+def import_times(statement, env, runs=3):
+    """{module: best self time in us} under python -X importtime -c statement."""
+    best = {}
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+        for line in result.stderr.splitlines():
+            match = IMPORT_TIME_LINE.match(line)
+            if match:
+                module, self_us = match.group(2), int(match.group(1))
+                best[module] = min(self_us, best.get(module, self_us))
+    return best
+
+
+def test_main_app_import_stays_within_budget(tmp_path):
+    env = dict(os.environ, CAREER_ADVISOR_DB=str(tmp_path / "app.db"))
+    app = import_times("import main_app", env)
+    streamlit_only = import_times("import streamlit", env)
+    added = {module: self_us for module, self_us in app.items() if module not in streamlit_only}
+    assert "main_app" in added
+    added_ms = sum(added.values()) / 1000
+    assert added_ms < IMPORT_BUDGET_MS * MARGIN, sorted(added.items(), key=lambda item: -item[1])[:10]
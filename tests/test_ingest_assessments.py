@@ -0,0 +1,55 @@
+# AI-Powered Career and Skills Advisor - Bulk Assessment Ingestion
+
+import csv
+
+import pytest
+
+import repository
+from career_engine import get_advisor
+from ingest_assessments import AssessmentLayout, ingest
+
+
+@pytest.fixture(scope="module")
+def layout():
+    return AssessmentLayout(get_advisor())
+
+
+def row(layout, user_id, created_at):
+    return {"user_id": user_id, "created_at": created_at, **dict.fromkeys(layout.columns, 3)}
+
+
+@pytest.mark.parametrize("created_at, expected", [
+    ("2024-01-05 09:30:00", "2024-01-05 09:30:00"),
+    ("2024-01-05T09:30:00.250000", "2024-01-05 09:30:00.250000"),
+    ("2024-01-05", "2024-01-05 00:00:00"),
+    ("", None),
+])
+def test_parse_normalizes_created_at(layout, created_at, expected):
+    assert layout.parse(row(layout, 1, created_at))[1] == expected
+
+
+@pytest.mark.parametrize("created_at", ["01/05/2024", "2024-13-01", "yesterday"])
+def test_parse_rejects_non_iso_created_at(layout, created_at):
+    assert layout.parse(row(layout, 1, created_at)) is None
+
+
+def test_ingest_counts_bad_dates_as_rejected(layout, tmp_path):
+    path = tmp_path / "cohort.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, ["user_id", "created_at", *layout.columns])
+        writer.writeheader()
+        writer.writerow(row(layout, 901, "2024-01-05T10:00:00"))
+        writer.writerow(row(layout, 901, "01/05/2024"))
+        writer.writerow(row(layout, 901, "2024-02-07 08:00:00"))
+
+    stored, rejected, _ = ingest([str(path)])
+    assert (stored, rejected) == (2, 1)
+    skill = layout.skills[0]
+    assert [tuple(r) for r in repository.skill_history(901, skill)] == [("2024-01-05 10:00:00", 3.0),
+                                                                         ("2024-02-07 08:00:00", 3.0)]
+    assert [tuple(r) for r in repository.skill_trend(901, skill)] == [("2024-01-01", 1, 3.0), ("2024-02-01", 1, 3.0)]
+
+
+def test_save_assessments_rejects_non_iso_created_at():
+    with pytest.raises(ValueError):
+        repository.save_assessments([(902, {}, {}, {}, {}, None, "01/05/2024")])
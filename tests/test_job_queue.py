@@ -0,0 +1,53 @@
+# AI-Powered Career and Skills Advisor - Job Queue Retention
+
+import time
+
+import pytest
+
+import job_queue
+import repository
+
+
+@pytest.fixture(autouse=True)
+def no_workers(monkeypatch):
+    """Jobs stay where the test puts them."""
+    monkeypatch.setattr(job_queue, "get_workers", lambda: job_queue.WorkerPool(workers=0))
+
+
+def finish(job_id, status, seconds_ago):
+    with repository.connection() as conn:
+        conn.execute("UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?",
+                     (status, time.time() - seconds_ago, job_id))
+
+
+def submit(key):
+    return job_queue.submit("save_assessment", {"user_id": 1}, dedupe_key=key)
+
+
+def test_dedupe_returns_pending_and_recently_done_jobs():
+    job_id = submit("pending")
+    assert submit("pending") == job_id
+    finish(job_id, "done", seconds_ago=60)
+    assert submit("pending") == job_id
+
+
+def test_dedupe_ignores_expired_and_failed_jobs():
+    done_id = submit("expired")
+    finish(done_id, "done", seconds_ago=job_queue.DEDUPE_DONE_SECONDS + 60)
+    failed_id = submit("expired")
+    assert failed_id != done_id
+    finish(failed_id, "failed", seconds_ago=0)
+    assert submit("expired") not in (done_id, failed_id)
+
+
+def test_prune_finished_keeps_pending_and_recent_jobs():
+    old_done, old_failed, recent, queued = (submit(f"prune-{i}") for i in range(4))
+    week = 7 * 24 * 3600
+    finish(old_done, "done", seconds_ago=2 * week)
+    finish(old_failed, "failed", seconds_ago=2 * week)
+    finish(recent, "done", seconds_ago=60)
+    assert job_queue.prune_finished(older_than=week) == 2
+    assert job_queue.get_job(old_done) is None
+    assert job_queue.get_job(old_failed) is None
+    assert job_queue.get_job(recent)["status"] == "done"
+    assert job_queue.get_job(queued)["status"] == "queued"
@@ -0,0 +1,99 @@
+# AI-Powered Career and Skills Advisor - Password Hashing
+
+import hashlib
+import threading
+from functools import partial
+
+import pytest
+
+import passwords
+import repository
+
+
+@pytest.fixture(autouse=True)
+def cheap_hashers(monkeypatch):
+    """Same algorithms at test-sized costs."""
+    monkeypatch.setitem(passwords.HASHERS, "scrypt", partial(passwords.ScryptHasher, n=2 ** 10))
+    monkeypatch.setitem(passwords.HASHERS, "pbkdf2_sha256", partial(passwords.Pbkdf2Hasher, iterations=1000))
+    monkeypatch.setattr(passwords, "PASSWORD_HASHER", "scrypt")
+    monkeypatch.setattr(passwords, "_dummy_hash", None)
+
+
+def stored_hash(username):
+    with repository.connection() as conn:
+        return conn.execute("SELECT password FROM users WHERE username = ?", (username,)).fetchone()[0]
+
+
+@pytest.mark.parametrize("algorithm, fields", [("scrypt", 6), ("pbkdf2_sha256", 4)])
+def test_round_trip(algorithm, fields):
+    hasher = passwords.HASHERS[algorithm]()
+    encoded = hasher.hash("correct horse")
+    assert encoded.startswith(algorithm + "$") and len(encoded.split("$")) == fields
+    assert encoded != hasher.hash("correct horse")
+    assert passwords.identify(encoded).verify("correct horse", encoded)
+    assert not passwords.identify(encoded).verify("wrong horse", encoded)
+    assert not hasher.needs_rehash(encoded)
+
+
+def test_needs_rehash_when_cost_changes():
+    assert passwords.ScryptHasher(n=2 ** 11).needs_rehash(passwords.ScryptHasher(n=2 ** 10).hash("pw"))
+    assert passwords.Pbkdf2Hasher(iterations=2000).needs_rehash(passwords.Pbkdf2Hasher(iterations=1000).hash("pw"))
+    assert passwords.LEGACY.needs_rehash(passwords.LEGACY.hash("pw"))
+
+
+def test_check_password_upgrades_other_algorithms():
+    ok, new_hash = passwords.check_password("pw", passwords.HASHERS["pbkdf2_sha256"]().hash("pw"))
+    assert ok and new_hash.startswith("scrypt$")
+    assert passwords.check_password("pw", passwords.hash_password("pw")) == (True, None)
+    assert passwords.check_password("nope", passwords.hash_password("pw")) == (False, None)
+
+
+def test_legacy_hash_is_replaced_on_login():
+    legacy = hashlib.sha256(b"old secret").hexdigest()
+    with repository.connection() as conn:
+        user_id = conn.execute("INSERT INTO users (username, password, email, created_at) VALUES (?, ?, ?, ?)",
+                               ("legacy-user", legacy, "l@x", repository.now())).lastrowid
+
+    assert repository.verify_user("legacy-user", "wrong") is None
+    assert stored_hash("legacy-user") == legacy
+
+    assert repository.verify_user("legacy-user", "old secret") == (user_id, "legacy-user")
+    upgraded = stored_hash("legacy-user")
+    assert upgraded.startswith("scrypt$")
+    assert passwords.check_password("old secret", upgraded) == (True, None)
+    assert repository.verify_user("legacy-user", "old secret") == (user_id, "legacy-user")
+    assert stored_hash("legacy-user") == upgraded
+
+
+def test_unknown_user_checks_a_dummy_hash(monkeypatch):
+    checked = []
+    check = passwords._check
+
+    def spy(password, encoded):
+        checked.append(encoded)
+        return check(password, encoded)
+
+    monkeypatch.setattr(passwords, "_check", spy)
+
+    assert repository.verify_user("no-such-user", "pw") is None
+    assert repository.verify_user("no-such-user", "pw") is None
+    # The same kind of hash a real user has, built once and checked every time
+    assert len(checked) == 2 and checked[0] == checked[1] == passwords._dummy_hash
+    assert passwords.identify(checked[0]).algorithm == "scrypt"
+
+
+def test_full_queue_raises_hasher_busy(monkeypatch):
+    monkeypatch.setattr(passwords, "_slots", threading.BoundedSemaphore(1))
+    started, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=passwords._submit, args=(lambda: started.set() or release.wait(5),))
+    holder.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(passwords.HasherBusy):
+            passwords.hash_password("pw")
+        with pytest.raises(passwords.HasherBusy):
+            passwords.check_password("pw", None)
+    finally:
+        release.set()
+        holder.join(5)
+    assert passwords.hash_password("pw").startswith("scrypt$")
@@ -0,0 +1,90 @@
+# AI-Powered Career and Skills Advisor - Recommendations Page
+
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import catalog_store
+import job_queue
+from career_engine import get_advisor
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main_app.py")
+PAGE = "🏆 Recommendations"
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    """Recommend jobs run inline when the page waits for them; calls lists their ids."""
+    calls = []
+
+    def wait_for(job_id, timeout):
+        calls.append(job_id)
+        while job_queue.run_one():
+            pass
+        return job_queue.get_job(job_id)
+
+    monkeypatch.setattr(job_queue, "get_workers", lambda: job_queue.WorkerPool(workers=0))
+    monkeypatch.setattr(job_queue, "wait_for", wait_for)
+    return calls
+
+
+def reload_catalog(monkeypatch):
+    """Publish a snapshot of the same files under the next catalog version."""
+    catalog = catalog_store.load_catalog()
+    catalog.version = catalog_store.get_catalog().version + 1
+    monkeypatch.setattr(catalog_store, "_current", catalog.compile_all())
+
+
+def app(advisor, skill_level):
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state["logged_in"] = True
+    at.session_state["user_id"] = 1
+    at.session_state["username"] = "tester"
+    at.session_state["user_data"] = {
+        "technical_skills": {skill: skill_level for skill in advisor.technical_skills},
+        "personality_traits": {trait: 3.0 for trait in advisor.personality_traits},
+        "career_interests": {interest: 3.0 for interest in advisor.career_interests},
+    }
+    return at
+
+
+def test_catalog_reload_while_job_runs_rescores(monkeypatch, jobs):
+    advisor = get_advisor()
+    original_wait_for = job_queue.wait_for
+
+    def wait_then_reload(job_id, timeout):
+        job = original_wait_for(job_id, timeout)
+        if len(jobs) == 1:
+            reload_catalog(monkeypatch)
+        return job
+
+    monkeypatch.setattr(job_queue, "wait_for", wait_then_reload)
+    at = app(advisor, 6).run()
+    at.sidebar.selectbox[0].select(PAGE).run()
+
+    assert not at.exception, at.exception
+    assert not at.error
+    assert len(jobs) == 2 and jobs[0] != jobs[1]
+    stored = job_queue.get_job(jobs[1])["result"]["recommendations"]
+    assert stored["catalog_version"] == advisor.catalog_version + 1
+    assert at.session_state["user_data"]["recommendations"] == stored
+    assert at.expander
+
+
+def test_stale_result_twice_shows_error(monkeypatch, jobs):
+    advisor = get_advisor()
+    original_wait_for = job_queue.wait_for
+
+    def wait_then_reload(job_id, timeout):
+        job = original_wait_for(job_id, timeout)
+        reload_catalog(monkeypatch)
+        return job
+
+    monkeypatch.setattr(job_queue, "wait_for", wait_then_reload)
+    at = app(advisor, 5).run()
+    at.sidebar.selectbox[0].select(PAGE).run()
+
+    assert not at.exception, at.exception
+    assert len(jobs) == 2
+    assert [e.value for e in at.error] == ["Sorry, we could not compute your recommendations. Please try again."]
@@ -0,0 +1,82 @@
+# AI-Powered Career and Skills Advisor - Assessment Scoring
+
+import numpy as np
+import pytest
+
+import scoring
+from career_engine import get_advisor
+
+# The reverse-keyed phrases the personality page hard-coded before the
+# question banks moved to data/questions.json
+LEGACY_REVERSE_PHRASES = ("prefer routine", "prefer working alone", "get stressed easily", "worry about")
+
+
+@pytest.fixture
+def bench(request):
+    """pytest-benchmark's fixture, or a skip when the plugin is not installed or is disabled."""
+    if not request.config.pluginmanager.hasplugin("benchmark"):
+        pytest.skip("pytest-benchmark is not installed")
+    return request.getfixturevalue("benchmark")
+
+
+def legacy_score(questions, answers, reverse=True):
+    """The page loop the banks replaced: substring rule, 6 - score, mean per group."""
+    scores, answers = {}, iter(answers)
+    for group, items in questions.items():
+        group_scores = []
+        for question in items:
+            score = next(answers)
+            if reverse and any(phrase in question for phrase in LEGACY_REVERSE_PHRASES):
+                score = 6 - score
+            group_scores.append(score)
+        scores[group] = np.mean(group_scores)
+    return scores
+
+
+def random_answers(bank, n, seed):
+    return np.random.default_rng(seed).integers(1, 6, size=(n, len(bank)))
+
+
+def test_reverse_mask_matches_the_legacy_phrases():
+    bank = scoring.personality_bank()
+    assert bank.reverse_mask.tolist() == [any(phrase in q for phrase in LEGACY_REVERSE_PHRASES)
+                                          for q in bank.questions]
+    assert bank.reverse_mask.any()
+    assert not scoring.interest_bank().reverse_mask.any()
+
+
+@pytest.mark.parametrize("bank, questions, reverse", [
+    (scoring.personality_bank, lambda advisor: advisor.catalog.personality_questions, True),
+    (scoring.interest_bank, lambda advisor: advisor.catalog.riasec_questions, False),
+])
+def test_scores_match_the_legacy_loop(bank, questions, reverse):
+    bank, questions = bank(), questions(get_advisor())
+    answers = random_answers(bank, 500, seed=8)
+    scores = bank.score(answers)
+    for row, scored in zip(answers, scores):
+        expected = legacy_score(questions, row.tolist(), reverse)
+        assert list(expected) == bank.groups
+        np.testing.assert_allclose(scored, list(expected.values()), rtol=0, atol=1e-12)
+    assert bank.profile(answers[0]) == pytest.approx(legacy_score(questions, answers[0].tolist(), reverse))
+
+
+def test_ragged_groups_and_custom_scale():
+    questions = {"A": ["x worry about y", "plain"], "B": ["plain"], "C": ["one", "two", "three"]}
+    bank = scoring.QuestionBank(questions, scale=(1, 7), reverse_scored=lambda q: "worry about" in q)
+    answers = np.array([[2, 5, 7, 1, 2, 6]])
+    np.testing.assert_allclose(bank.score(answers), [[(6 + 5) / 2, 7, 3]])
+    assert bank.valid(answers).tolist() == [True]
+    assert bank.valid([[0, 5, 7, 1, 2, 6]]).tolist() == [False]
+
+
+def test_benchmark_personality_batch(bench):
+    bank = scoring.personality_bank()
+    answers = random_answers(bank, 10_000, seed=9)
+    scores = bench(bank.score, answers)
+    assert scores.shape == (10_000, len(bank.groups))
+
+
+def test_benchmark_personality_profile(bench):
+    bank = scoring.personality_bank()
+    answers = random_answers(bank, 1, seed=10)[0]
+    assert bench(bank.profile, answers).keys() == set(bank.groups)
@@ -0,0 +1,55 @@
+# AI-Powered Career and Skills Advisor - Skill Trends
+
+import random
+from datetime import datetime, timedelta
+
+import repository
+from career_engine import get_advisor
+
+ROLLUPS = {
+    "skill_score_rollups": "user_id, skill, period, period_start",
+    "cohort_skill_rollups": "skill, period, period_start",
+}
+
+
+def rollups(conn):
+    return {table: [(*row[:-1], round(row[-1], 6)) for row in conn.execute(
+                f"""SELECT {key}, samples, score_sum FROM {table} WHERE samples > 0 ORDER BY {key}""")]
+            for table, key in ROLLUPS.items()}
+
+
+def records(rng, users, count):
+    # Around month and week boundaries (2024-03-31 is a Sunday), several per period
+    skills = get_advisor().technical_skills
+    base = datetime(2024, 3, 28)
+    for _ in range(count):
+        assessed_at = base + timedelta(hours=rng.randrange(10 * 24))
+        yield (rng.choice(users), {skill: rng.randint(1, 7) for skill in rng.sample(skills, 5)}, {}, {}, {},
+               None, assessed_at.isoformat(" "))
+
+
+def test_rollups_match_a_rebuild_after_saves_and_deletes():
+    rng = random.Random(25)
+    users = list(range(950, 960))
+    data = list(records(rng, users, 300))
+    for i in range(0, len(data), 40):
+        repository.save_assessments(data[i:i + 40])
+    with repository.connection() as conn:
+        deleted = [row[0] for row in conn.execute("SELECT id FROM assessments WHERE user_id = ? LIMIT 3", (users[0],))]
+    assert repository.delete_assessments(deleted) == 3
+
+    with repository.connection() as conn:
+        live = rollups(conn)
+        conn.execute("SAVEPOINT rebuild")
+        repository.rebuild_skill_rollups(conn)
+        rebuilt = rollups(conn)
+        conn.execute("ROLLBACK TO rebuild")
+    assert live == rebuilt
+    assert any(row[2] == "week" and row[3] == "2024-03-25" for row in live["skill_score_rollups"])
+
+
+def test_skill_scores_have_no_insert_trigger():
+    # save_assessments adds to the rollups itself; a trigger would count twice
+    with repository.connection() as conn:
+        assert conn.execute("""SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'skill_scores'
+                               AND sql LIKE '%AFTER INSERT%'""").fetchall() == []
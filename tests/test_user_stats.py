@@ -0,0 +1,63 @@
+# AI-Powered Career and Skills Advisor - Dashboard Counters
+
+import random
+
+import repository
+
+USERS = list(range(970, 980))
+COUNTS = ("goals", "active_goals", "completed_goals", "on_hold_goals", "assessments")
+
+
+def counters(conn):
+    """user_stats by user, counts and last_assessment_at; rows left at all zeros are dropped."""
+    rows = conn.execute(f"SELECT user_id, {', '.join(COUNTS)}, last_assessment_at FROM user_stats").fetchall()
+    return {row[0]: tuple(row[1:]) for row in rows if any(row[1:-1])}
+
+
+def random_changes(rng, steps):
+    for _ in range(steps):
+        action = rng.choice(["add_goal", "add_goal", "update", "move", "delete_goal", "assess", "delete_assessment"])
+        user_id = rng.choice(USERS)
+        with repository.connection() as conn:
+            goals = [row[0] for row in conn.execute("SELECT id FROM progress WHERE user_id BETWEEN ? AND ?",
+                                                    (USERS[0], USERS[-1]))]
+            assessments = [row[0] for row in conn.execute("SELECT id FROM assessments WHERE user_id BETWEEN ? AND ?",
+                                                          (USERS[0], USERS[-1]))]
+        if action == "add_goal":
+            repository.add_goal(rng.choice(USERS + [None]), "Skill", "random goal", "2025-01-01",
+                                rng.choice(repository.GOAL_STATUSES))
+        elif action == "update" and goals:
+            with repository.connection() as conn:
+                owners = dict(conn.execute("SELECT id, user_id FROM progress WHERE user_id = ?", (user_id,)))
+            repository.update_goal_statuses(user_id, {goal_id: rng.choice(repository.GOAL_STATUSES)
+                                                      for goal_id in rng.sample(sorted(owners), min(3, len(owners)))})
+        elif action == "move" and goals:
+            with repository.connection() as conn:
+                conn.execute("UPDATE progress SET user_id = ? WHERE id = ?",
+                             (rng.choice(USERS + [None]), rng.choice(goals)))
+        elif action == "delete_goal" and goals:
+            with repository.connection() as conn:
+                conn.execute("DELETE FROM progress WHERE id = ?", (rng.choice(goals),))
+        elif action == "assess":
+            created_at = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00"
+            repository.save_assessments([(user_id, {}, {}, {}, {}, None, created_at)])
+        elif action == "delete_assessment" and assessments:
+            repository.delete_assessments([rng.choice(assessments)])
+
+
+def test_user_stats_match_a_rebuild_after_random_changes():
+    random_changes(random.Random(24), 400)
+
+    with repository.connection() as conn:
+        live = counters(conn)
+        conn.execute("SAVEPOINT rebuild")
+        repository.rebuild_user_stats(conn)
+        rebuilt = counters(conn)
+        conn.execute("ROLLBACK TO rebuild")
+
+    assert {user: row[:-1] for user, row in live.items()} == {user: row[:-1] for user, row in rebuilt.items()}
+    # Deleting an assessment leaves last_assessment_at as it was, so it can
+    # only be later than the rebuilt one
+    for user, row in rebuilt.items():
+        assert row[-1] is None or live[user][-1] >= row[-1]
+    assert any(user in live for user in USERS)
@@ -0,0 +1,76 @@
+# AI-Powered Career and Skills Advisor - What-if Simulator
+
+import numpy as np
+import pytest
+
+from career_engine import CareerAdvisor, get_advisor
+from what_if import CANDIDATE_MIN_CAREERS, WhatIf, multi_skill_grid, single_skill_grid
+
+
+def synthetic_advisor(advisor, n_careers, rng):
+    """A catalog big enough for WhatIf.rank to group scenarios by changed skills."""
+    traits = advisor.personality_traits + advisor.career_interests
+    return CareerAdvisor(career_paths={
+        f"Occupation {i:06d}": {
+            "description": "-", "salary_range": "-", "growth_rate": "-",
+            "key_skills": list(rng.choice(advisor.technical_skills, size=rng.integers(2, 7), replace=False)),
+            "personality_fit": list(rng.choice(traits, size=rng.integers(1, 4), replace=False)),
+        }
+        for i in range(n_careers)
+    })
+
+
+@pytest.fixture(scope="module")
+def user():
+    advisor = get_advisor()
+    rng = np.random.default_rng(17)
+    skills = advisor.technical_skills
+    return ({skill: int(v) for skill, v in zip(skills, rng.integers(1, 8, len(skills)))},
+            {trait: float(v) for trait, v in zip(advisor.personality_traits, rng.integers(4, 21, 5) / 4)},
+            {interest: float(v) for interest, v in zip(advisor.career_interests, rng.integers(3, 16, 6) / 3)})
+
+
+def rescored(advisor, user, scenarios, k):
+    technical, personality, interests = user
+    catalog = advisor.compile_catalog()
+    rows = [dict(technical, **scenario) for scenario in scenarios]
+    return catalog.top_k(*catalog.encode_users(rows, [personality] * len(rows), [interests] * len(rows)), k)
+
+
+@pytest.mark.parametrize("n_careers", [None, 2 * CANDIDATE_MIN_CAREERS])
+def test_rank_matches_rescoring(user, n_careers):
+    advisor = get_advisor()
+    scenarios = single_skill_grid(user[0]) + multi_skill_grid(user[0], advisor.technical_skills)
+    if n_careers is not None:
+        advisor = synthetic_advisor(advisor, n_careers, np.random.default_rng(5))
+        scenarios = scenarios[:1000]
+    fast = WhatIf(*user, advisor).rank(scenarios, k=5)
+    full = rescored(advisor, user, scenarios, k=5)
+    np.testing.assert_array_equal(fast["indices"], full["indices"])
+    np.testing.assert_allclose(fast["score"], full["score"], rtol=0, atol=1e-12)
+
+
+def test_rank_moves_agrees_with_rankings(user):
+    simulator = WhatIf(*user)
+    scenarios = single_skill_grid(user[0])[:50]
+    ranked = simulator.rank(scenarios, k=5)
+    career = simulator.catalog.careers[ranked["indices"][0, 0]]
+    positions, scores = simulator.rank_moves(scenarios, career)
+    for row in range(len(scenarios)):
+        top = [simulator.catalog.careers[j] for j in ranked["indices"][row]]
+        if career in top:
+            assert positions[row] == top.index(career) + 1
+            assert scores[row] == pytest.approx(ranked["score"][row, top.index(career)], abs=1e-12)
+        else:
+            assert positions[row] > 5
+
+
+def test_positions_match_rank_moves(user):
+    simulator = WhatIf(*user)
+    careers = simulator.catalog.careers[::3]
+    scenario = single_skill_grid(user[0])[7]
+    for change in ({}, scenario):
+        positions = simulator.positions(careers, change or None)
+        assert positions.tolist() == [int(simulator.rank_moves([change], career)[0][0]) for career in careers]
+    top = simulator.rankings([{}], k=len(simulator.catalog.careers))[0]
+    assert simulator.positions([rec["career"] for rec in top]).tolist() == list(range(1, len(top) + 1))
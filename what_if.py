@@ -0,0 +1,157 @@
+# AI-Powered Career and Skills Advisor - What-if Simulator
+# Ranks careers for hypothetical changes to a user's technical skills ("what
+# if Machine Learning went from 3 to 6?"). A WhatIf keeps the user's
+# per-career skill sums and personality match; each scenario only adds its
+# skill deltas to those sums (CompiledCatalog.score_deltas), and only for
+# the careers that use a changed skill, so thousands of scenarios are ranked
+# in one call without rescoring the catalog.
+
+from itertools import combinations, product
+
+import numpy as np
+
+from career_engine import get_advisor
+from scoring import TECH_SCALE
+
+TECH_LEVELS = tuple(range(TECH_SCALE[0], TECH_SCALE[1] + 1))
+MAX_SCENARIOS = 20_000
+# Scenario x career scores held in memory at once
+SCORE_CHUNK_CELLS = 2_000_000
+# Below this many careers, scoring all of them beats grouping scenarios
+CANDIDATE_MIN_CAREERS = 1000
+
+
+# Scenario Grids
+def single_skill_grid(technical_scores, skills=None, levels=TECH_LEVELS):
+    """One scenario per (skill, level) that differs from the user's score."""
+    skills = skills or list(technical_scores)
+    return [{skill: level} for skill in skills for level in levels if level != technical_scores.get(skill)]
+
+
+def multi_skill_grid(technical_scores, skills, levels=TECH_LEVELS, changed=2):
+    """Every combination of levels for every `changed` skills out of skills."""
+    scenarios = []
+    for group in combinations(skills, changed):
+        for values in product(levels, repeat=changed):
+            if any(value != technical_scores.get(skill) for skill, value in zip(group, values)):
+                scenarios.append(dict(zip(group, values)))
+    if len(scenarios) > MAX_SCENARIOS:
+        raise ValueError(f"{len(scenarios)} scenarios; at most {MAX_SCENARIOS} per call")
+    return scenarios
+
+
+# Simulation
+class WhatIf:
+    """One user's scores, ready to rank hypothetical skill changes.
+
+    Build it once per page run and call rank() on every slider move. Every
+    ranking uses the same advisor snapshot, even across a catalog reload.
+    """
+
+    def __init__(self, technical_scores, personality_scores, interest_scores, advisor=None):
+        self.advisor = advisor or get_advisor()
+        self.catalog = self.advisor.compile_catalog()
+        tech, traits = self.catalog.encode_users([technical_scores], [personality_scores], [interest_scores])
+        self._tech = tech[0]
+        self._sums = self.catalog.tech_sums(tech)[0]
+        overall, _, personality_match = self.catalog.score(tech, traits)
+        self._overall = overall[0]
+        self._personality_match = personality_match[0]
+        self._candidate_cache = {}
+
+    def deltas(self, scenarios):
+        """scenarios (list of {skill: new score}) -> scenarios x skills score changes."""
+        if len(scenarios) > MAX_SCENARIOS:
+            raise ValueError(f"{len(scenarios)} scenarios; at most {MAX_SCENARIOS} per call")
+        deltas = np.zeros((len(scenarios), len(self.catalog.skills)))
+        for row, scenario in enumerate(scenarios):
+            for skill, value in scenario.items():
+                col = self.catalog.skill_index.get(skill)
+                if col is None:
+                    raise ValueError(f"unknown technical skill {skill!r}")
+                deltas[row, col] = value - self._tech[col]
+        return deltas
+
+    def _scored(self, scenarios):
+        """(overall, tech_match, personality_match) for the scenarios, a chunk of rows at a time."""
+        deltas = self.deltas(scenarios)
+        chunk = max(1, SCORE_CHUNK_CELLS // max(len(self.catalog.careers), 1))
+        for start in range(0, len(deltas), chunk):
+            yield self.catalog.score_deltas(self._sums, self._personality_match, deltas[start:start + chunk])
+
+    def _candidates(self, skills, k):
+        """Careers that can make the top k when only these skill columns change.
+
+        That is every career using one of the skills, plus the best k of the
+        rest, whose scores stay as they are.
+        """
+        key = (tuple(skills), k)
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            touched = self.catalog.tech_weights[:, skills].any(axis=1)
+            untouched = np.where(touched, -np.inf, self._overall)[None, :]
+            best = self.catalog.rank_scores(untouched, untouched, untouched, k)["indices"][0]
+            candidates = np.union1d(np.flatnonzero(touched), best[~touched[best]])
+            self._candidate_cache[key] = candidates
+        return candidates
+
+    def rank(self, scenarios, k=5):
+        """Top k careers under each scenario, as CompiledCatalog.top_k arrays (scenarios x k).
+
+        On large catalogs scenarios are grouped by which skills they change,
+        and each group is scored only over its _candidates().
+        """
+        deltas = self.deltas(scenarios)
+        k = max(0, min(k, len(self.catalog.careers)))
+        ranked = {"indices": np.zeros((len(deltas), k), dtype=int),
+                  "score": np.zeros((len(deltas), k)),
+                  "tech_match": np.zeros((len(deltas), k)),
+                  "personality_match": np.zeros((len(deltas), k))}
+        changed = deltas != 0
+        groups = {}
+        if len(self.catalog.careers) >= CANDIDATE_MIN_CAREERS:
+            for row, mask in enumerate(changed):
+                groups.setdefault(mask.tobytes(), []).append(row)
+        else:
+            groups[None] = list(range(len(deltas)))
+        for key, rows in groups.items():
+            if key is None:
+                candidates = np.arange(len(self.catalog.careers))
+            else:
+                candidates = self._candidates(np.flatnonzero(changed[rows[0]]), k)
+            chunk = max(1, SCORE_CHUNK_CELLS // max(len(candidates), 1))
+            for start in range(0, len(rows), chunk):
+                block = rows[start:start + chunk]
+                scores = self.catalog.score_deltas(self._sums, self._personality_match, deltas[block], candidates)
+                result = self.catalog.rank_scores(*scores, k)
+                result["indices"] = candidates[result["indices"]]
+                for field, values in result.items():
+                    ranked[field][block] = values
+        return ranked
+
+    def rankings(self, scenarios, k=5):
+        """Page-ready recommendation lists, one per scenario."""
+        return self.catalog.to_recommendations(self.rank(scenarios, k))
+
+    def positions(self, careers, scenario=None):
+        """Position (1 = best) of each of careers under one scenario, by default no change.
+
+        One scoring pass for all of them; matches rank_moves for each career.
+        """
+        overall = next(self._scored([scenario or {}]))[0][0]
+        cols = np.array([self.catalog.careers.index(career) for career in careers], dtype=int)
+        target = overall[cols][:, None]
+        earlier = np.arange(len(overall))[None, :] < cols[:, None]
+        return ((overall > target) | ((overall == target) & earlier)).sum(axis=1) + 1
+
+    def rank_moves(self, scenarios, career):
+        """Position (1 = best) of career under each scenario, with its score."""
+        col = self.catalog.careers.index(career)
+        positions, scores = [np.empty(0, dtype=int)], [np.empty(0)]
+        for overall, _, _ in self._scored(scenarios):
+            target = overall[:, col:col + 1]
+            # Careers ahead: higher score, or tied and earlier in the catalog
+            ahead = (overall > target).sum(axis=1) + (overall[:, :col] == target).sum(axis=1)
+            positions.append(ahead + 1)
+            scores.append(overall[:, col])
+        return np.concatenate(positions), np.concatenate(scores)